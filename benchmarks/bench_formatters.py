@@ -0,0 +1,102 @@
+"""Peak-memory benchmark for the markdown formatters and result serialization.
+
+Builds a deterministic python_outline result (2,000 modules by default) and
+compares rendering it through the streaming writer against collecting the
+lines and joining them, then compares the JSON serializers.
+
+Usage:
+    uv run python benchmarks/bench_formatters.py [--modules 2000]
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+from project_explorer_mcp.utils import (
+    OutputBudget,
+    dumps_json,
+    format_python_outline_as_markdown,
+)
+from project_explorer_mcp.utils.formatters import _python_outline_lines
+
+_WORDS = (
+    "alpha beta gamma delta server client request response cache index "
+    "schema operation module package function class heading section"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def generate_outline(modules: int, seed: int = 0) -> dict:
+    """Build a deterministic python_outline result."""
+    rng = random.Random(seed)
+    result = {}
+    for i in range(modules):
+        result[f"/project/pkg{i // 50}/module{i}.py"] = {
+            "docstring": _text(rng, 30),
+            "imports": [
+                {"name": f"pkg.mod{j}", "line": j + 1}
+                for j in range(rng.randint(3, 15))
+            ],
+            "classes": [
+                {
+                    "name": f"Class{j}",
+                    "line": 20 + j * 40,
+                    "docstring": _text(rng, 20),
+                    "methods": [
+                        {"name": f"method{k}", "line": 22 + j * 40 + k * 5}
+                        for k in range(rng.randint(1, 8))
+                    ],
+                }
+                for j in range(rng.randint(0, 4))
+            ],
+            "functions": [
+                {"name": f"func{j}", "line": 200 + j * 10, "docstring": _text(rng, 10)}
+                for j in range(rng.randint(0, 10))
+            ],
+        }
+    return result
+
+
+def joined(data: dict) -> str:
+    """Previous rendering: collect every line, then join."""
+    lines = list(_python_outline_lines(data, OutputBudget()))
+    return "\n".join(lines).strip()
+
+
+def measure(fn, data) -> tuple[float, int, int]:
+    """Return (seconds, peak traced bytes, output length) of fn(data)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn(data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=2000)
+    args = parser.parse_args()
+
+    data = generate_outline(args.modules)
+    for name, fn in (
+        ("list + join", joined),
+        ("streaming", format_python_outline_as_markdown),
+        ("json indent=2", lambda d: json.dumps(d, indent=2)),
+        ("dumps_json", dumps_json),
+    ):
+        elapsed, peak, size = measure(fn, data)
+        print(
+            f"{name:<14} {elapsed:7.3f}s  peak {peak / 1e6:7.1f} MB  "
+            f"output {size / 1e6:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Logging overhead benchmark.
+
+Runs python_outline on a deterministic package (500 modules by default, all
+outlines cached after the first call) with logging disabled, and with the
+server's logging configured in development and production mode, writing to
+/dev/null. The difference is the cost of logging on the tool call path.
+
+Usage:
+    uv run python benchmarks/bench_logging.py [--modules 500] [--calls 50]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fastmcp import FastMCP
+from loguru import logger
+
+from project_explorer_mcp.config import reload_settings, setup_logging
+from project_explorer_mcp.tools import register_python_outline
+
+
+def generate_package(root: Path, modules: int) -> list[str]:
+    """Write small Python modules and return their paths."""
+    paths = []
+    for i in range(modules):
+        path = root / f"module_{i}.py"
+        path.write_text(
+            f'"""Module {i}."""\n\nimport os\n\n\n'
+            f"class C{i}:\n    def run(self):\n        pass\n\n\n"
+            f"def f{i}():\n    return {i}\n"
+        )
+        paths.append(str(path))
+    return paths
+
+
+def per_call(tool, paths: list[str], calls: int) -> float:
+    """Return the mean duration of a python_outline call in milliseconds."""
+    asyncio.run(tool(paths=paths, output_format="json"))
+    start = time.perf_counter()
+    for _ in range(calls):
+        asyncio.run(tool(paths=paths, output_format="json"))
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=500)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    mcp = FastMCP("bench")
+    register_python_outline(mcp)
+    tool = asyncio.run(mcp.get_tool("python_outline")).fn
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = generate_package(Path(tmp), args.modules)
+        stderr = sys.stderr
+        with open(os.devnull, "w") as devnull:
+            sys.stderr = devnull
+            try:
+                logger.remove()
+                results = [("no logging", per_call(tool, paths, args.calls))]
+                for mode, level in (
+                    ("development", "DEBUG"),
+                    ("development", "INFO"),
+                    ("production", "INFO"),
+                ):
+                    os.environ["PROJECT_EXPLORER_MCP__LOGGING_MODE"] = mode
+                    os.environ["PROJECT_EXPLORER_MCP__LOGGING_LEVEL"] = level
+                    reload_settings()
+                    setup_logging()
+                    results.append(
+                        (f"{mode} {level}", per_call(tool, paths, args.calls))
+                    )
+                    logger.complete()
+            finally:
+                sys.stderr = stderr
+                logger.remove()
+
+    for name, ms in results:
+        print(f"{name:<18} {ms:8.2f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
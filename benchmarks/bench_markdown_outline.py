@@ -0,0 +1,61 @@
+"""Throughput benchmark for the Markdown heading scanner.
+
+Generates a deterministic documentation tree (50 MB by default) and compares
+the fence-aware byte scanner against the previous line-by-line regex.
+
+Usage:
+    uv run python benchmarks/bench_markdown_outline.py [--size-mb 50] [--files 500]
+"""
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from generators import generate_docs_tree
+
+from project_explorer_mcp.utils import outline_markdown_file
+
+
+def legacy_outline(path: Path) -> list[dict]:
+    """The line-by-line regex used before the byte scanner."""
+    header_re = re.compile(r"^(#+)\s+(.*)")
+    outline = []
+    with open(path, encoding="utf-8") as f:
+        for i, line in enumerate(f, 1):
+            m = header_re.match(line)
+            if m and m.group(2).strip():
+                outline.append(
+                    {"level": len(m.group(1)), "text": m.group(2).strip(), "line": i}
+                )
+    return outline
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--files", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        total = generate_docs_tree(root, args.size_mb, args.files)
+        paths = sorted(root.rglob("*.md"))
+        mb = total / (1024 * 1024)
+
+        for name, outline in (
+            ("legacy regex", legacy_outline),
+            ("byte scanner", outline_markdown_file),
+        ):
+            start = time.perf_counter()
+            headings = sum(len(outline(p)) for p in paths)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:<14} {elapsed:7.3f}s  {mb / elapsed:8.1f} MB/s  "
+                f"{headings} headings"
+            )
+
+
+if __name__ == "__main__":
+    main()
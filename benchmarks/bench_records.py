@@ -0,0 +1,78 @@
+"""Memory benchmark of outline and operation records against nested dicts.
+
+Outlines a generated Python package and lists the operations of a generated
+OpenAPI spec, keeping every result alive, and compares the memory retained
+by the slotted records with the nested-dict shape they serialize to. The
+"dict + strip_empty" row is the former pipeline, which built the dicts and
+then copied them to drop empty fields.
+
+Usage:
+    uv run python benchmarks/bench_records.py [--modules 5000] [--operations 10000]
+"""
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from generators import generate_openapi_spec, generate_python_package
+
+from project_explorer_mcp.utils import (
+    iter_openapi_operations,
+    outline_python_source,
+    strip_empty,
+)
+
+
+def measure(fn) -> tuple[float, int, int]:
+    """Return (seconds, retained bytes, peak bytes) of keeping fn()'s result."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = fn()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, retained, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=5000)
+    parser.add_argument("--operations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = generate_python_package(Path(tmp), args.modules)
+        sources = [Path(p).read_text() for p in paths]
+    spec = generate_openapi_spec(args.operations)
+
+    cases = {
+        f"python_outline x{args.modules}": {
+            "records": lambda: [outline_python_source(s) for s in sources],
+            "dict": lambda: [outline_python_source(s).to_dict() for s in sources],
+            "dict + strip_empty": lambda: [
+                strip_empty(outline_python_source(s).to_dict()) for s in sources
+            ],
+        },
+        f"openapi operations x{args.operations}": {
+            "records": lambda: list(iter_openapi_operations(spec)),
+            "dict": lambda: [op.to_dict() for op in iter_openapi_operations(spec)],
+        },
+    }
+    for title, variants in cases.items():
+        print(title)
+        for name, fn in variants.items():
+            elapsed, retained, peak = measure(fn)
+            print(
+                f"  {name:<20} {elapsed:7.3f}s  retained {retained / 1e6:7.1f} MB  "
+                f"peak {peak / 1e6:7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
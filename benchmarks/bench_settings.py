@@ -0,0 +1,35 @@
+"""Microbenchmark for settings lookup on the tool call path.
+
+Compares building a fresh ``Settings()`` (which reads the environment and the
+.env file) against the memoized ``get_settings()``.
+
+Usage:
+    uv run python benchmarks/bench_settings.py [--calls 10000]
+"""
+
+import argparse
+import time
+
+from project_explorer_mcp.config.settings import Settings, get_settings
+
+
+def per_call(fn, calls: int) -> float:
+    """Return the mean duration of fn() in microseconds."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=10_000)
+    args = parser.parse_args()
+
+    get_settings()
+    for name, fn in (("Settings()", Settings), ("get_settings()", get_settings)):
+        print(f"{name:<15} {per_call(fn, args.calls):10.3f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Startup benchmark: import time and time to first tool response.
+
+Reports the ``python -X importtime`` cost of the server's own modules and of
+the whole import, then spawns the server over stdio (like an agent harness
+does) and measures the time until the first ``dir_tree`` call returns.
+
+Usage:
+    uv run python benchmarks/bench_startup.py [--runs 5] [--enabled-tools dir_tree]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from fastmcp import Client
+from fastmcp.client.transports import StdioTransport
+
+
+def import_times(env: dict[str, str]) -> dict[str, int]:
+    """Return cumulative import times in microseconds by module name."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import project_explorer_mcp.main"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+async def first_response(env: dict[str, str], root: str) -> float:
+    """Spawn the server and return seconds until the first tool result."""
+    transport = StdioTransport(
+        sys.executable,
+        ["-m", "project_explorer_mcp.main"],
+        env=env,
+        keep_alive=False,
+        log_file=open(os.devnull, "w"),
+    )
+    start = time.perf_counter()
+    async with Client(transport) as client:
+        await client.call_tool("dir_tree", {"root_path": root})
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--enabled-tools", help="Value of PROJECT_EXPLORER_MCP__ENABLED_TOOLS"
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.enabled_tools:
+        env["PROJECT_EXPLORER_MCP__ENABLED_TOOLS"] = args.enabled_tools
+
+    times = import_times(env)
+    total = times.get("project_explorer_mcp", 0)
+    own = times.get("project_explorer_mcp.utils", 0) + times.get(
+        "project_explorer_mcp.tools", 0
+    )
+    print(f"import total      {total / 1000:8.1f} ms")
+    print(f"tools + utils     {own / 1000:8.1f} ms")
+    print(f"yaml imported     {'yes' if 'yaml' in times else 'no'}")
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    runs = [asyncio.run(first_response(env, root)) for _ in range(args.runs)]
+    print(
+        f"first response    {statistics.median(runs) * 1000:8.1f} ms "
+        f"(median of {args.runs})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Scaling benchmark of the tools on synthetic large projects.
+
+Generates deterministic inputs once (a 100k-entry directory tree, a
+5,000-module Python package, a Markdown corpus and a 10,000-operation
+OpenAPI spec in JSON and YAML), then runs every scenario in a fresh
+subprocess so each gets its own caches and peak RSS. For each scenario the
+first (cold) call time, a second (warm) call time, the peak RSS of the
+process and the size of the serialized output are reported.
+
+Results can be saved as a baseline and later runs compared against it;
+scenarios slower or larger than the baseline by more than the threshold are
+flagged and make the script exit with status 1. Baselines are only
+comparable on the same machine and at the same --scale.
+
+Usage:
+    uv run python benchmarks/bench_suite.py [--scale 1.0] [--only dir_tree_json,...]
+        [--save benchmarks/baseline.json] [--compare benchmarks/baseline.json]
+        [--threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from generators import (
+    generate_dir_tree,
+    generate_docs_tree,
+    generate_python_package,
+    write_openapi_specs,
+)
+
+# Full-scale input sizes; --scale multiplies them.
+DIR_TREE_ENTRIES = 100_000
+PYTHON_FILES = 5_000
+MARKDOWN_MB = 50
+MARKDOWN_FILES = 1_000
+OPENAPI_OPERATIONS = 10_000
+
+# Scenario name -> (tool, arguments); "{data}" is replaced by the input root.
+SCENARIOS: dict[str, tuple[str, dict]] = {
+    "dir_tree_markdown": (
+        "dir_tree",
+        {"root_path": "{data}/tree", "max_depth": 20, "output_format": "markdown"},
+    ),
+    "dir_tree_json": (
+        "dir_tree",
+        {"root_path": "{data}/tree", "max_depth": 20, "output_format": "json"},
+    ),
+    "dir_tree_compact": (
+        "dir_tree",
+        {"root_path": "{data}/tree", "max_depth": 20, "output_format": "compact"},
+    ),
+    "python_outline_json": (
+        "python_outline",
+        {"paths": "{python_files}", "output_format": "json"},
+    ),
+    "python_outline_markdown": (
+        "python_outline",
+        {"paths": "{python_files}", "output_format": "markdown"},
+    ),
+    "markdown_outline_json": (
+        "markdown_outline",
+        {"root": "{data}/docs", "output_format": "json"},
+    ),
+    "markdown_outline_markdown": (
+        "markdown_outline",
+        {"root": "{data}/docs", "output_format": "markdown"},
+    ),
+    "openapi_list_json": (
+        "openapi_list_operations",
+        {"spec_path": "{data}/openapi.json", "output_format": "json"},
+    ),
+    "openapi_list_yaml": (
+        "openapi_list_operations",
+        {"spec_path": "{data}/openapi.yaml", "output_format": "json"},
+    ),
+    "openapi_details_json": (
+        "openapi_get_operation_details",
+        {
+            "spec_path": "{data}/openapi.json",
+            "selectors": ["getResource0", "POST /resource1/{id}", "/resource2/{id}"],
+            "format_output": "json",
+        },
+    ),
+    "openapi_details_yaml": (
+        "openapi_get_operation_details",
+        {
+            "spec_path": "{data}/openapi.yaml",
+            "selectors": ["getResource0", "POST /resource1/{id}", "/resource2/{id}"],
+            "format_output": "json",
+        },
+    ),
+}
+
+# Compared metrics and their units.
+METRICS = {"cold_s": "s", "warm_s": "s", "peak_rss_mb": "MB", "output_bytes": "B"}
+
+
+def generate(data: Path, scale: float) -> None:
+    """Write all benchmark inputs below data."""
+    start = time.perf_counter()
+    (data / "tree").mkdir()
+    generate_dir_tree(data / "tree", int(DIR_TREE_ENTRIES * scale))
+    files = generate_python_package(data / "python", int(PYTHON_FILES * scale))
+    (data / "python_files.json").write_text(json.dumps(files))
+    (data / "docs").mkdir()
+    generate_docs_tree(
+        data / "docs",
+        max(int(MARKDOWN_MB * scale), 1),
+        max(int(MARKDOWN_FILES * scale), 1),
+    )
+    write_openapi_specs(data, int(OPENAPI_OPERATIONS * scale))
+    print(f"generated inputs in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+def _arguments(template: dict, data: str) -> dict:
+    """Fill the placeholders of a scenario's arguments."""
+    args = {}
+    for key, value in template.items():
+        if value == "{python_files}":
+            value = json.loads(Path(data, "python_files.json").read_text())
+        elif isinstance(value, str):
+            value = value.replace("{data}", data)
+        args[key] = value
+    return args
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_scenario(name: str, data: str) -> dict:
+    """Run one scenario in this process and return its measurements."""
+    os.environ.setdefault("PROJECT_EXPLORER_MCP__LOGGING_LEVEL", "WARNING")
+    from fastmcp import FastMCP
+
+    from project_explorer_mcp.config import setup_logging
+    from project_explorer_mcp.tools import get_register_function
+    from project_explorer_mcp.utils import dumps_json
+
+    setup_logging()
+    tool_name, template = SCENARIOS[name]
+    mcp = FastMCP("bench")
+    get_register_function(tool_name)(mcp)
+    tool = asyncio.run(mcp.get_tool(tool_name)).fn
+    args = _arguments(template, data)
+
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        result = asyncio.run(tool(**args))
+        # Include serialization, as the server sends the result.
+        output = result if isinstance(result, str) else dumps_json(result)
+        timings.append(time.perf_counter() - start)
+    return {
+        "cold_s": round(timings[0], 4),
+        "warm_s": round(timings[1], 4),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "output_bytes": len(output.encode("utf-8")),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return descriptions of metrics that regressed beyond threshold."""
+    regressions = []
+    for name, metrics in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), metrics[metric]
+            # Ignore timings below 50 ms, which are mostly noise.
+            if not old or (METRICS[metric] == "s" and max(old, new) < 0.05):
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(f"{name} {metric}: {old} -> {new}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--only", help="Comma-separated scenario names")
+    parser.add_argument("--save", help="Write results to this baseline file")
+    parser.add_argument("--compare", help="Compare results with this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--data", help=argparse.SUPPRESS)
+    parser.add_argument("--generate", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--run-scenario", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(Path(args.data), args.scale)
+        return
+    if args.run_scenario:
+        print(json.dumps(run_scenario(args.run_scenario, args.data)))
+        return
+
+    names = args.only.split(",") if args.only else list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Inputs are generated in a subprocess: on Linux the peak RSS of a
+        # process carries over to the children it executes.
+        subprocess.run(
+            [sys.executable, __file__, "--generate", "--data", tmp]
+            + ["--scale", str(args.scale)],
+            check=True,
+        )
+        print(
+            f"{'scenario':<26} {'cold s':>8} {'warm s':>8} {'peak MB':>8} "
+            f"{'output B':>11}"
+        )
+        for name in names:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--run-scenario", name, "--data", tmp],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            m = results[name] = json.loads(proc.stdout)
+            print(
+                f"{name:<26} {m['cold_s']:8.3f} {m['warm_s']:8.3f} "
+                f"{m['peak_rss_mb']:8.1f} {m['output_bytes']:11d}"
+            )
+
+    report = {
+        "scale": args.scale,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get("scale") != args.scale:
+            print(f"warning: baseline scale is {baseline.get('scale')}")
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"regression: {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""Deterministic generators of synthetic projects for the benchmarks.
+
+Every generator takes a seed, so the same arguments always produce the same
+files and the results of different runs can be compared.
+"""
+
+import json
+import random
+from pathlib import Path
+
+_WORDS = (
+    "alpha beta gamma delta server client request response cache index "
+    "schema operation module package function class heading section"
+).split()
+
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _paragraph(rng: random.Random) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(20, 80))]
+    # Wrap at roughly 80 columns like hand-written documentation.
+    return "".join(" ".join(words[i : i + 12]) + "\n" for i in range(0, len(words), 12))
+
+
+def generate_dir_tree(
+    root: Path, entries: int = 100_000, fanout: int = 8, files_per_dir: int = 12
+) -> int:
+    """Write a tree of empty files and directories, breadth first.
+
+    Args:
+        root: Existing directory receiving the tree.
+        entries: Number of files and directories to create.
+        fanout: Subdirectories per directory.
+        files_per_dir: Files per directory.
+
+    Returns:
+        Depth of the deepest directory below root.
+    """
+    created = 0
+    depth = 0
+    queue = [(root, 0)]
+    suffixes = (".py", ".md", ".txt", ".json", ".yaml", ".cfg")
+    while queue and created < entries:
+        directory, level = queue.pop(0)
+        depth = max(depth, level)
+        for i in range(files_per_dir):
+            if created >= entries:
+                break
+            (directory / f"file{i}{suffixes[i % len(suffixes)]}").touch()
+            created += 1
+        for i in range(fanout):
+            if created >= entries:
+                break
+            child = directory / f"dir{i}"
+            child.mkdir()
+            created += 1
+            queue.append((child, level + 1))
+    return depth
+
+
+def _python_module(rng: random.Random, index: int) -> str:
+    lines = [f'"""Module {index}: {_text(rng, 12)}."""', ""]
+    for j in range(rng.randint(2, 10)):
+        lines.append(f"import pkg.mod{rng.randint(0, 500)} as m{j}")
+    lines.append("")
+    for c in range(rng.randint(0, 4)):
+        lines += ["", f"class Class{index}_{c}:", f'    """{_text(rng, 10)}."""', ""]
+        for m in range(rng.randint(1, 8)):
+            lines += [
+                f"    def method{m}(self, value: int) -> int:",
+                f'        """{_text(rng, 8)}."""',
+                f"        return value * {m}",
+                "",
+            ]
+    for f in range(rng.randint(1, 10)):
+        lines += [
+            "",
+            f"def func{f}(items: list[int]) -> int:",
+            f'    """{_text(rng, 8)}."""',
+            "    total = 0",
+            "    for item in items:",
+            "        total += item",
+            "    return total",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def generate_python_package(root: Path, files: int = 5000, seed: int = 0) -> list[str]:
+    """Write a Python package of ``files`` modules in 50-module subpackages.
+
+    Returns:
+        Absolute paths of the modules, in creation order.
+    """
+    rng = random.Random(seed)
+    paths = []
+    for i in range(files):
+        package = root / "pkg" / f"sub{i // 50}"
+        if not package.exists():
+            package.mkdir(parents=True)
+            (package / "__init__.py").write_text("")
+        path = package / f"module{i}.py"
+        path.write_text(_python_module(rng, i))
+        paths.append(str(path))
+    return paths
+
+
+def generate_docs_tree(root: Path, size_mb: int, files: int, seed: int = 0) -> int:
+    """Write a deterministic Markdown tree and return its size in bytes."""
+    rng = random.Random(seed)
+    per_file = size_mb * 1024 * 1024 // files
+    total = 0
+    for i in range(files):
+        chunks: list[str] = []
+        size = 0
+        while size < per_file:
+            kind = rng.random()
+            title = " ".join(rng.choice(_WORDS) for _ in range(4))
+            if kind < 0.1:
+                chunk = f"{'#' * rng.randint(1, 4)} {title}\n\n"
+            elif kind < 0.15:
+                chunk = f"{title}\n---\n\n"
+            elif kind < 0.3:
+                body = "".join(f"# {rng.choice(_WORDS)}\nrun()\n" for _ in range(5))
+                chunk = f"```python\n{body}```\n\n"
+            else:
+                chunk = _paragraph(rng) + "\n"
+            chunks.append(chunk)
+            size += len(chunk)
+        path = root / f"section{i % 20}" / f"page{i}.md"
+        path.parent.mkdir(exist_ok=True)
+        data = "".join(chunks).encode()
+        path.write_bytes(data)
+        total += len(data)
+    return total
+
+
+def generate_openapi_spec(operations: int = 10_000, seed: int = 0) -> dict:
+    """Build an OpenAPI 3 document with ``operations`` operations.
+
+    Each path has up to five methods with parameters, a request body for
+    writes and responses referencing one of the component schemas.
+    """
+    rng = random.Random(seed)
+    schema_count = max(operations // 20, 1)
+    schemas = {}
+    for i in range(schema_count):
+        properties = {
+            f"field{j}": {"type": rng.choice(("string", "integer", "boolean"))}
+            for j in range(rng.randint(3, 12))
+        }
+        if i:
+            properties["parent"] = {"$ref": f"#/components/schemas/Model{i - 1}"}
+        schemas[f"Model{i}"] = {
+            "type": "object",
+            "description": _text(rng, 10),
+            "properties": properties,
+        }
+
+    paths: dict[str, dict] = {}
+    for i in range(operations):
+        path = f"/resource{i // len(HTTP_METHODS)}/{{id}}"
+        method = HTTP_METHODS[i % len(HTTP_METHODS)]
+        ref = {"$ref": f"#/components/schemas/Model{rng.randrange(schema_count)}"}
+        operation = {
+            "operationId": f"{method}Resource{i}",
+            "summary": _text(rng, 6),
+            "description": _text(rng, 30),
+            "tags": [f"tag{i % 50}"],
+            "parameters": [
+                {
+                    "name": "id",
+                    "in": "path",
+                    "required": True,
+                    "schema": {"type": "string"},
+                },
+                {
+                    "name": "limit",
+                    "in": "query",
+                    "description": _text(rng, 5),
+                    "schema": {"type": "integer", "default": 20},
+                },
+            ],
+            "responses": {
+                "200": {
+                    "description": "OK",
+                    "content": {"application/json": {"schema": ref}},
+                },
+                "404": {"description": "Not found"},
+            },
+        }
+        if method in ("post", "put", "patch"):
+            operation["requestBody"] = {
+                "description": _text(rng, 5),
+                "content": {"application/json": {"schema": ref}},
+            }
+        paths.setdefault(path, {})[method] = operation
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Benchmark API", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def write_openapi_specs(root: Path, operations: int = 10_000, seed: int = 0) -> dict:
+    """Write the same generated spec as ``openapi.json`` and ``openapi.yaml``.
+
+    Returns:
+        Paths of the specs keyed by "json" and "yaml".
+    """
+    import yaml
+
+    spec = generate_openapi_spec(operations, seed)
+    json_path = root / "openapi.json"
+    yaml_path = root / "openapi.yaml"
+    json_path.write_text(json.dumps(spec, indent=2))
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    with open(yaml_path, "w", encoding="utf-8") as f:
+        yaml.dump(spec, f, Dumper=dumper, sort_keys=False)
+    return {"json": str(json_path), "yaml": str(yaml_path)}
@@ -1,9 +1,12 @@
 """Project Explorer MCP configuration package."""
 
-from .logging import setup_logging
-from .settings import get_settings
+from .logging import debug_enabled, setup_logging, summarize
+from .settings import get_settings, reload_settings
 
 __all__ = [
     "setup_logging",
+    "debug_enabled",
+    "summarize",
     "get_settings",
+    "reload_settings",
 ]
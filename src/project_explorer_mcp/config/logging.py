@@ -2,15 +2,55 @@ import sys
 
 from loguru import logger
 
-from .settings import get_settings
+from .settings import LoggingMode, get_settings
 
-settings = get_settings()
+# Set by setup_logging. Until logging is configured, loguru's default handler
+# logs everything, so debug records are built and arguments logged in full.
+_debug_enabled = True
+_summarize_args = False
+
+
+def debug_enabled() -> bool:
+    """Whether DEBUG records are emitted.
+
+    Hot paths check this before building the arguments of a debug record.
+    """
+    return _debug_enabled
+
+
+def summarize(value):
+    """Prepare a tool argument for logging.
+
+    In production mode, lists, tuples, sets and dicts are replaced by their
+    length so that calls with hundreds of paths produce short records.
+
+    Args:
+        value: Argument value.
+
+    Returns:
+        The value, or its length in production mode.
+    """
+    if _summarize_args and isinstance(value, (list, tuple, set, dict)):
+        return len(value)
+    return value
 
 
 def setup_logging():
     """
     Configure logging for the application.
+
+    Can be called again after ``reload_settings`` to apply new settings.
     """
+    global _debug_enabled, _summarize_args
+    settings = get_settings()
+    production = settings.logging_mode == LoggingMode.PRODUCTION
+    _summarize_args = production
+    # The level is a loguru level name or a severity number.
+    try:
+        level = logger.level(settings.logging_level.upper()).no
+    except ValueError:
+        level = int(settings.logging_level)
+    _debug_enabled = level <= logger.level("DEBUG").no
 
     # Remove default handler to avoid duplicate logs
     logger.remove()
@@ -18,12 +58,14 @@ def setup_logging():
     # Console handler - for development/debugging
     logger.add(
         sys.stderr,
-        level=settings.logging_level,
+        level=level,
         format=settings.logging_format,
         colorize=False,
-        backtrace=True,
-        diagnose=True,
-        enqueue=True,
+        backtrace=not production,
+        diagnose=not production,
+        # Records are written synchronously: loguru handlers are thread-safe,
+        # and enqueueing pickles every record on the calling thread.
+        enqueue=False,
         catch=True,
     )
 
@@ -34,4 +76,5 @@ def setup_logging():
     logger.info(
         "Logging system initialized",
         log_level=settings.logging_level,
+        log_mode=settings.logging_mode.value,
     )
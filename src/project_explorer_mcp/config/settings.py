@@ -1,7 +1,11 @@
+import os
+import tempfile
 from enum import Enum
+from functools import lru_cache
+from typing import Annotated
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class OutputFormat(str, Enum):
@@ -9,6 +13,28 @@ class OutputFormat(str, Enum):
 
     JSON = "json"
     MARKDOWN = "markdown"
+    COMPACT = "compact"
+
+
+class LoggingMode(str, Enum):
+    """Logging mode"""
+
+    # Full tool arguments, variable values in tracebacks
+    DEVELOPMENT = "development"
+    # Collections in log arguments summarized by their length, no variable
+    # values in tracebacks
+    PRODUCTION = "production"
+
+
+class Transport(str, Enum):
+    """Transport the server is reached through"""
+
+    # One server process per client, over stdin/stdout
+    STDIO = "stdio"
+    # One server process shared by all clients, over streamable HTTP
+    HTTP = "http"
+    # One server process shared by all clients, over server-sent events
+    SSE = "sse"
 
 
 class Settings(BaseSettings):
@@ -31,18 +57,147 @@ class Settings(BaseSettings):
 
     # Logging settings
     logging_level: str = Field(default="INFO", description="Logging level")
+    logging_mode: LoggingMode = Field(
+        default=LoggingMode.PRODUCTION,
+        description="Logging mode (development or production)",
+    )
     logging_format: str = Field(
         default="{time:YYYY-MM-DD HH:mm:ss} | {extra[app]} v{extra[version]} | {level: <8} | {name}:{function}:{line} - {message} | {extra}",
         description="Console log format",
     )
 
+    # Server settings
+    transport: Transport = Field(
+        default=Transport.STDIO,
+        description="Transport of the server (stdio, http or sse)",
+    )
+    host: str = Field(
+        default="127.0.0.1",
+        description="Address the http and sse transports listen on",
+    )
+    port: int = Field(
+        default=8000,
+        description="Port the http and sse transports listen on",
+    )
+    max_concurrent_calls: int = Field(
+        default=16,
+        description="Maximum number of tool calls running their work at once, "
+        "across all clients",
+    )
+    max_calls_per_client: int = Field(
+        default=4,
+        description="Maximum number of concurrent tool calls of one client "
+        "session; further calls wait (0 for no limit)",
+    )
+
     # Tool settings
     default_output_format: OutputFormat = Field(
         default=OutputFormat.MARKDOWN,
-        description="Default output format for tools (json or markdown)",
+        description="Default output format for tools (json, markdown or compact)",
+    )
+    max_output_chars: int | None = Field(
+        default=None,
+        description="Default character budget for markdown output (None for no limit)",
+    )
+    time_budget: float | None = Field(
+        default=None,
+        description="Default seconds batch tools spend on files before returning "
+        "the rest as pending (None for no limit)",
+    )
+    max_file_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        description="Bytes of a file the outline tools read; larger files get a "
+        "partial outline (0 for no limit)",
+    )
+    index_path: str | None = Field(
+        default=None,
+        description="SQLite file of the persistent project index shared by server "
+        "processes (None to disable)",
+    )
+    max_workers: int = Field(
+        default=8,
+        description="Maximum number of worker threads for parallel file processing",
     )
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Record per-tool latency, error and output size metrics",
+    )
+    metrics_file: str | None = Field(
+        default=None,
+        description="File the metrics are written to periodically (None to disable)",
+    )
+    metrics_interval: float = Field(
+        default=60.0,
+        description="Seconds between metrics file writes",
+    )
+    profile_all_calls: bool = Field(
+        default=False,
+        description="Profile every tool call with cProfile (clients can also "
+        'request it per call with _meta {"profile": true})',
+    )
+    profile_memory: bool = Field(
+        default=False,
+        description="Also trace memory allocations of profiled calls",
+    )
+    profile_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "project-explorer-mcp-profiles"),
+        description="Directory receiving .prof and tracemalloc snapshot files",
+    )
+    profile_top_n: int = Field(
+        default=15,
+        description="Number of hotspots logged per profiled call",
+    )
+    warmup_roots: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description="Directories indexed in the background at server start, "
+        "comma-separated",
+    )
+    warmup_specs: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description="OpenAPI specs indexed in the background at server start, "
+        "comma-separated",
+    )
+    warmup_workers: int = Field(
+        default=2,
+        description="Number of low-priority threads used by the warm-up",
+    )
+    enabled_tools: Annotated[list[str] | None, NoDecode] = Field(
+        default=None,
+        description="Tools to register, comma-separated (None for all tools)",
+    )
+    disabled_tools: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description="Tools not to register, comma-separated",
+    )
+
+    @field_validator(
+        "enabled_tools", "disabled_tools", "warmup_roots", "warmup_specs", mode="before"
+    )
+    @classmethod
+    def split_names(cls, value):
+        """Accept tool and path lists as comma-separated strings."""
+        if isinstance(value, str):
+            return [name.strip() for name in value.split(",") if name.strip()]
+        return value
 
+    def is_tool_enabled(self, name: str) -> bool:
+        """Check whether a tool should be registered."""
+        if self.enabled_tools is not None and name not in self.enabled_tools:
+            return False
+        return name not in self.disabled_tools
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Retrieve application settings"""
+    """Retrieve application settings.
+
+    Settings are read from the environment and the .env file once per
+    process; use ``reload_settings`` to pick up changes.
+    """
     return Settings()
+
+
+def reload_settings() -> Settings:
+    """Re-read application settings and return the new values."""
+    get_settings.cache_clear()
+    return get_settings()
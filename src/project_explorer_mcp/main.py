@@ -1,46 +1,121 @@
 """Main entry point for the Project Explorer MCP server."""
 
+import signal
+import threading
+
 from fastmcp import FastMCP
 from loguru import logger
 
-from .config import get_settings, setup_logging
-from .tools import (
-    register_dir_tree,
-    register_markdown_outline,
-    register_openapi_get_operation_details,
-    register_openapi_list_operations,
-    register_python_outline,
-)
+from .config import get_settings, reload_settings, setup_logging
+from .config.settings import Transport
+from .tools import TOOL_MODULES, get_register_function
+from .utils.general import dumps_json
+from .utils.limits import ConcurrencyLimitMiddleware
+from .utils.metrics import MetricsMiddleware, start_metrics_dump
+from .utils.profiling import ProfilingMiddleware
+
+# Create MCP server instance; dict results are sent as compact JSON
+mcp = FastMCP("Project Explorer MCP", tool_serializer=dumps_json)
+
+# Hosts the network transports are served on without a warning.
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
 
-# Create MCP server instance
-mcp = FastMCP("Project Explorer MCP")
+# Middleware reconfigured when settings are reloaded.
+_metrics_middleware = MetricsMiddleware(enabled=False)
+_limit_middleware = ConcurrencyLimitMiddleware(0)
+_profiling_middleware = ProfilingMiddleware("")
 
 # Module-level configuration (initialized when run() is called)
 _tools_registered = False
 
 
+def _configure_middleware():
+    """Apply the current settings to the middleware."""
+    settings = get_settings()
+    _metrics_middleware.enabled = settings.metrics_enabled
+    _limit_middleware.per_client = settings.max_calls_per_client
+    _profiling_middleware.directory = settings.profile_dir
+    _profiling_middleware.all_calls = settings.profile_all_calls
+    _profiling_middleware.memory = settings.profile_memory
+    _profiling_middleware.top_n = settings.profile_top_n
+
+
 def _register_tools():
     """Register tools based on configuration. Called once during initialization."""
     global _tools_registered
     if _tools_registered:
         return
 
-    register_dir_tree(mcp)
-    register_python_outline(mcp)
-    register_markdown_outline(mcp)
-    register_openapi_list_operations(mcp)
-    register_openapi_get_operation_details(mcp)
+    settings = get_settings()
+    _configure_middleware()
+    mcp.add_middleware(_metrics_middleware)
+    # After the metrics, so their latency includes waiting for the limit.
+    mcp.add_middleware(_limit_middleware)
+    mcp.add_middleware(_profiling_middleware)
+
+    unknown = set(settings.enabled_tools or []) | set(settings.disabled_tools)
+    unknown -= TOOL_MODULES.keys()
+    if unknown:
+        logger.warning("Unknown tools in settings", tools=sorted(unknown))
+
+    # Modules of disabled tools are never imported.
+    registered = []
+    for name in TOOL_MODULES:
+        if settings.is_tool_enabled(name):
+            get_register_function(name)(mcp)
+            registered.append(name)
+    logger.debug("Tools registered", tools=registered)
 
     _tools_registered = True
 
 
+def _reload_config():
+    """Re-read settings and reconfigure logging and the middleware."""
+    reload_settings()
+    setup_logging()
+    _configure_middleware()
+    logger.info("Settings reloaded")
+
+
+def _install_reload_handler():
+    """Reload settings on SIGHUP, where the platform supports it."""
+    if not hasattr(signal, "SIGHUP"):
+        return
+
+    def handle_sighup(signum, frame):
+        # Reload outside the signal handler so it cannot interrupt logging.
+        threading.Thread(target=_reload_config, daemon=True).start()
+
+    signal.signal(signal.SIGHUP, handle_sighup)
+
+
 def run():
     """Run the MCP server."""
     setup_logging()
     logger.info("MCP server initialization started")
+    _install_reload_handler()
     _register_tools()
+    settings = get_settings()
+    if settings.metrics_enabled and settings.metrics_file:
+        start_metrics_dump(settings.metrics_file, settings.metrics_interval)
+    if settings.warmup_roots or settings.warmup_specs:
+        from .utils.warmup import start_warmup
+
+        # Fills the caches in the background while the server starts.
+        start_warmup(
+            settings.warmup_roots, settings.warmup_specs, settings.warmup_workers
+        )
     logger.info("MCP server tools registered, starting server")
-    mcp.run()
+    if settings.transport == Transport.STDIO:
+        mcp.run()
+        return
+    # One process serves every client, sharing its caches and worker pool.
+    if settings.host not in LOOPBACK_HOSTS:
+        logger.warning(
+            "Serving on a non-loopback address without authentication",
+            host=settings.host,
+        )
+    mcp.run(transport=settings.transport.value, host=settings.host, port=settings.port)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,43 @@
-"""Tool modules for project exploration."""
-
-from .dir_tree import register_dir_tree
-from .markdown_outline import register_markdown_outline
-from .openapi_get_operation_details import register_openapi_get_operation_details
-from .openapi_list_operations import register_openapi_list_operations
-from .python_outline import register_python_outline
-
-__all__ = [
-    "register_dir_tree",
-    "register_python_outline",
-    "register_markdown_outline",
-    "register_openapi_list_operations",
-    "register_openapi_get_operation_details",
-]
+"""Tool modules for project exploration.
+
+Tool modules are imported on first access, so that the server only loads the
+modules (and their dependencies) of the tools it registers.
+"""
+
+import importlib
+
+# Tool name -> module defining ``register_<tool name>``.
+TOOL_MODULES = {
+    "dir_tree": ".dir_tree",
+    "python_outline": ".python_outline",
+    "markdown_outline": ".markdown_outline",
+    "markdown_get_section": ".markdown_get_section",
+    "openapi_list_operations": ".openapi_list_operations",
+    "openapi_get_operation_details": ".openapi_get_operation_details",
+    "openapi_list_schemas": ".openapi_list_schemas",
+    "openapi_get_schema": ".openapi_get_schema",
+    "project_overview": ".project_overview",
+    "server_stats": ".server_stats",
+    "warmup_status": ".warmup_status",
+}
+
+__all__ = [f"register_{name}" for name in TOOL_MODULES]
+
+
+def get_register_function(tool: str):
+    """Import the module of a tool and return its register function.
+
+    Args:
+        tool: Tool name, a key of TOOL_MODULES.
+
+    Raises:
+        KeyError: if the tool is unknown.
+    """
+    module = importlib.import_module(TOOL_MODULES[tool], __name__)
+    return getattr(module, f"register_{tool}")
+
+
+def __getattr__(name: str):
+    if name.startswith("register_") and name[len("register_") :] in TOOL_MODULES:
+        return get_register_function(name[len("register_") :])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,14 @@
 
 import os
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from loguru import logger
 
 from ..config.settings import get_settings
-from ..utils import is_valid_path
+from ..utils.filesystem import list_directory
+from ..utils.formatters import OutputBudget
+from ..utils.general import is_valid_path
+from ..utils.progress import Progress, run_with_progress
 
 
 def register_dir_tree(mcp: FastMCP):
@@ -17,14 +20,18 @@ def register_dir_tree(mcp: FastMCP):
     """
 
     @mcp.tool()
-    def dir_tree(
-        root_path: str, max_depth: int = 1, output_format: str | None = None
+    async def dir_tree(
+        root_path: str,
+        max_depth: int = 1,
+        output_format: str | None = None,
+        ctx: Context | None = None,
     ) -> str | dict:
         """Returns a compact file and folder tree with depth limitation.
 
         Agent usage guidelines:
             - Use this tool when you need to get a quick overview of the file and folder structure of a project or directory.
             - Use when you need to display or analyze the hierarchy of files and folders up to a certain depth.
+            - Use output_format="compact" for deep trees: each directory's children are listed once under its relative path.
             - Do not use for reading file contents or for non-existent/relative paths.
 
         Path requirements:
@@ -38,7 +45,7 @@ def register_dir_tree(mcp: FastMCP):
         Args:
             root_path (str): Absolute path to the root directory.
             max_depth (int): Maximum nesting depth. Default is 1.
-            output_format (str | None): Output format ('json' or 'markdown').
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
                 Defaults to server setting (markdown by default).
 
         Returns:
@@ -55,68 +62,89 @@ def register_dir_tree(mcp: FastMCP):
             settings = get_settings()
             output_format = settings.default_output_format.value
 
-        # Path check
-        valid, msg = is_valid_path(root_path)
-        if not valid:
-            logger.error("Invalid path for dir_tree", root_path=root_path, error=msg)
-            return {"error": msg}
-        try:
-
-            def walk_text(path, depth, prefix=""):
-                """Walk directory tree and return text representation."""
-                if depth < 0:
-                    return ""
-                try:
-                    entries = sorted(os.listdir(path))
-                except Exception:
-                    return ""
-                lines = []
-                for entry in entries:
-                    full_path = os.path.join(path, entry)
-                    lines.append(
-                        f"{prefix}{entry}/"
-                        if os.path.isdir(full_path)
-                        else f"{prefix}{entry}"
-                    )
-                    if os.path.isdir(full_path) and depth > 0:
-                        sub = walk_text(full_path, depth - 1, prefix + "  ")
-                        if sub:
-                            lines.append(sub)
-                return "\n".join(lines)
-
-            def walk_json(path, depth):
-                """Walk directory tree and return JSON representation."""
-                if depth < 0:
-                    return []
-                try:
-                    entries = sorted(os.listdir(path))
-                except Exception:
-                    return []
-
-                result = []
-                for entry in entries:
-                    full_path = os.path.join(path, entry)
-                    is_dir = os.path.isdir(full_path)
-                    item = {"name": entry, "type": "directory" if is_dir else "file"}
-
-                    if is_dir and depth > 0:
-                        children = walk_json(full_path, depth - 1)
-                        if children:
-                            item["children"] = children
-
-                    result.append(item)
-                return result
-
-            if output_format == "json":
-                tree_data = walk_json(root_path, max_depth)
-                return {"root": root_path, "tree": tree_data}
-
-            # Markdown format
-            tree = walk_text(root_path, max_depth)
-            result = tree.strip()
-            return f"## Directory Tree: {root_path}\n\n```\n{result}\n```"
-        except Exception as e:
-            logger.error(
-                "Error generating directory tree", root_path=root_path, error=str(e)
-            )
-            return {"error": str(e)}
+        def run(progress: Progress) -> str | dict:
+            # Path check
+            valid, msg = is_valid_path(root_path)
+            if not valid:
+                logger.error(
+                    "Invalid path for dir_tree", root_path=root_path, error=msg
+                )
+                return {"error": msg}
+            try:
+
+                def scan(path):
+                    """List a directory as sorted (name, path, is_dir) tuples."""
+                    # One unit of progress per directory listed.
+                    progress.advance()
+                    try:
+                        entries = list_directory(path)
+                    except Exception:
+                        return []
+                    return [
+                        (name, os.path.join(path, name), is_dir)
+                        for name, is_dir in entries
+                    ]
+
+                def walk_text(path, depth, prefix=""):
+                    """Walk directory tree and yield text lines."""
+                    if depth < 0:
+                        return
+                    for entry, full_path, is_dir in scan(path):
+                        yield f"{prefix}{entry}/" if is_dir else f"{prefix}{entry}"
+                        if is_dir and depth > 0:
+                            yield from walk_text(full_path, depth - 1, prefix + "  ")
+
+                def walk_json(path, depth):
+                    """Walk directory tree and return JSON representation."""
+                    if depth < 0:
+                        return []
+
+                    result = []
+                    for entry, full_path, is_dir in scan(path):
+                        item = {
+                            "name": entry,
+                            "type": "directory" if is_dir else "file",
+                        }
+
+                        if is_dir and depth > 0:
+                            children = walk_json(full_path, depth - 1)
+                            if children:
+                                item["children"] = children
+
+                        result.append(item)
+                    return result
+
+                def walk_compact(path, depth, rel, dirs):
+                    """Walk directory tree, listing each directory's children once."""
+                    if depth < 0:
+                        return
+                    names = []
+                    for entry, full_path, is_dir in scan(path):
+                        names.append(f"{entry}/" if is_dir else entry)
+                        if is_dir and depth > 0:
+                            walk_compact(full_path, depth - 1, f"{rel}{entry}/", dirs)
+                    if names:
+                        dirs[rel] = names
+
+                if output_format == "json":
+                    tree_data = walk_json(root_path, max_depth)
+                    return {"root": root_path, "tree": tree_data}
+
+                if output_format == "compact":
+                    # Children keyed by directory path relative to root ("" is
+                    # the root itself); directory names end with "/".
+                    dirs: dict[str, list[str]] = {}
+                    walk_compact(root_path, max_depth, "", dirs)
+                    return {"root": root_path, "dirs": dict(sorted(dirs.items()))}
+
+                # Markdown format
+                # Lines are streamed into the output instead of joined per level.
+                result = OutputBudget().render(walk_text(root_path, max_depth))
+                return f"## Directory Tree: {root_path}\n\n```\n{result}\n```"
+            except Exception as e:
+                logger.error(
+                    "Error generating directory tree", root_path=root_path, error=str(e)
+                )
+                return {"error": str(e)}
+
+        return await run_with_progress(ctx, run)
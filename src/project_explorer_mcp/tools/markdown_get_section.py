@@ -0,0 +1,110 @@
+"""Markdown section extraction tool for the MCP server."""
+
+from fastmcp import FastMCP
+from loguru import logger
+
+from ..config.settings import get_settings
+from ..utils.general import is_valid_path
+from ..utils.markdown import read_markdown_section
+
+
+def register_markdown_get_section(mcp: FastMCP):
+    """Registers the markdown_get_section tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance.
+    """
+
+    @mcp.tool()
+    def markdown_get_section(
+        path: str,
+        heading: str | None = None,
+        line: int | None = None,
+        max_bytes: int | None = None,
+        output_format: str | None = None,
+    ) -> dict | str:
+        """Returns the content of one section of a Markdown file.
+
+        The section starts at the selected heading and ends before the next
+        heading of the same or a higher level, so subsections are included.
+
+        Agent usage guidelines:
+            - Use this tool after markdown_outline when you need the text under a specific heading.
+            - Select the section by heading text, by the heading line reported by markdown_outline, or both.
+            - Set max_bytes to keep the response small for long sections.
+            - Do not use for reading whole files or for non-Markdown files.
+
+        Path requirements:
+            - The path must not contain URL-encoding (e.g., '%').
+            - The path must be absolute.
+            - The path must exist on disk.
+        Example paths:
+            - Windows: "C:\\Users\\User\\project\\README.md"
+            - Linux: "/home/user/project/README.md"
+
+        Args:
+            path (str): Absolute path to the Markdown file.
+            heading (str | None): Heading text (exact match first, then case-insensitive).
+            line (int | None): Line number of the heading, as reported by markdown_outline.
+            max_bytes (int | None): Maximum number of bytes of section content to return.
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
+                A section is a single object, so 'compact' returns the same result as 'json'.
+                Defaults to server setting (markdown by default).
+
+        Returns:
+            dict | str: Section content in the requested format or error.
+        """
+        logger.info(
+            "markdown_get_section tool called",
+            path=path,
+            heading=heading,
+            line=line,
+            max_bytes=max_bytes,
+            output_format=output_format,
+        )
+        # Get default output format from settings if not provided
+        if output_format is None:
+            settings = get_settings()
+            output_format = settings.default_output_format.value
+
+        try:
+            # Validate path
+            valid, msg = is_valid_path(path)
+            if not valid:
+                logger.error(
+                    "Invalid path for markdown_get_section", path=path, error=msg
+                )
+                if output_format == "markdown":
+                    return f"**Error:** {msg}"
+                return {"error": msg}
+
+            section = read_markdown_section(path, heading, line, max_bytes)
+            logger.debug(
+                "Read Markdown section",
+                path=path,
+                line=section.heading.line,
+                size=section.size,
+                truncated=section.truncated,
+            )
+            if output_format == "markdown":
+                content = section.content.rstrip()
+                if section.truncated:
+                    content += (
+                        f"\n\n*[Truncated: showing {len(section.content.encode())} "
+                        f"of {section.size} bytes]*"
+                    )
+                return content
+            return {
+                "path": path,
+                "level": section.heading.level,
+                "text": section.heading.text,
+                "line": section.heading.line,
+                "content": section.content,
+                "size": section.size,
+                "truncated": section.truncated,
+            }
+        except Exception as e:
+            logger.error("Error in markdown_get_section tool", path=path, error=str(e))
+            if output_format == "markdown":
+                return f"**Error:** {str(e)}"
+            return {"error": str(e)}
@@ -1,12 +1,24 @@
 """Markdown outline tool for the MCP server."""
 
-import re
+import os
+import time
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from loguru import logger
 
+from ..config.logging import debug_enabled, summarize
 from ..config.settings import get_settings
-from ..utils import format_markdown_outline_as_markdown, is_valid_path
+from ..utils.compact import to_table
+from ..utils.concurrency import PENDING, map_within
+from ..utils.filesystem import walk_files
+from ..utils.formatters import OutputBudget, format_markdown_outline_as_markdown
+from ..utils.general import validate_paths
+from ..utils.markdown import get_markdown_headings
+from ..utils.progress import Progress, run_with_progress
+from ..utils.reader import SkippedFile, max_file_bytes, truncation_note
+
+# Columns of the heading tables in compact output.
+HEADING_COLUMNS = ("level", "text", "line")
 
 
 def register_markdown_outline(mcp: FastMCP):
@@ -17,14 +29,35 @@ def register_markdown_outline(mcp: FastMCP):
     """
 
     @mcp.tool()
-    def markdown_outline(
-        paths: list[str], output_format: str | None = None
+    async def markdown_outline(
+        paths: list[str] | None = None,
+        output_format: str | None = None,
+        root: str | None = None,
+        patterns: list[str] | None = None,
+        max_headings_per_file: int | None = None,
+        max_chars: int | None = None,
+        time_budget: float | None = None,
+        ctx: Context | None = None,
     ) -> dict | str:
         """Returns an outline for each Markdown file: headings, levels, line.
 
+        Both ATX (`# Title`) and setext (underlined) headings are reported;
+        lines inside fenced code blocks and YAML front matter are ignored.
+
+        Files are given either as a list of paths, or as a root directory plus
+        glob patterns. Directory discovery skips VCS, virtualenv and cache
+        directories and honors .gitignore files.
+
         Agent usage guidelines:
             - Use this tool when you need to extract or display the structure of Markdown documents, such as for navigation, summary, or documentation analysis.
             - Use when you need to list headings, their levels, and line numbers in Markdown files.
+            - To outline a whole documentation tree in one call, pass root (and optionally patterns) instead of paths.
+            - Set max_headings_per_file to keep the response small for large trees.
+            - Use output_format="compact" for many files: each file's headings are returned as a table of columns and rows.
+            - Invalid or unreadable files get an "error" entry; the other files are still outlined.
+            - Binary and non-UTF-8 files get a "skipped" entry. Files over the server's size limit
+              are outlined up to the limit and end with a "truncated" note.
+            - With time_budget, files not outlined in time are returned as {"pending": true}; request only those again.
             - Do not use for non-Markdown files or for reading the full content of the file.
 
         Path requirements:
@@ -36,60 +69,159 @@ def register_markdown_outline(mcp: FastMCP):
             - Linux: "/home/user/project/README.md"
 
         Args:
-            paths (list[str]): List of absolute paths to Markdown files.
-            output_format (str | None): Output format ('json' or 'markdown').
+            paths (list[str] | None): List of absolute paths to Markdown files.
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
                 Defaults to server setting (markdown by default).
+            root (str | None): Absolute path of a directory to search for Markdown files.
+            patterns (list[str] | None): Glob patterns relative to root. Defaults to ["**/*.md"].
+                `*` does not cross directories, `**` matches any number of them.
+            max_headings_per_file (int | None): Maximum number of headings returned per file.
+            max_chars (int | None): Character budget for markdown output (about 4 characters per token).
+                When set, long heading lists are collapsed and output stops at the budget.
+                Defaults to server setting (no limit).
+            time_budget (float | None): Seconds to spend discovering and outlining files. Files not
+                finished by then are marked as pending. Defaults to server setting (no limit).
 
         Returns:
-            dict | str: Outline for each file in the requested format.
+            dict | str: Outline for each file in the requested format. Files are
+                ordered as given, or sorted by path when discovered from root.
         """
         logger.info(
-            "markdown_outline tool called", paths=paths, output_format=output_format
+            "markdown_outline tool called",
+            paths=summarize(paths),
+            root=root,
+            patterns=summarize(patterns),
+            max_headings_per_file=max_headings_per_file,
+            max_chars=max_chars,
+            output_format=output_format,
+            time_budget=time_budget,
         )
         # Get default output format from settings if not provided
         if output_format is None:
             settings = get_settings()
             output_format = settings.default_output_format.value
+        budget = OutputBudget(
+            max_chars if max_chars is not None else get_settings().max_output_chars
+        )
+        if time_budget is None:
+            time_budget = get_settings().time_budget
+        started = time.monotonic()
 
-        # Path check
-        for path in paths:
-            valid, msg = is_valid_path(path)
-            if not valid:
-                logger.error("Invalid path for markdown_outline", path=path, error=msg)
-                error_result = {path: [{"error": msg}]}
-                if output_format == "markdown":
-                    return format_markdown_outline_as_markdown(error_result)
-                return error_result
-        try:
-            result = {}
-            header_re = re.compile(r"^(#+)\s+(.*)")
-            for path in paths:
-                outline = []
+        if not paths and root is None:
+            msg = "Either paths or root must be provided."
+            if output_format == "markdown":
+                return f"**Error:** {msg}"
+            return {"error": msg}
+
+        def run(progress: Progress) -> dict | str:
+            # Path check: every path is stat'ed once; invalid paths get an error
+            # entry and do not stop the other files from being outlined.
+            stats, errors = validate_paths(
+                ([root] if root is not None else []) + list(paths or [])
+            )
+            if errors:
+                logger.warning(
+                    "Invalid paths for markdown_outline", paths=summarize(list(errors))
+                )
+
+            def outline_file(path: str) -> list[dict]:
+                """Build the outline of a single file."""
+                # Files queued before a cancellation are skipped.
+                progress.check()
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        for i, line in enumerate(f, 1):
-                            m = header_re.match(line)
-                            if m:
-                                level = len(m.group(1))
-                                text = m.group(2).strip()
-                                if text:
-                                    outline.append(
-                                        {"level": level, "text": text, "line": i}
-                                    )
-                    logger.debug(
-                        "Parsed Markdown file outline", path=path, headings=len(outline)
-                    )
+                    st = stats.get(path) or os.stat(path)
+                    headings = get_markdown_headings(path, st)
+                    if debug_enabled():
+                        logger.debug(
+                            "Parsed Markdown file outline",
+                            path=path,
+                            headings=len(headings),
+                        )
+                except SkippedFile as e:
+                    logger.warning("Skipped Markdown file", path=path, reason=str(e))
+                    progress.advance()
+                    return [{"skipped": str(e)}]
                 except Exception as e:
                     logger.error("Error parsing Markdown file", path=path, error=str(e))
-                    outline = [{"error": str(e)}]
-                result[path] = outline
+                    progress.advance()
+                    return [{"error": str(e)}]
+                outline: list[dict] = [
+                    {"level": h.level, "text": h.text, "line": h.line}
+                    for h in headings[:max_headings_per_file]
+                ]
+                if max_headings_per_file is not None and len(headings) > len(outline):
+                    outline.append({"omitted": len(headings) - len(outline)})
+                limit = max_file_bytes()
+                if limit is not None and st.st_size > limit:
+                    outline.append({"truncated": truncation_note(limit, st.st_size)})
+                progress.advance()
+                return outline
 
-            # Format output based on requested format
-            if output_format == "markdown":
-                return format_markdown_outline_as_markdown(result)
-            return result
-        except Exception as e:
-            logger.error("Error in markdown_outline tool", error=str(e))
-            if output_format == "markdown":
-                return f"**Error:** {str(e)}"
-            return {"error": str(e)}
+            def compact_outline(outline: list[dict]) -> dict:
+                """Turn a file outline into a heading table."""
+                if outline and not {"error", "pending", "skipped"}.isdisjoint(
+                    outline[0]
+                ):
+                    return outline[0]
+                # Trailing markers ("omitted", "truncated") go next to the table.
+                headings = [h for h in outline if "level" in h]
+                table = to_table(headings, HEADING_COLUMNS)
+                for marker in outline[len(headings) :]:
+                    table.update(marker)
+                return table
+
+            try:
+                result: dict[str, list[dict]] = {
+                    path: [{"error": msg}] for path, msg in errors.items()
+                }
+                files = [path for path in dict.fromkeys(paths or []) if path in stats]
+                if root is not None and root in stats:
+                    found = walk_files(root, patterns or ["**/*.md"])
+                    if files:
+                        # A file given in paths and found under root, under
+                        # the same or another name, is outlined once.
+                        unique: dict[str, str] = {}
+                        for path in files + found:
+                            unique.setdefault(os.path.realpath(path), path)
+                        files = list(unique.values())
+                    else:
+                        files = found
+                    logger.debug(
+                        "Discovered Markdown files", root=root, files=len(files)
+                    )
+
+                # Files are scanned concurrently; results keep the input order.
+                progress.total = len(files)
+                remaining = (
+                    None
+                    if time_budget is None
+                    else max(time_budget - (time.monotonic() - started), 0.0)
+                )
+                pending = 0
+                for path, outline in zip(
+                    files, map_within(outline_file, files, remaining)
+                ):
+                    if outline is PENDING:
+                        outline = [{"pending": True}]
+                        pending += 1
+                    result[path] = outline
+                if pending:
+                    logger.warning(
+                        "markdown_outline time budget exhausted",
+                        pending=pending,
+                        time_budget=time_budget,
+                    )
+
+                # Format output based on requested format
+                if output_format == "markdown":
+                    return format_markdown_outline_as_markdown(result, budget)
+                if output_format == "compact":
+                    return {path: compact_outline(o) for path, o in result.items()}
+                return result
+            except Exception as e:
+                logger.error("Error in markdown_outline tool", error=str(e))
+                if output_format == "markdown":
+                    return f"**Error:** {str(e)}"
+                return {"error": str(e)}
+
+        return await run_with_progress(ctx, run)
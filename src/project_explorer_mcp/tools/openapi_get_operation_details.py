@@ -1,19 +1,16 @@
 """OpenAPI get operation details tool for the MCP server."""
 
-from pathlib import Path
-
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from loguru import logger
 
+from ..config.logging import summarize
 from ..config.settings import get_settings
-from ..utils import (
-    get_openapi_operation_details as get_operation_details_util,
-)
-from ..utils import (
-    is_valid_path,
-    load_openapi_spec,
-)
-from ..utils.openapi import format_openapi_details_markdown
+from ..utils.compact import compact
+from ..utils.formatters import OutputBudget
+from ..utils.general import is_valid_path
+from ..utils.openapi import format_openapi_details_markdown, get_openapi_model
+from ..utils.openapi import get_openapi_operation_details as get_operation_details_util
+from ..utils.progress import Progress, run_with_progress
 
 
 def register_openapi_get_operation_details(mcp: FastMCP):
@@ -24,11 +21,13 @@ def register_openapi_get_operation_details(mcp: FastMCP):
     """
 
     @mcp.tool()
-    def openapi_get_operation_details(
+    async def openapi_get_operation_details(
         spec_path: str,
         selectors: list[str],
         expand_refs: bool = False,
         format_output: str | None = None,
+        max_chars: int | None = None,
+        ctx: Context | None = None,
     ) -> dict | str:
         """Get detailed information for specific OpenAPI operations.
 
@@ -36,7 +35,8 @@ def register_openapi_get_operation_details(mcp: FastMCP):
             - Use this tool when you need detailed information about specific API operations.
             - Use selectors to target specific operations by operationId, method+path, or path.
             - Set expand_refs=True to resolve schema references for full schema details.
-            - Choose format_output="json" for structured data, "markdown" for formatted output.
+            - Choose format_output="json" for structured data, "markdown" for formatted output,
+              "compact" for structured data with lists of objects sent as tables of columns and rows.
 
         Path requirements:
             - The path must not contain URL-encoding (e.g., '%').
@@ -50,8 +50,11 @@ def register_openapi_get_operation_details(mcp: FastMCP):
                 - "METHOD /path" (e.g. "GET /users/{id}")
                 - just a path (e.g. "/users/{id}") to match all methods on that path
             expand_refs (bool): Whether to resolve local $ref references in schemas. Defaults to False.
-            format_output (str | None): Output format ('json' or 'markdown').
+            format_output (str | None): Output format ('json', 'markdown' or 'compact').
                 Defaults to server setting.
+            max_chars (int | None): Character budget for markdown output (about 4 characters per token).
+                When set, docstrings and descriptions are shortened to their first line, long lists
+                are collapsed and output stops at the budget. Defaults to server setting (no limit).
 
         Returns:
             dict | str: For format_output="json": Dictionary containing operation details and metadata.
@@ -59,62 +62,77 @@ def register_openapi_get_operation_details(mcp: FastMCP):
                 - count: number of matching operations
                 - error: error message if any, None otherwise
                 For format_output="markdown": formatted markdown string
+                For format_output="compact": the JSON result with lists of objects as
+                {"columns": [...], "rows": [[...], ...]}
         """
         logger.info(
             "openapi_get_operation_details tool called",
             spec_path=spec_path,
-            selectors=selectors,
+            selectors=summarize(selectors),
             expand_refs=expand_refs,
             format_output=format_output,
+            max_chars=max_chars,
         )
         # Get default output format from settings if not provided
         if format_output is None:
             settings = get_settings()
             format_output = settings.default_output_format.value
+        budget = OutputBudget(
+            max_chars if max_chars is not None else get_settings().max_output_chars
+        )
 
-        try:
-            # Validate path
-            valid, msg = is_valid_path(spec_path)
-            if not valid:
+        def run(progress: Progress) -> dict | str:
+            try:
+                # Validate path
+                valid, msg = is_valid_path(spec_path)
+                if not valid:
+                    logger.error(
+                        "Invalid path for openapi_get_operation_details",
+                        spec_path=spec_path,
+                        error=msg,
+                    )
+                    if format_output == "markdown":
+                        return f"**Error:** {msg}"
+                    else:
+                        return {
+                            "details": [],
+                            "count": 0,
+                            "error": msg,
+                        }
+
+                # One unit per path item when the spec is read, which adds
+                # them to the total; none when the model comes from the cache.
+                model = get_openapi_model(spec_path, progress=progress)
+                progress.advance(0, message="Specification loaded")
+                records = get_operation_details_util(
+                    model, selectors, expand_refs, progress
+                )
+                logger.info(
+                    "Successfully retrieved OpenAPI operation details",
+                    spec_path=spec_path,
+                    selectors=summarize(selectors),
+                    count=len(records),
+                )
+                if format_output == "markdown":
+                    return format_openapi_details_markdown(records, budget)
+                result = {"details": records, "count": len(records), "error": None}
+                if format_output == "compact":
+                    return compact(result)
+                return result
+            except Exception as e:
                 logger.error(
-                    "Invalid path for openapi_get_operation_details",
+                    "Failed to get operation details",
                     spec_path=spec_path,
-                    error=msg,
+                    error=str(e),
+                    tool="openapi_get_operation_details",
                 )
                 if format_output == "markdown":
-                    return f"**Error:** {msg}"
+                    return f"**Error:** {str(e)}"
                 else:
                     return {
                         "details": [],
                         "count": 0,
-                        "error": msg,
+                        "error": str(e),
                     }
 
-            path = Path(spec_path)
-            spec = load_openapi_spec(path)
-            records = get_operation_details_util(spec, selectors, expand_refs)
-            logger.info(
-                "Successfully retrieved OpenAPI operation details",
-                spec_path=spec_path,
-                selectors=selectors,
-                count=len(records),
-            )
-            if format_output == "markdown":
-                return format_openapi_details_markdown(records)
-            else:
-                return {"details": records, "count": len(records), "error": None}
-        except Exception as e:
-            logger.error(
-                "Failed to get operation details",
-                spec_path=spec_path,
-                error=str(e),
-                tool="openapi_get_operation_details",
-            )
-            if format_output == "markdown":
-                return f"**Error:** {str(e)}"
-            else:
-                return {
-                    "details": [],
-                    "count": 0,
-                    "error": str(e),
-                }
+        return await run_with_progress(ctx, run)
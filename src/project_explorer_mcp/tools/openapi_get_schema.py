@@ -0,0 +1,132 @@
+"""OpenAPI get schema tool for the MCP server."""
+
+from fastmcp import Context, FastMCP
+from loguru import logger
+
+from ..config.logging import summarize
+from ..config.settings import get_settings
+from ..utils.compact import compact
+from ..utils.formatters import OutputBudget
+from ..utils.general import is_valid_path
+from ..utils.openapi import get_openapi_spec
+from ..utils.openapi_model import resolve_pointer
+from ..utils.openapi_schemas import format_schema_details_markdown, get_schema_catalog
+from ..utils.progress import Progress, run_with_progress
+
+
+def register_openapi_get_schema(mcp: FastMCP):
+    """Registers the openapi_get_schema tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance.
+    """
+
+    @mcp.tool()
+    async def openapi_get_schema(
+        spec_path: str,
+        names: list[str],
+        output_format: str | None = None,
+        max_chars: int | None = None,
+        ctx: Context | None = None,
+    ) -> dict | str:
+        """Get named schemas of an OpenAPI specification file and who uses them.
+
+        Agent usage guidelines:
+            - Use this tool to read data models listed by openapi_list_schemas.
+            - Each schema is returned as written in the spec, with its references left as $ref,
+              together with the schemas it references, the schemas and operations referencing it
+              and whether it is part of a reference cycle.
+            - Follow references by asking for the referenced schemas, in the same call if needed.
+
+        Path requirements:
+            - The path must not contain URL-encoding (e.g., '%').
+            - The path must be absolute.
+            - The path must exist on disk and be a valid OpenAPI JSON or YAML file.
+
+        Args:
+            spec_path (str): Absolute path to the OpenAPI JSON or YAML file.
+            names (list[str]): Schema names, e.g. ["User", "Address"].
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
+                Defaults to server setting.
+            max_chars (int | None): Character budget for markdown output (about 4 characters per token).
+                When set, long lists are collapsed and output stops at the budget.
+                Defaults to server setting (no limit).
+
+        Returns:
+            dict | str: For output_format="json": Dictionary containing schema records and metadata.
+                - schemas: list of records with name, pointer, type, description, property_count,
+                  references, referenced_by, operations, cyclic and schema (the schema itself);
+                  unknown names get a record with only name and error
+                - count: number of schemas found
+                - error: error message if any, None otherwise
+                For output_format="markdown": formatted markdown string
+                For output_format="compact": the JSON result with lists of objects as
+                {"columns": [...], "rows": [[...], ...]}
+        """
+        logger.info(
+            "openapi_get_schema tool called",
+            spec_path=spec_path,
+            names=summarize(names),
+            output_format=output_format,
+            max_chars=max_chars,
+        )
+        if output_format is None:
+            output_format = get_settings().default_output_format.value
+        budget = OutputBudget(
+            max_chars if max_chars is not None else get_settings().max_output_chars
+        )
+
+        def run(progress: Progress) -> dict | str:
+            try:
+                valid, msg = is_valid_path(spec_path)
+                if not valid:
+                    logger.error(
+                        "Invalid path for openapi_get_schema",
+                        spec_path=spec_path,
+                        error=msg,
+                    )
+                    if output_format == "markdown":
+                        return f"**Error:** {msg}"
+                    return {"schemas": [], "count": 0, "error": msg}
+
+                progress.total = 2
+                catalog = get_schema_catalog(spec_path)
+                progress.advance(message="Schemas cataloged")
+                spec = get_openapi_spec(spec_path)
+                progress.advance(message="Specification loaded")
+
+                records = []
+                for name in names:
+                    entry = catalog.get(name)
+                    if entry is None:
+                        records.append({"name": name, "error": "Schema not found"})
+                        continue
+                    record = entry.to_dict()
+                    record["schema"] = resolve_pointer(spec, entry.pointer)
+                    records.append(record)
+                count = sum(1 for r in records if "error" not in r)
+
+                logger.info(
+                    "Successfully retrieved OpenAPI schemas",
+                    spec_path=spec_path,
+                    names=summarize(names),
+                    count=count,
+                )
+                if output_format == "markdown":
+                    return format_schema_details_markdown(records, budget)
+                result = {"schemas": records, "count": count, "error": None}
+                if output_format == "compact":
+                    return compact(result)
+                return result
+            except Exception as e:
+                logger.error(
+                    "Failed to get schemas",
+                    spec_path=spec_path,
+                    error=str(e),
+                    tool="openapi_get_schema",
+                )
+                if output_format == "markdown":
+                    return f"**Error:** {str(e)}"
+                return {"schemas": [], "count": 0, "error": str(e)}
+
+        return await run_with_progress(ctx, run)
@@ -1,13 +1,13 @@
 """OpenAPI list operations tool for the MCP server."""
 
-from pathlib import Path
-
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from loguru import logger
 
 from ..config.settings import get_settings
-from ..utils import is_valid_path, iter_openapi_operations, load_openapi_spec
-from ..utils.openapi import format_openapi_markdown
+from ..utils.compact import compact
+from ..utils.general import is_valid_path
+from ..utils.openapi import format_openapi_markdown, get_openapi_operations
+from ..utils.progress import Progress, run_with_progress
 
 
 def register_openapi_list_operations(mcp: FastMCP):
@@ -18,7 +18,7 @@ def register_openapi_list_operations(mcp: FastMCP):
     """
 
     @mcp.tool()
-    def openapi_list_operations(
+    async def openapi_list_operations(
         spec_path: str,
         output_format: str | None = None,
         filter_by_tag: str | None = None,
@@ -26,12 +26,14 @@ def register_openapi_list_operations(mcp: FastMCP):
         filter_by_path: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        ctx: Context | None = None,
     ) -> dict | str:
         """List operations from an OpenAPI specification file.
 
         Agent usage guidelines:
             - Use this tool when you need to explore the available API operations in an OpenAPI spec.
             - Use when you want to see endpoints, methods, and summaries without detailed schemas.
+            - Use output_format="compact" for long listings: operations are returned as a table of columns and rows.
             - Do not use for getting detailed parameter or response information.
 
         Path requirements:
@@ -41,7 +43,7 @@ def register_openapi_list_operations(mcp: FastMCP):
 
         Args:
             spec_path (str): Absolute path to the OpenAPI JSON or YAML file.
-            output_format (str | None): Output format ('json' or 'markdown').
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
                 Defaults to server setting.
             filter_by_tag (str | None): Filter operations by tag. Only operations with this tag will be included.
             filter_by_method (str | None): Filter operations by HTTP method (e.g., 'GET', 'POST').
@@ -62,6 +64,8 @@ def register_openapi_list_operations(mcp: FastMCP):
                 - total_count: total number of operations matching filters (before pagination)
                 - error: error message if any, None otherwise
                 For format_output="markdown": formatted markdown string
+                For format_output="compact": the JSON result with operations as
+                {"columns": [...], "rows": [[...], ...]}
         """
         logger.info(
             "openapi_list_operations tool called",
@@ -78,83 +82,94 @@ def register_openapi_list_operations(mcp: FastMCP):
             settings = get_settings()
             output_format = settings.default_output_format.value
 
-        try:
-            # Validate path
-            valid, msg = is_valid_path(spec_path)
-            if not valid:
+        def run(progress: Progress) -> dict | str:
+            try:
+                # Validate path
+                valid, msg = is_valid_path(spec_path)
+                if not valid:
+                    logger.error(
+                        "Invalid path for openapi_list_operations",
+                        spec_path=spec_path,
+                        error=msg,
+                    )
+                    if output_format == "markdown":
+                        return f"**Error:** {msg}"
+                    else:
+                        return {
+                            "operations": [],
+                            "count": 0,
+                            "total_count": 0,
+                            "error": msg,
+                        }
+
+                # One unit per path item when the spec is read; none when
+                # the operations come from the cache.
+                all_operations = get_openapi_operations(spec_path, progress=progress)
+                progress.advance(0, message="Operations listed")
+
+                # Apply filters
+                filtered_operations = []
+                for op in all_operations:
+                    if (
+                        isinstance(op.tags, list)
+                        and filter_by_tag
+                        and filter_by_tag not in op.tags
+                    ):
+                        continue
+                    if filter_by_method and op.method != filter_by_method.upper():
+                        continue
+                    if (
+                        filter_by_path
+                        and isinstance(op.path, str)
+                        and filter_by_path.lower() not in op.path.lower()
+                    ):
+                        continue
+                    filtered_operations.append(op)
+
+                total_count = len(filtered_operations)
+
+                # Apply pagination
+                if offset:
+                    filtered_operations = filtered_operations[offset:]
+                if limit:
+                    filtered_operations = filtered_operations[:limit]
+
+                count = len(filtered_operations)
+                # Only the returned page is turned into the JSON shape.
+                operations = [op.to_dict() for op in filtered_operations]
+
+                logger.info(
+                    "Successfully listed OpenAPI operations",
+                    spec_path=spec_path,
+                    total_count=total_count,
+                    returned_count=count,
+                )
+                if output_format == "markdown":
+                    return format_openapi_markdown(operations)
+                result = {
+                    "operations": operations,
+                    "count": count,
+                    "total_count": total_count,
+                    "error": None,
+                }
+                if output_format == "compact":
+                    return compact(result)
+                return result
+            except Exception as e:
                 logger.error(
-                    "Invalid path for openapi_list_operations",
+                    "Failed to list operations",
                     spec_path=spec_path,
-                    error=msg,
+                    error=str(e),
+                    tool="openapi_list_operations",
                 )
                 if output_format == "markdown":
-                    return f"**Error:** {msg}"
+                    return f"**Error:** {str(e)}"
                 else:
                     return {
                         "operations": [],
                         "count": 0,
                         "total_count": 0,
-                        "error": msg,
+                        "error": str(e),
                     }
 
-            path = Path(spec_path)
-            spec = load_openapi_spec(path)
-            all_operations = list(iter_openapi_operations(spec))
-
-            # Apply filters
-            filtered_operations = []
-            for op in all_operations:
-                tags = op.get("tags", [])
-                if (
-                    isinstance(tags, list)
-                    and filter_by_tag
-                    and filter_by_tag not in tags
-                ):
-                    continue
-                if filter_by_method and op.get("method") != filter_by_method.upper():
-                    continue
-                path_str = op.get("path", "")
-                if (
-                    filter_by_path
-                    and isinstance(path_str, str)
-                    and filter_by_path.lower() not in path_str.lower()
-                ):
-                    continue
-                filtered_operations.append(op)
-
-            total_count = len(filtered_operations)
-
-            # Apply pagination
-            if offset:
-                filtered_operations = filtered_operations[offset:]
-            if limit:
-                filtered_operations = filtered_operations[:limit]
-
-            count = len(filtered_operations)
-
-            logger.info(
-                "Successfully listed OpenAPI operations",
-                spec_path=spec_path,
-                total_count=total_count,
-                returned_count=count,
-            )
-            if output_format == "markdown":
-                return format_openapi_markdown(filtered_operations)
-            else:
-                return {
-                    "operations": filtered_operations,
-                    "count": count,
-                    "total_count": total_count,
-                    "error": None,
-                }
-        except Exception as e:
-            logger.error(
-                "Failed to list operations",
-                spec_path=spec_path,
-                error=str(e),
-                tool="openapi_list_operations",
-            )
-            if output_format == "markdown":
-                return f"**Error:** {str(e)}"
-            else:
-                return {"operations": [], "count": 0, "total_count": 0, "error": str(e)}
+        return await run_with_progress(ctx, run)
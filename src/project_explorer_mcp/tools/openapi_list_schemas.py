@@ -0,0 +1,139 @@
+"""OpenAPI list schemas tool for the MCP server."""
+
+from fastmcp import Context, FastMCP
+from loguru import logger
+
+from ..config.settings import get_settings
+from ..utils.compact import compact
+from ..utils.general import is_valid_path
+from ..utils.openapi_schemas import format_schema_list_markdown, get_schema_catalog
+from ..utils.progress import Progress, run_with_progress
+
+
+def register_openapi_list_schemas(mcp: FastMCP):
+    """Registers the openapi_list_schemas tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance.
+    """
+
+    @mcp.tool()
+    async def openapi_list_schemas(
+        spec_path: str,
+        output_format: str | None = None,
+        filter_by_name: str | None = None,
+        cyclic_only: bool = False,
+        limit: int = 50,
+        offset: int = 0,
+        ctx: Context | None = None,
+    ) -> dict | str:
+        """List the named schemas of an OpenAPI specification file.
+
+        Agent usage guidelines:
+            - Use this tool to find the data models of an API (components/schemas, or definitions in Swagger 2.0).
+            - Each schema comes with its property count, how many schemas it references and is referenced by,
+              how many operations use it and whether it is part of a reference cycle.
+            - Use openapi_get_schema to read a schema and see who uses it, instead of expanding
+              references in operation details.
+
+        Path requirements:
+            - The path must not contain URL-encoding (e.g., '%').
+            - The path must be absolute.
+            - The path must exist on disk and be a valid OpenAPI JSON or YAML file.
+
+        Args:
+            spec_path (str): Absolute path to the OpenAPI JSON or YAML file.
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
+                Defaults to server setting.
+            filter_by_name (str | None): Filter schemas by name containing this substring (case-insensitive).
+            cyclic_only (bool): Only list schemas that are part of a reference cycle. Defaults to False.
+            limit (int): Maximum number of schemas to return. Defaults to 50.
+            offset (int): Number of schemas to skip from the start. Defaults to 0.
+
+        Examples:
+            - To find user models: {"spec_path": "/path/to/spec.json", "filter_by_name": "user"}
+            - To paginate through results: {"spec_path": "/path/to/spec.json", "limit": 20, "offset": 40}
+
+        Returns:
+            dict | str: For output_format="json": Dictionary containing schemas list and metadata.
+                - schemas: list of schema dicts with name, type, description, property_count,
+                  reference_count, referenced_by_count, operation_count, cyclic
+                - count: number of schemas returned (after filtering and pagination)
+                - total_count: total number of schemas matching filters (before pagination)
+                - error: error message if any, None otherwise
+                For output_format="markdown": formatted markdown string
+                For output_format="compact": the JSON result with schemas as
+                {"columns": [...], "rows": [[...], ...]}
+        """
+        logger.info(
+            "openapi_list_schemas tool called",
+            spec_path=spec_path,
+            output_format=output_format,
+            filter_by_name=filter_by_name,
+            cyclic_only=cyclic_only,
+            limit=limit,
+            offset=offset,
+        )
+        if output_format is None:
+            output_format = get_settings().default_output_format.value
+
+        def run(progress: Progress) -> dict | str:
+            try:
+                valid, msg = is_valid_path(spec_path)
+                if not valid:
+                    logger.error(
+                        "Invalid path for openapi_list_schemas",
+                        spec_path=spec_path,
+                        error=msg,
+                    )
+                    if output_format == "markdown":
+                        return f"**Error:** {msg}"
+                    return {"schemas": [], "count": 0, "total_count": 0, "error": msg}
+
+                progress.total = 1
+                catalog = get_schema_catalog(spec_path)
+                progress.advance(message="Schemas cataloged")
+
+                needle = filter_by_name.lower() if filter_by_name else None
+                matching = [
+                    entry
+                    for entry in catalog.values()
+                    if (needle is None or needle in entry.name.lower())
+                    and (entry.cyclic or not cyclic_only)
+                ]
+                total_count = len(matching)
+                if offset:
+                    matching = matching[offset:]
+                if limit:
+                    matching = matching[:limit]
+                schemas = [entry.summary() for entry in matching]
+
+                logger.info(
+                    "Successfully listed OpenAPI schemas",
+                    spec_path=spec_path,
+                    total_count=total_count,
+                    returned_count=len(schemas),
+                )
+                if output_format == "markdown":
+                    return format_schema_list_markdown(schemas)
+                result = {
+                    "schemas": schemas,
+                    "count": len(schemas),
+                    "total_count": total_count,
+                    "error": None,
+                }
+                if output_format == "compact":
+                    return compact(result)
+                return result
+            except Exception as e:
+                logger.error(
+                    "Failed to list schemas",
+                    spec_path=spec_path,
+                    error=str(e),
+                    tool="openapi_list_schemas",
+                )
+                if output_format == "markdown":
+                    return f"**Error:** {str(e)}"
+                return {"schemas": [], "count": 0, "total_count": 0, "error": str(e)}
+
+        return await run_with_progress(ctx, run)
@@ -0,0 +1,111 @@
+"""Project overview tool for the MCP server."""
+
+from fastmcp import Context, FastMCP
+from loguru import logger
+
+from ..config.settings import get_settings
+from ..utils.compact import compact
+from ..utils.formatters import OutputBudget, format_project_overview_as_markdown
+from ..utils.general import is_valid_path
+from ..utils.overview import build_project_overview
+from ..utils.progress import Progress, run_with_progress
+
+
+def register_project_overview(mcp: FastMCP):
+    """Registers the project_overview tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance.
+    """
+
+    @mcp.tool()
+    async def project_overview(
+        root_path: str,
+        max_files_per_type: int = 20,
+        output_format: str | None = None,
+        max_chars: int | None = None,
+        ctx: Context | None = None,
+    ) -> dict | str:
+        """Returns a ranked summary of a project in a single call.
+
+        The project is walked once (skipping VCS, virtualenv and cache
+        directories and honoring .gitignore files). Files are classified as
+        Python modules, Markdown documents or OpenAPI specs (JSON/YAML files
+        detected by their content), and the most relevant files of each type
+        are outlined in parallel.
+
+        Agent usage guidelines:
+            - Use this tool first when you need to understand an unfamiliar repository.
+            - Use it instead of dir_tree followed by many python_outline, markdown_outline and OpenAPI calls.
+            - Follow up with the specific outline tools for files you need in detail.
+            - Do not use for reading file contents.
+
+        Path requirements:
+            - The path must not contain URL-encoding (e.g., '%').
+            - The path must be absolute.
+            - The path must exist on disk.
+        Example paths:
+            - Windows: "C:\\Users\\User\\project"
+            - Linux: "/home/user/project"
+
+        Args:
+            root_path (str): Absolute path to the project root directory.
+            max_files_per_type (int): Maximum number of files summarized per type. Default is 20.
+                Top-level, non-test files and entry points (README, __init__, main, ...) rank first.
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
+                Defaults to server setting (markdown by default).
+            max_chars (int | None): Character budget for markdown output (about 4 characters per token).
+                When set, docstrings and descriptions are shortened to their first line, long lists
+                are collapsed and output stops at the budget. Defaults to server setting (no limit).
+
+        Returns:
+            dict | str: Project summary in the requested format or error.
+        """
+        logger.info(
+            "project_overview tool called",
+            root_path=root_path,
+            max_files_per_type=max_files_per_type,
+            output_format=output_format,
+            max_chars=max_chars,
+        )
+        # Get default output format from settings if not provided
+        if output_format is None:
+            settings = get_settings()
+            output_format = settings.default_output_format.value
+        budget = OutputBudget(
+            max_chars if max_chars is not None else get_settings().max_output_chars
+        )
+
+        def run(progress: Progress) -> dict | str:
+            # Path check
+            valid, msg = is_valid_path(root_path)
+            if not valid:
+                logger.error(
+                    "Invalid path for project_overview", root_path=root_path, error=msg
+                )
+                if output_format == "markdown":
+                    return f"**Error:** {msg}"
+                return {"error": msg}
+            try:
+                overview = build_project_overview(
+                    root_path, max_files_per_type, progress
+                )
+                logger.debug(
+                    "Built project overview",
+                    root_path=root_path,
+                    files=overview["files"],
+                )
+                if output_format == "markdown":
+                    return format_project_overview_as_markdown(overview, budget)
+                if output_format == "compact":
+                    return compact(overview)
+                return overview
+            except Exception as e:
+                logger.error(
+                    "Error building project overview", root_path=root_path, error=str(e)
+                )
+                if output_format == "markdown":
+                    return f"**Error:** {str(e)}"
+                return {"error": str(e)}
+
+        return await run_with_progress(ctx, run)
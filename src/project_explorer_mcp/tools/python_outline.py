@@ -1,12 +1,17 @@
 """Python outline tool for the MCP server."""
 
-import ast
-
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from loguru import logger
 
+from ..config.logging import debug_enabled, summarize
 from ..config.settings import get_settings
-from ..utils import format_python_outline_as_markdown, is_valid_path, strip_empty
+from ..utils.compact import compact
+from ..utils.concurrency import PENDING, map_within
+from ..utils.formatters import OutputBudget, format_python_outline_as_markdown
+from ..utils.general import validate_paths
+from ..utils.progress import Progress, run_with_progress
+from ..utils.python import get_python_outline
+from ..utils.reader import SkippedFile
 
 
 def register_python_outline(mcp: FastMCP):
@@ -17,8 +22,12 @@ def register_python_outline(mcp: FastMCP):
     """
 
     @mcp.tool()
-    def python_outline(
-        paths: list[str], output_format: str | None = None
+    async def python_outline(
+        paths: list[str],
+        output_format: str | None = None,
+        max_chars: int | None = None,
+        time_budget: float | None = None,
+        ctx: Context | None = None,
     ) -> dict | str:
         """
         Returns an outline for each Python file: imports, classes, functions, docstrings.
@@ -26,6 +35,11 @@ def register_python_outline(mcp: FastMCP):
         Agent usage guidelines:
             - Use this tool when you need to understand the structure of Python code files, such as for code review, navigation, or documentation generation.
             - Use when you need to extract or display the list of imports, classes, functions, and their docstrings from Python files.
+            - Use output_format="compact" for many files: imports, classes and functions are returned as tables of columns and rows.
+            - Invalid or unparsable files get an "error" entry; the other files are still outlined.
+            - Binary and non-UTF-8 files get a "skipped" entry. Files over the server's size limit
+              are outlined up to the limit and get a "truncated" note.
+            - With time_budget, files not outlined in time are returned as {"pending": true}; request only those again.
             - Do not use for non-Python files or for reading file contents in detail.
 
         Path requirements:
@@ -38,100 +52,105 @@ def register_python_outline(mcp: FastMCP):
 
         Args:
             paths (list[str]): List of absolute paths to Python files.
-            output_format (str | None): Output format ('json' or 'markdown').
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
                 Defaults to server setting (markdown by default).
+            max_chars (int | None): Character budget for markdown output (about 4 characters per token).
+                When set, docstrings and descriptions are shortened to their first line, long lists
+                are collapsed and output stops at the budget. Defaults to server setting (no limit).
+            time_budget (float | None): Seconds to spend outlining files. Files not finished by then
+                are marked as pending. Defaults to server setting (no limit).
         Returns:
             dict | str: Outline for each file in the requested format.
         """
         logger.info(
-            "python_outline tool called", paths=paths, output_format=output_format
+            "python_outline tool called",
+            paths=summarize(paths),
+            output_format=output_format,
+            max_chars=max_chars,
+            time_budget=time_budget,
         )
         # Get default output format from settings if not provided
         if output_format is None:
             settings = get_settings()
             output_format = settings.default_output_format.value
+        budget = OutputBudget(
+            max_chars if max_chars is not None else get_settings().max_output_chars
+        )
 
-        # Path check
-        for path in paths:
-            valid, msg = is_valid_path(path)
-            if not valid:
-                logger.error("Invalid path for python_outline", path=path, error=msg)
-                error_result = {path: {"error": msg}}
-                if output_format == "markdown":
-                    return format_python_outline_as_markdown(error_result)
-                return error_result
-        try:
-            result = {}
-            for path in paths:
-                outline: dict[str, object] = {}
+        if time_budget is None:
+            time_budget = get_settings().time_budget
+
+        def run(progress: Progress) -> dict | str:
+            # Path check: every path is stat'ed once; invalid paths get an error
+            # entry and do not stop the other files from being outlined.
+            stats, errors = validate_paths(paths)
+            if errors:
+                logger.warning(
+                    "Invalid paths for python_outline", paths=summarize(list(errors))
+                )
+
+            def outline_file(path: str) -> dict:
+                """Build the outline of a single file."""
+                # Files queued before a cancellation are skipped.
+                progress.check()
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        source = f.read()
-                    tree = ast.parse(source)
-                    docstring = ast.get_docstring(tree)
-                    if docstring:
-                        outline["docstring"] = docstring
-                    imports: list[dict[str, object]] = []
-                    classes: list[dict[str, object]] = []
-                    functions: list[dict[str, object]] = []
-                    for node in tree.body:
-                        if isinstance(node, ast.Import):
-                            for n in node.names:
-                                imports.append({"name": n.name, "line": node.lineno})
-                        elif isinstance(node, ast.ImportFrom):
-                            mod = node.module or ""
-                            for n in node.names:
-                                import_name = f"{mod}.{n.name}" if mod else n.name
-                                imports.append(
-                                    {"name": import_name, "line": node.lineno}
-                                )
-                        elif isinstance(node, ast.ClassDef):
-                            cls = {"name": node.name, "line": node.lineno}
-                            cdoc = ast.get_docstring(node)
-                            if cdoc:
-                                cls["docstring"] = cdoc
-                            methods = []
-                            for item in node.body:
-                                if isinstance(item, ast.FunctionDef):
-                                    mdoc = ast.get_docstring(item)
-                                    method = {"name": item.name, "line": item.lineno}
-                                    if mdoc:
-                                        method["docstring"] = mdoc
-                                    methods.append(method)
-                            if methods:
-                                cls["methods"] = methods
-                            classes.append(cls)
-                        elif isinstance(node, ast.FunctionDef):
-                            fdoc = ast.get_docstring(node)
-                            func = {"name": node.name, "line": node.lineno}
-                            if fdoc:
-                                func["docstring"] = fdoc
-                            functions.append(func)
-                    if imports:
-                        outline["imports"] = imports
-                    if classes:
-                        outline["classes"] = classes
-                    if functions:
-                        outline["functions"] = functions
-                    logger.debug(
-                        "Parsed Python file outline",
-                        path=path,
-                        imports=len(imports),
-                        classes=len(classes),
-                        functions=len(functions),
-                    )
+                    record = get_python_outline(path, stats[path])
+                    if debug_enabled():
+                        logger.debug(
+                            "Parsed Python file outline",
+                            path=path,
+                            imports=len(record.imports),
+                            classes=len(record.classes),
+                            functions=len(record.functions),
+                        )
+                    # Cached records are turned into the JSON shape here, at
+                    # the output boundary.
+                    outline = record.to_dict()
+                except SkippedFile as e:
+                    logger.warning("Skipped Python file", path=path, reason=str(e))
+                    outline = {"skipped": str(e)}
                 except Exception as e:
                     logger.error("Error parsing Python file", path=path, error=str(e))
                     outline = {"error": str(e)}
-                result[path] = strip_empty(outline)
+                progress.advance()
+                return outline
+
+            try:
+                # Files are outlined concurrently; results keep the input order.
+                progress.total = len(stats)
+                outlines = dict(
+                    zip(stats, map_within(outline_file, stats, time_budget))
+                )
+                result: dict[str, dict] = {}
+                pending = 0
+                for path in dict.fromkeys(paths):
+                    if path in errors:
+                        result[path] = {"error": errors[path]}
+                        continue
+                    outline = outlines[path]
+                    if outline is PENDING:
+                        result[path] = {"pending": True}
+                        pending += 1
+                    else:
+                        result[path] = outline
+                if pending:
+                    logger.warning(
+                        "python_outline time budget exhausted",
+                        pending=pending,
+                        time_budget=time_budget,
+                    )
+
+                # Format output based on requested format
+                if output_format == "markdown":
+                    return format_python_outline_as_markdown(result, budget)
+                if output_format == "compact":
+                    return compact(result)
+                return result
+            except Exception as e:
+                logger.error("Error in python_outline tool", error=str(e))
+                if output_format == "markdown":
+                    error_dict: dict[str, dict[str, str]] = {"error": {"error": str(e)}}
+                    return format_python_outline_as_markdown(error_dict)
+                return {"error": str(e)}
 
-            # Format output based on requested format
-            if output_format == "markdown":
-                return format_python_outline_as_markdown(result)
-            return result
-        except Exception as e:
-            logger.error("Error in python_outline tool", error=str(e))
-            if output_format == "markdown":
-                error_dict: dict[str, dict[str, str]] = {"error": {"error": str(e)}}
-                return format_python_outline_as_markdown(error_dict)
-            return {"error": str(e)}
+        return await run_with_progress(ctx, run)
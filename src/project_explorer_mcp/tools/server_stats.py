@@ -0,0 +1,47 @@
+"""Server statistics tool for the MCP server."""
+
+from fastmcp import FastMCP
+from loguru import logger
+
+from ..config.settings import get_settings
+from ..utils.compact import compact
+from ..utils.formatters import format_server_stats_as_markdown
+from ..utils.metrics import metrics
+
+
+def register_server_stats(mcp: FastMCP):
+    """Registers the server_stats tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance.
+    """
+
+    @mcp.tool()
+    def server_stats(output_format: str | None = None) -> dict | str:
+        """Returns call counts, latency percentiles, output sizes and cache hit ratios.
+
+        Agent usage guidelines:
+            - Use this tool to find slow or failing tools and to check cache effectiveness.
+            - Do not use for exploring project files.
+
+        Args:
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
+                Defaults to server setting (markdown by default).
+
+        Returns:
+            dict | str: Metrics per tool (calls, errors, p50/p95/p99 latency over the
+                last 1000 calls, output bytes) and per cache (entries, hits, project index
+                hits, misses, hit ratio) in the requested format.
+        """
+        logger.info("server_stats tool called", output_format=output_format)
+        # Get default output format from settings if not provided
+        if output_format is None:
+            settings = get_settings()
+            output_format = settings.default_output_format.value
+
+        snapshot = metrics.snapshot()
+        if output_format == "markdown":
+            return format_server_stats_as_markdown(snapshot)
+        if output_format == "compact":
+            return compact(snapshot)
+        return snapshot
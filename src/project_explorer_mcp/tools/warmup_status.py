@@ -0,0 +1,49 @@
+"""Warm-up status tool for the MCP server."""
+
+from fastmcp import FastMCP
+from loguru import logger
+
+from ..config.settings import get_settings
+from ..utils.compact import compact
+from ..utils.formatters import format_warmup_status_as_markdown
+from ..utils.warmup import get_warmup_status
+
+
+def register_warmup_status(mcp: FastMCP):
+    """Registers the warmup_status tool with the MCP server.
+
+    Args:
+        mcp: FastMCP server instance.
+    """
+
+    @mcp.tool()
+    def warmup_status(output_format: str | None = None) -> dict | str:
+        """Returns whether the background pre-indexing started with the server is done.
+
+        Agent usage guidelines:
+            - Use this tool to check whether the configured roots and specs have been indexed
+              before sending many outline or OpenAPI calls at once.
+            - Tools work during the warm-up as well; it pauses while they run.
+            - Do not use for exploring project files.
+
+        Args:
+            output_format (str | None): Output format ('json', 'markdown' or 'compact').
+                Defaults to server setting (markdown by default).
+
+        Returns:
+            dict | str: Warm-up state ('disabled', 'pending', 'running', 'ready',
+                'cancelled' or 'failed'), number of indexed and discovered lookups,
+                errors, elapsed seconds and the configured roots and specs.
+        """
+        logger.info("warmup_status tool called", output_format=output_format)
+        # Get default output format from settings if not provided
+        if output_format is None:
+            settings = get_settings()
+            output_format = settings.default_output_format.value
+
+        status = get_warmup_status()
+        if output_format == "markdown":
+            return format_warmup_status_as_markdown(status)
+        if output_format == "compact":
+            return compact(status)
+        return status
@@ -1,30 +1,139 @@
-"""Utility functions for the project explorer MCP server."""
+"""Utility functions for the project explorer MCP server.
 
-from .formatters import (
-    format_markdown_outline_as_markdown,
-    format_python_outline_as_markdown,
-)
-from .general import format_output, is_valid_path, strip_empty
-from .openapi import (
-    format_openapi_details,
-    format_openapi_text,
-    get_openapi_operation_details,
-    iter_openapi_operations,
-    load_openapi_spec,
+Names are imported from their submodules on first access, so that a tool
+module only loads the utilities (and their dependencies) it uses.
+"""
+
+import importlib
+
+# Imported eagerly: their submodules share a name with a function, and a
+# lazily imported submodule would shadow it as an attribute of the package.
+from .compact import compact, to_table
+from .metrics import (
+    MetricsMiddleware,
+    MetricsRegistry,
+    dump_metrics,
+    metrics,
+    start_metrics_dump,
 )
 
-__all__ = [
+# Public name -> submodule defining it.
+_EXPORTS = {
     # General utilities
-    "strip_empty",
-    "is_valid_path",
-    "format_output",
+    "strip_empty": ".general",
+    "is_valid_path": ".general",
+    "validate_paths": ".general",
+    "format_output": ".general",
+    "dumps_json": ".general",
+    # Filesystem utilities
+    "DEFAULT_IGNORED_DIRS": ".filesystem",
+    "IgnoreRules": ".filesystem",
+    "glob_to_regex": ".filesystem",
+    "iter_files": ".filesystem",
+    "list_directory": ".filesystem",
+    "walk_files": ".filesystem",
+    # Project index
+    "ProjectIndex": ".index",
+    "get_index": ".index",
+    # Concurrency utilities
+    "get_executor": ".concurrency",
+    "map_ordered": ".concurrency",
+    "map_within": ".concurrency",
+    "PENDING": ".concurrency",
+    "SingleFlight": ".concurrency",
     # Formatters
-    "format_python_outline_as_markdown",
-    "format_markdown_outline_as_markdown",
+    "CHARS_PER_TOKEN": ".formatters",
+    "LineWriter": ".formatters",
+    "OutputBudget": ".formatters",
+    "join_lines": ".formatters",
+    "format_python_outline_as_markdown": ".formatters",
+    "format_markdown_outline_as_markdown": ".formatters",
+    "format_project_overview_as_markdown": ".formatters",
+    "format_server_stats_as_markdown": ".formatters",
+    "format_warmup_status_as_markdown": ".formatters",
+    # Markdown utilities
+    "MarkdownHeading": ".markdown",
+    "MarkdownSection": ".markdown",
+    "scan_markdown_headings": ".markdown",
+    "outline_markdown_file": ".markdown",
+    "get_markdown_headings": ".markdown",
+    "read_markdown_section": ".markdown",
+    # File reading
+    "JSONStream": ".jsonstream",
+    "FileBuffer": ".reader",
+    "SkippedFile": ".reader",
+    "open_buffer": ".reader",
+    "max_file_bytes": ".reader",
+    "truncation_note": ".reader",
+    # Python utilities
+    "PythonImport": ".python",
+    "PythonFunction": ".python",
+    "PythonClass": ".python",
+    "PythonOutline": ".python",
+    "outline_python_source": ".python",
+    "outline_python_file": ".python",
+    "get_python_outline": ".python",
+    # Profiling
+    "ProfilingMiddleware": ".profiling",
+    # Progress
+    "CallCancelled": ".progress",
+    "Progress": ".progress",
+    "run_with_progress": ".progress",
+    "active_calls": ".progress",
+    # Concurrency limits
+    "ConcurrencyLimitMiddleware": ".limits",
+    "call_limiter": ".limits",
+    # Warm-up
+    "Warmup": ".warmup",
+    "start_warmup": ".warmup",
+    "get_warmup_status": ".warmup",
+    # Project overview
+    "build_project_overview": ".overview",
     # OpenAPI utilities
-    "load_openapi_spec",
-    "iter_openapi_operations",
-    "get_openapi_operation_details",
-    "format_openapi_details",
-    "format_openapi_text",
+    "OpenAPIOperation": ".openapi",
+    "load_openapi_spec": ".openapi",
+    "get_openapi_spec": ".openapi",
+    "get_openapi_model": ".openapi",
+    "looks_like_openapi": ".openapi",
+    "iter_openapi_operations": ".openapi",
+    "scan_openapi_operations": ".openapi",
+    "get_openapi_operations": ".openapi",
+    "get_openapi_operation_details": ".openapi",
+    "format_openapi_details": ".openapi",
+    "format_openapi_text": ".openapi",
+    # Normalized OpenAPI model
+    "OpenAPIModel": ".openapi_model",
+    "OpenAPIModelOperation": ".openapi_model",
+    "OpenAPIParameter": ".openapi_model",
+    "normalize_openapi": ".openapi_model",
+    # OpenAPI schema catalog
+    "SchemaInfo": ".openapi_schemas",
+    "build_schema_catalog": ".openapi_schemas",
+    "get_schema_catalog": ".openapi_schemas",
+    "format_schema_list_markdown": ".openapi_schemas",
+    "format_schema_details_markdown": ".openapi_schemas",
+}
+
+__all__ = [
+    "compact",
+    "to_table",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "metrics",
+    "dump_metrics",
+    "start_metrics_dump",
+    *_EXPORTS,
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
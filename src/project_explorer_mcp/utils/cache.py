@@ -0,0 +1,163 @@
+"""In-memory caches for data derived from files.
+
+Caches created with a ``decode`` function are also backed by the persistent
+project index (see ``utils/index.py``) when it is enabled. Concurrent misses
+of the same file version are coalesced: one caller computes the value and
+the others wait for it, so sessions starting together parse a file once.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from .concurrency import SingleFlight
+from .index import get_index
+
+T = TypeVar("T")
+
+# All caches created in the process, for statistics.
+_caches: list["FileCache"] = []
+
+
+class FileCache(Generic[T]):
+    """Thread-safe LRU cache of values computed from files.
+
+    Entries are keyed by path and validated against the file's modification
+    time and size, so an edited file is recomputed on its next lookup. Caches
+    of values that depend on settings (e.g. ``max_file_bytes``) also validate
+    entries against a ``variant`` string describing those settings, so a
+    reloaded setting recomputes them and processes with other settings keep
+    separate entries in the project index.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        decode: Callable[[Any], T] | None = None,
+        variant: Callable[[], str] | None = None,
+    ):
+        """Create a cache.
+
+        Args:
+            name: Cache name used in statistics and as the kind of its
+                entries in the project index.
+            maxsize: Maximum number of files kept in the cache.
+            decode: Function rebuilding a value from its JSON form. Values of
+                caches without it are not stored in the project index.
+            variant: Function describing the current settings the values
+                depend on.
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.decode = decode
+        self.variant = variant
+        self.hits = 0
+        self.index_hits = 0
+        self.shared = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[tuple[int, int], str, T]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight: SingleFlight[tuple[str, tuple[int, int], str], T] = SingleFlight()
+        _caches.append(self)
+
+    def get_or_compute(
+        self,
+        path: str,
+        compute: Callable[[str], T],
+        st: os.stat_result | None = None,
+    ) -> T:
+        """Return the cached value for path, computing it on a miss.
+
+        On a miss the project index is read first, and computed values are
+        stored in it. A miss while another thread loads the same version of
+        the file waits for that thread and returns its value.
+
+        Args:
+            path: Path to the file.
+            compute: Function building the value from the path.
+            st: Fresh ``stat`` result of the path, e.g. from
+                ``validate_paths``; the file is stat'ed when omitted.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        if st is None:
+            st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        variant = self.variant() if self.variant is not None else ""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (signature, variant):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+
+        value, shared = self._flight.do(
+            (path, signature, variant),
+            lambda: self._load(path, signature, variant, compute),
+        )
+        if shared:
+            with self._lock:
+                self.shared += 1
+        return value
+
+    def _load(
+        self,
+        path: str,
+        signature: tuple[int, int],
+        variant: str,
+        compute: Callable[[str], T],
+    ) -> T:
+        """Read a value from the project index or compute it, and cache it."""
+        decode = self.decode
+        index = get_index() if decode is not None else None
+        kind = f"{self.name}:{variant}" if variant else self.name
+        stored = index.get(kind, path, signature) if index is not None else None
+        if decode is not None and stored is not None:
+            value = decode(stored)
+            with self._lock:
+                self.index_hits += 1
+        else:
+            with self._lock:
+                self.misses += 1
+            value = compute(path)
+            if index is not None:
+                index.put(kind, path, signature, value)
+        with self._lock:
+            self._entries[path] = (signature, variant, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.index_hits = 0
+            self.shared = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int | float | str]:
+        """Return cache statistics."""
+        with self._lock:
+            hits = self.hits + self.index_hits + self.shared
+            lookups = hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "hits": self.hits,
+                "index_hits": self.index_hits,
+                "shared": self.shared,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+def cache_stats() -> list[dict[str, int | float | str]]:
+    """Return the statistics of every file cache."""
+    return [cache.stats() for cache in _caches]
@@ -0,0 +1,60 @@
+"""Compact JSON output utilities for the project explorer MCP server.
+
+The ``compact`` output format keeps the JSON structure of a tool result but
+stores lists of objects column-wise, so keys are sent once per list instead
+of once per item::
+
+    [{"name": "a", "line": 1}, {"name": "b", "line": 7}]
+    -> {"columns": ["name", "line"], "rows": [["a", 1], ["b", 7]]}
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+
+def to_table(
+    items: Sequence[Mapping[str, Any]], columns: Sequence[str] | None = None
+) -> dict[str, list]:
+    """Convert a list of objects into a column-oriented table.
+
+    By default, columns are the union of the item keys in order of first
+    appearance. Items without a key get None in that column. Cell values are
+    compacted recursively.
+
+    Args:
+        items: Objects to tabulate.
+        columns: Fixed column names, e.g. to keep the header of empty tables.
+
+    Returns:
+        Dict with ``columns`` (list of keys) and ``rows`` (list of value lists).
+    """
+    if columns is None:
+        keys: dict[str, None] = {}
+        for item in items:
+            keys.update(dict.fromkeys(item))
+        columns = list(keys)
+    return {
+        "columns": list(columns),
+        "rows": [[compact(item.get(c)) for c in columns] for item in items],
+    }
+
+
+def compact(data: Any) -> Any:
+    """Convert a JSON-like result to the compact output format.
+
+    Non-empty lists made only of objects become tables (see ``to_table``);
+    all other values keep their shape.
+
+    Args:
+        data: JSON-like data (dicts, lists and scalars).
+
+    Returns:
+        The compacted data.
+    """
+    if isinstance(data, Mapping):
+        return {k: compact(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        if data and all(isinstance(item, Mapping) for item in data):
+            return to_table(data)
+        return [compact(item) for item in data]
+    return data
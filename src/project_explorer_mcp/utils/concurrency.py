@@ -0,0 +1,188 @@
+"""Concurrency helpers for the project explorer MCP server.
+
+All tool calls, from every client, share one worker pool. The pool queues
+tasks in FIFO order, so ``map_ordered`` and ``map_within`` keep at most
+``max_workers`` tasks of a call queued or running at once and submit the
+next item as one finishes: a call over thousands of files then takes turns
+with the tasks of other calls instead of queueing all its files ahead of
+them.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from enum import Enum
+from typing import Final, Generic, Hashable, Literal, TypeVar
+
+from ..config.settings import get_settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+K = TypeVar("K", bound=Hashable)
+
+
+class _Pending(Enum):
+    """Type of the ``PENDING`` sentinel; an enum so that ``is`` narrows it."""
+
+    PENDING = "pending"
+
+
+# Result of map_within for items not processed before the deadline.
+PENDING: Final = _Pending.PENDING
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use.
+
+    When ``max_workers`` changed since, e.g. after a settings reload, a pool
+    of the new size replaces the old one. The old pool is not shut down:
+    calls still holding it keep submitting to it, and its threads exit once
+    it is drained and garbage-collected.
+    """
+    global _executor
+    max_workers = get_settings().max_workers
+    with _executor_lock:
+        if _executor is None or _executor._max_workers != max_workers:
+            _executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="project-explorer"
+            )
+        return _executor
+
+
+def _submit_bounded(
+    fn: Callable[[T], R], items: Iterable[T], deadline: float | None = None
+) -> list[Future[R]]:
+    """Submit fn for items to the shared pool, a pool's worth at a time.
+
+    Blocks until every item is submitted, or until ``deadline`` (a
+    ``time.monotonic`` value) passes; items not submitted by then are left
+    out of the returned futures. Each item goes to the current pool, so
+    a batch running across a settings reload moves to the resized pool.
+    """
+    slots = threading.BoundedSemaphore(max(get_settings().max_workers, 1))
+    futures: list[Future[R]] = []
+    for item in items:
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        if not slots.acquire(timeout=timeout):
+            break
+        future = get_executor().submit(fn, item)
+        future.add_done_callback(lambda _: slots.release())
+        futures.append(future)
+    return futures
+
+
+def map_ordered(fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+    """Apply fn to items in the shared worker pool.
+
+    Results are yielded in input order once all items are submitted, each as
+    soon as it (and all before it) is ready. Single items are processed
+    inline.
+
+    Args:
+        fn: Function to apply.
+        items: Items to process.
+
+    Returns:
+        Iterator over results in input order.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return map(fn, items)
+    return (future.result() for future in _submit_bounded(fn, items))
+
+
+def map_within(
+    fn: Callable[[T], R], items: Iterable[T], timeout: float | None
+) -> list[R | Literal[_Pending.PENDING]]:
+    """Apply fn to items in the shared worker pool, waiting at most timeout.
+
+    Items not finished by the deadline are reported as ``PENDING``. Items
+    that have not started are cancelled or never submitted; those already
+    running finish in the background, so their results still reach the file
+    caches.
+
+    Args:
+        fn: Function to apply.
+        items: Items to process.
+        timeout: Seconds to wait for results, or None to wait for all.
+
+    Returns:
+        Results in input order, with ``PENDING`` for unfinished items.
+    """
+    if timeout is None:
+        return list(map_ordered(fn, items))
+    items = list(items)
+    deadline = time.monotonic() + timeout
+    futures = _submit_bounded(fn, items, deadline)
+    wait(futures, timeout=max(deadline - time.monotonic(), 0))
+    results: list[R | Literal[_Pending.PENDING]] = []
+    for future in futures:
+        if future.done() and not future.cancelled():
+            results.append(future.result())
+        else:
+            future.cancel()
+            results.append(PENDING)
+    results.extend(PENDING for _ in items[len(futures) :])
+    return results
+
+
+class SingleFlight(Generic[K, R]):
+    """Coalesces concurrent computations of the same key.
+
+    The first caller of a key runs the computation; callers arriving while
+    it runs wait for it and share its result or exception instead of
+    computing it again. If the computation is interrupted by a
+    ``BaseException`` that is not an ``Exception``, such as the cancellation
+    of the first caller's tool call, the waiting callers compute again
+    instead. Nothing is kept once the computation finishes, so later callers
+    compute again (or, for the file caches, hit the cache).
+    """
+
+    def __init__(self) -> None:
+        """Create a group with no computation in flight."""
+        self._calls: dict[K, Future[R]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: K, fn: Callable[[], R]) -> tuple[R, bool]:
+        """Return the result of fn, sharing a computation of key in flight.
+
+        Args:
+            key: Key identifying the computation.
+            fn: Function computing the result.
+
+        Returns:
+            (result, shared), where shared is True if the result came from
+            another caller's computation.
+        """
+        while True:
+            with self._lock:
+                waiting = self._calls.get(key)
+                if waiting is None:
+                    future: Future[R] = Future()
+                    self._calls[key] = future
+            if waiting is None:
+                break
+            error = waiting.exception()
+            if error is None:
+                return waiting.result(), True
+            if isinstance(error, Exception):
+                raise error
+            # The computation was interrupted: compute again.
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result, False
+
+    def _finish(self, key: K) -> None:
+        """Remove a computation, before its waiters are woken up."""
+        with self._lock:
+            del self._calls[key]
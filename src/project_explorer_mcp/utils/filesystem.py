@@ -0,0 +1,251 @@
+"""Filesystem traversal utilities for the project explorer MCP server."""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from loguru import logger
+
+from .cache import FileCache
+
+# Directories that never contain project files worth exploring.
+DEFAULT_IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def glob_to_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a glob pattern into a regex matching POSIX relative paths.
+
+    ``*`` and ``?`` do not cross ``/``; ``**`` matches any number of
+    directories; ``[...]`` and ``[!...]`` are character classes.
+
+    Args:
+        pattern: Glob pattern, e.g. ``docs/**/*.md``.
+
+    Returns:
+        Compiled pattern to be used with ``fullmatch``.
+    """
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern.startswith("**", i):
+                if pattern.startswith("/", i + 2):
+                    out.append("(?:.*/)?")
+                    i += 3
+                else:
+                    out.append(".*")
+                    i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : end].replace("\\", "\\\\")
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+                continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile("".join(out))
+
+
+class IgnoreRules:
+    """A subset of .gitignore semantics used to prune directory walks.
+
+    Supported: comments, ``!`` negation, trailing ``/`` for directories only,
+    patterns anchored by a ``/`` and ``**``. Patterns without a ``/`` match a
+    name at any depth below the directory of the .gitignore file.
+    """
+
+    def __init__(self, rules: tuple[tuple[str, re.Pattern[str], bool, bool], ...] = ()):
+        """Create rules; use ``extend`` to add patterns.
+
+        Args:
+            rules: Tuples of (base directory, regex, negated, directories only).
+        """
+        self._rules = rules
+
+    def extend(self, base: str, lines: Iterable[str]) -> "IgnoreRules":
+        """Return new rules with patterns from a .gitignore in ``base``.
+
+        Args:
+            base: POSIX path of the .gitignore directory relative to the root.
+            lines: Lines of the .gitignore file.
+        """
+        rules = list(self._rules)
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            if "/" in line:
+                pattern = line.lstrip("/")
+            else:
+                pattern = "**/" + line
+            rules.append((base, glob_to_regex(pattern), negated, dir_only))
+        return IgnoreRules(tuple(rules))
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether a path relative to the walk root is ignored.
+
+        Args:
+            rel_path: POSIX path relative to the walk root.
+            is_dir: Whether the path is a directory.
+        """
+        ignored = False
+        for base, regex, negated, dir_only in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + "/"):
+                    continue
+                subject = rel_path[len(base) + 1 :]
+            else:
+                subject = rel_path
+            if regex.fullmatch(subject):
+                ignored = not negated
+        return ignored
+
+
+def _scan_directory(path: str) -> list[tuple[str, bool]]:
+    """List a directory as sorted (name, is_dir) tuples."""
+    with os.scandir(path) as it:
+        entries = [(e.name, e.is_dir()) for e in it]
+    entries.sort()
+    return entries
+
+
+# Listings of recently scanned directories. A directory's modification time
+# changes when entries are added, removed or renamed.
+listing_cache: FileCache[list[tuple[str, bool]]] = FileCache(
+    "dir_listing", decode=lambda data: [tuple(e) for e in data]
+)
+
+
+def list_directory(path: str) -> list[tuple[str, bool]]:
+    """Return the entries of a directory, using the listing cache.
+
+    Args:
+        path: Path to the directory.
+
+    Returns:
+        Sorted (name, is_dir) tuples; symlinks to directories count as
+        directories.
+    """
+    return listing_cache.get_or_compute(path, _scan_directory)
+
+
+def _read_gitignore(path: str) -> list[str]:
+    """Read a .gitignore file, returning no lines if it cannot be read."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            return f.readlines()
+    except OSError:
+        return []
+
+
+def iter_files(
+    root: str,
+    ignored_dirs: frozenset[str] = DEFAULT_IGNORED_DIRS,
+    use_gitignore: bool = True,
+) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Walk the files below root in a single ``os.scandir`` traversal.
+
+    File types come from the directory entries without extra ``stat`` calls.
+    ``ignored_dirs`` are never entered and, when ``use_gitignore`` is set,
+    .gitignore files found along the way are honored. Symlinked directories
+    are not followed.
+
+    Args:
+        root: Absolute path of the directory to walk.
+        ignored_dirs: Directory names that are never entered.
+        use_gitignore: Whether to apply .gitignore rules.
+
+    Yields:
+        Tuples of (POSIX path relative to root, directory entry).
+    """
+    stack: list[tuple[str, str, IgnoreRules]] = [(root, "", IgnoreRules())]
+    while stack:
+        directory, rel_dir, rules = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug("Skipping unreadable directory", path=directory, error=str(e))
+            continue
+        if use_gitignore:
+            for entry in entries:
+                if entry.name == ".gitignore":
+                    rules = rules.extend(rel_dir, _read_gitignore(entry.path))
+                    break
+        for entry in entries:
+            rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if entry.name not in ignored_dirs and not rules.is_ignored(rel, True):
+                    stack.append((entry.path, rel, rules))
+            elif not rules.is_ignored(rel, False):
+                yield rel, entry
+
+
+def walk_files(
+    root: str,
+    patterns: Iterable[str] = ("**/*",),
+    ignored_dirs: frozenset[str] = DEFAULT_IGNORED_DIRS,
+    use_gitignore: bool = True,
+) -> list[str]:
+    """Find files below root matching any glob pattern.
+
+    See ``iter_files`` for the traversal and ignore rules.
+
+    Args:
+        root: Absolute path of the directory to walk.
+        patterns: Glob patterns relative to root, e.g. ``**/*.md``.
+        ignored_dirs: Directory names that are never entered.
+        use_gitignore: Whether to apply .gitignore rules.
+
+    Returns:
+        Sorted absolute paths of matching files.
+    """
+    regexes = [glob_to_regex(p.replace(os.sep, "/").lstrip("/")) for p in patterns]
+    found = [
+        entry.path
+        for rel, entry in iter_files(root, ignored_dirs, use_gitignore)
+        if any(r.fullmatch(rel) for r in regexes)
+    ]
+    found.sort()
+    return found
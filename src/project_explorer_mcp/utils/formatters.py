@@ -1,99 +1,493 @@
 """Formatting utility functions for the project explorer MCP server."""
 
+import io
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TextIO, TypeVar
+
+T = TypeVar("T")
+
+# Rough number of characters per token used to turn token budgets into
+# character budgets.
+CHARS_PER_TOKEN = 4
+
+# Shown for files a batch tool did not process within its time budget.
+PENDING_NOTE = "*Pending: not processed within the time budget, request it again.*"
+
+
+class LineWriter:
+    """Writes lines to a text stream as they are produced.
+
+    The output equals ``"\\n".join(lines).strip()`` without keeping the lines
+    in memory: whitespace at the end of a line is held back until more
+    content follows, so trailing whitespace is never written.
+    """
+
+    def __init__(self, out: TextIO):
+        """Create a writer.
+
+        Args:
+            out: Stream to write to, e.g. ``io.StringIO`` or an open file.
+        """
+        self._out = out
+        self._pending = ""
+        self._started = False
+
+    def write_line(self, line: str) -> None:
+        """Write one line.
+
+        Args:
+            line: Line without the separating newline.
+        """
+        if self._started:
+            self._pending += "\n"
+        else:
+            line = line.lstrip()
+        body = line.rstrip()
+        if not body:
+            if self._started:
+                self._pending += line
+            return
+        self._out.write(self._pending)
+        self._out.write(body)
+        self._pending = line[len(body) :]
+        self._started = True
 
-def format_python_outline_as_markdown(data: dict) -> str:
-    """Converts python_outline JSON data to markdown format.
+
+def join_lines(lines: Iterable[str]) -> str:
+    """Join lines with newlines, writing each one as it is produced.
+
+    Equivalent to ``"\\n".join(lines)`` for generators, without first
+    collecting the lines into a list.
 
     Args:
-        data: Dictionary with file paths as keys and outline data as values.
+        lines: Output lines.
 
     Returns:
-        Markdown formatted string.
+        The joined string.
+    """
+    out = io.StringIO()
+    first = True
+    for line in lines:
+        if not first:
+            out.write("\n")
+        out.write(line)
+        first = False
+    return out.getvalue()
+
+
+class OutputBudget:
+    """Size budget and shaping rules for markdown output.
+
+    Without a limit, output is rendered in full. With ``max_chars`` set, long
+    texts such as docstrings and descriptions are shortened to their first
+    line, long lists are collapsed with a count of the omitted items, and
+    rendering stops as soon as the budget is used up. Formatters produce
+    their lines lazily, so output past the budget is never built.
     """
-    lines = []
 
+    def __init__(
+        self,
+        max_chars: int | None = None,
+        max_text_chars: int = 160,
+        max_items: int = 25,
+    ):
+        """Create a budget.
+
+        Args:
+            max_chars: Maximum output size in characters, or None for no limit.
+            max_text_chars: Maximum length of a shortened text.
+            max_items: Maximum number of items rendered per list.
+        """
+        self.max_chars = max_chars
+        self.max_text_chars = max_text_chars
+        self.max_items = max_items
+        self.truncated = False
+
+    @classmethod
+    def from_tokens(cls, max_tokens: int | None, **kwargs) -> "OutputBudget":
+        """Create a budget from an approximate token count.
+
+        Args:
+            max_tokens: Maximum output size in tokens, or None for no limit.
+            **kwargs: Other arguments passed to the constructor.
+        """
+        max_chars = None if max_tokens is None else max_tokens * CHARS_PER_TOKEN
+        return cls(max_chars, **kwargs)
+
+    @property
+    def limited(self) -> bool:
+        """Whether a size limit is set."""
+        return self.max_chars is not None
+
+    def shorten(self, text: str) -> str:
+        """Shorten a text to its first line when the output is limited.
+
+        Args:
+            text: Text to shorten.
+
+        Returns:
+            The text, or its first non-empty line cut to max_text_chars.
+        """
+        if not self.limited:
+            return text
+        first = next((line.strip() for line in text.splitlines() if line.strip()), "")
+        if len(first) > self.max_text_chars:
+            first = first[: self.max_text_chars - 1].rstrip() + "…"
+        return first
+
+    def take(self, items: Sequence[T]) -> tuple[Sequence[T], int]:
+        """Limit a list to max_items when the output is limited.
+
+        Args:
+            items: Items to render.
+
+        Returns:
+            Tuple of (items to render, number of omitted items).
+        """
+        if not self.limited or len(items) <= self.max_items:
+            return items, 0
+        return items[: self.max_items], len(items) - self.max_items
+
+    def write(self, lines: Iterable[str], out: TextIO) -> None:
+        """Write lines to a stream, stopping at the budget.
+
+        Args:
+            lines: Output lines, usually produced lazily by a generator.
+            out: Stream to write to.
+        """
+        writer = LineWriter(out)
+        if self.max_chars is None:
+            for line in lines:
+                writer.write_line(line)
+            return
+        note = f"\n\n*[Output truncated at {self.max_chars} characters]*"
+        # A budget too small for the note holds as much of the note as fits.
+        if len(note) > self.max_chars:
+            note = note.lstrip("\n")[: max(self.max_chars, 0)]
+        limit = max(self.max_chars - len(note), 0)
+        size = 0
+        for line in lines:
+            size += len(line) + 1
+            if size > limit:
+                self.truncated = True
+                break
+            writer.write_line(line)
+        if self.truncated:
+            out.write(note)
+
+    def render(self, lines: Iterable[str]) -> str:
+        """Render lines into a string, stopping at the budget.
+
+        Lines are written to an in-memory stream as they are produced instead
+        of being collected and joined.
+
+        Args:
+            lines: Output lines, usually produced lazily by a generator.
+
+        Returns:
+            The output, with a truncation note if the budget ran out.
+        """
+        out = io.StringIO()
+        self.write(lines, out)
+        return out.getvalue()
+
+
+def _python_outline_lines(data: dict, budget: OutputBudget) -> Iterator[str]:
+    """Yield the markdown lines of a python_outline result."""
     for path, outline in data.items():
-        lines.append(f"## {path}\n")
+        yield f"## {path}\n"
 
         # Handle error case
         if isinstance(outline, dict) and "error" in outline:
-            lines.append(f"**Error:** {outline['error']}\n")
+            yield f"**Error:** {outline['error']}\n"
+            continue
+        if isinstance(outline, dict) and outline.get("pending"):
+            yield f"{PENDING_NOTE}\n"
             continue
+        if isinstance(outline, dict) and "skipped" in outline:
+            yield f"**Skipped:** {outline['skipped']}\n"
+            continue
+        if isinstance(outline, dict) and "truncated" in outline:
+            yield f"*Truncated: {outline['truncated']}*\n"
 
         # Module docstring
         if isinstance(outline, dict) and "docstring" in outline:
-            lines.append(f"**Module docstring:**\n{outline['docstring']}\n")
+            yield f"**Module docstring:**\n{budget.shorten(outline['docstring'])}\n"
 
         # Imports
         if isinstance(outline, dict) and "imports" in outline:
-            lines.append("### Imports\n")
-            for imp in outline["imports"]:
+            yield "### Imports\n"
+            imports, omitted = budget.take(outline["imports"])
+            for imp in imports:
                 line_num = imp.get("line", "")
-                lines.append(f"- `{imp['name']}` (line {line_num})")
-            lines.append("")
+                yield f"- `{imp['name']}` (line {line_num})"
+            if omitted:
+                yield f"- *... {omitted} more imports*"
+            yield ""
 
         # Classes
         if isinstance(outline, dict) and "classes" in outline:
-            lines.append("### Classes\n")
-            for cls in outline["classes"]:
+            yield "### Classes\n"
+            classes, omitted = budget.take(outline["classes"])
+            for cls in classes:
                 line_num = cls.get("line", "")
-                lines.append(f"#### `{cls['name']}` (line {line_num})\n")
+                yield f"#### `{cls['name']}` (line {line_num})\n"
                 if "docstring" in cls:
-                    lines.append(f"{cls['docstring']}\n")
+                    yield f"{budget.shorten(cls['docstring'])}\n"
                 if "methods" in cls:
-                    lines.append("**Methods:**")
-                    for method in cls["methods"]:
+                    yield "**Methods:**"
+                    methods, omitted_methods = budget.take(cls["methods"])
+                    for method in methods:
                         method_line = method.get("line", "")
-                        lines.append(f"- `{method['name']}` (line {method_line})")
+                        yield f"- `{method['name']}` (line {method_line})"
                         if "docstring" in method:
-                            lines.append(f"  - {method['docstring']}")
-                    lines.append("")
+                            yield f"  - {budget.shorten(method['docstring'])}"
+                    if omitted_methods:
+                        yield f"- *... {omitted_methods} more methods*"
+                    yield ""
+            if omitted:
+                yield f"*... {omitted} more classes*\n"
 
         # Functions
         if isinstance(outline, dict) and "functions" in outline:
-            lines.append("### Functions\n")
-            for func in outline["functions"]:
+            yield "### Functions\n"
+            functions, omitted = budget.take(outline["functions"])
+            for func in functions:
                 line_num = func.get("line", "")
-                lines.append(f"#### `{func['name']}` (line {line_num})\n")
+                yield f"#### `{func['name']}` (line {line_num})\n"
                 if "docstring" in func:
-                    lines.append(f"{func['docstring']}\n")
-
-        lines.append("---\n")
+                    yield f"{budget.shorten(func['docstring'])}\n"
+            if omitted:
+                yield f"*... {omitted} more functions*\n"
 
-    return "\n".join(lines).strip()
+        yield "---\n"
 
 
-def format_markdown_outline_as_markdown(data: dict) -> str:
-    """Converts markdown_outline JSON data to markdown format.
+def format_python_outline_as_markdown(
+    data: dict, budget: OutputBudget | None = None
+) -> str:
+    """Converts python_outline JSON data to markdown format.
 
     Args:
-        data: Dictionary with file paths as keys and heading lists as values.
+        data: Dictionary with file paths as keys and outline data as values.
+        budget: Optional output budget; unlimited by default.
 
     Returns:
         Markdown formatted string.
     """
-    lines = []
+    budget = budget or OutputBudget()
+    return budget.render(_python_outline_lines(data, budget))
 
+
+def _markdown_outline_lines(data: dict, budget: OutputBudget) -> Iterator[str]:
+    """Yield the markdown lines of a markdown_outline result."""
     for path, headings in data.items():
-        lines.append(f"## {path}\n")
+        yield f"## {path}\n"
 
         # Handle error case
         if headings and isinstance(headings[0], dict) and "error" in headings[0]:
-            lines.append(f"**Error:** {headings[0]['error']}\n")
+            yield f"**Error:** {headings[0]['error']}\n"
+            continue
+        if headings and isinstance(headings[0], dict) and headings[0].get("pending"):
+            yield f"{PENDING_NOTE}\n"
             continue
+        if headings and isinstance(headings[0], dict) and "skipped" in headings[0]:
+            yield f"**Skipped:** {headings[0]['skipped']}\n"
+            continue
+
+        # Trailing markers: {"omitted": N} from max_headings_per_file and
+        # {"truncated": note} for files over the size limit.
+        markers: dict = {}
+        while (
+            headings and isinstance(headings[-1], dict) and "level" not in headings[-1]
+        ):
+            markers.update(headings[-1])
+            headings = headings[:-1]
+        if "truncated" in markers:
+            yield f"*Truncated: {markers['truncated']}*\n"
 
-        if not headings:
-            lines.append("*No headings found*\n")
+        if not headings and not markers.get("omitted"):
+            yield "*No headings found*\n"
             continue
 
-        lines.append("### Document Structure\n")
-        for heading in headings:
+        yield "### Document Structure\n"
+        shown, omitted = budget.take(headings)
+        omitted += markers.get("omitted", 0)
+        for heading in shown:
             level = heading.get("level", 1)
             text = heading.get("text", "")
             line_num = heading.get("line", "")
             indent = "  " * (level - 1)
-            lines.append(f"{indent}- **H{level}:** {text} (line {line_num})")
+            yield f"{indent}- **H{level}:** {text} (line {line_num})"
+        if omitted:
+            yield f"- *... {omitted} more headings*"
+
+        yield "\n---\n"
+
+
+def format_markdown_outline_as_markdown(
+    data: dict, budget: OutputBudget | None = None
+) -> str:
+    """Converts markdown_outline JSON data to markdown format.
+
+    Args:
+        data: Dictionary with file paths as keys and heading lists as values.
+        budget: Optional output budget; unlimited by default.
+
+    Returns:
+        Markdown formatted string.
+    """
+    budget = budget or OutputBudget()
+    return budget.render(_markdown_outline_lines(data, budget))
+
+
+def _project_overview_lines(data: dict, budget: OutputBudget) -> Iterator[str]:
+    """Yield the markdown lines of a project_overview result."""
+    yield f"# Project Overview: {data.get('root', '')}\n"
+
+    files = data.get("files", {})
+    yield (
+        f"**Files:** {files.get('python', 0)} Python, "
+        f"{files.get('markdown', 0)} Markdown, "
+        f"{files.get('openapi', 0)} OpenAPI, {files.get('other', 0)} other\n"
+    )
+
+    if data.get("directories"):
+        yield "## Directories\n"
+        directories, omitted_dirs = budget.take(list(data["directories"].items()))
+        for name, count in directories:
+            yield f"- `{name}` ({count} files)"
+        if omitted_dirs:
+            yield f"- *... {omitted_dirs} more directories*"
+        yield ""
+
+    omitted = data.get("omitted", {})
+    sections = (
+        ("python", "Python Modules"),
+        ("markdown", "Markdown Documents"),
+        ("openapi", "OpenAPI Specifications"),
+    )
+    for kind, title in sections:
+        entries = data.get(kind) or []
+        if not entries:
+            continue
+        yield f"## {title}\n"
+        for entry in entries:
+            if "error" in entry:
+                details = f"**Error:** {entry['error']}"
+            elif kind == "python":
+                parts = []
+                if entry.get("docstring"):
+                    parts.append(budget.shorten(entry["docstring"]))
+                if entry.get("classes"):
+                    parts.append(f"Classes: {', '.join(entry['classes'])}")
+                if entry.get("functions"):
+                    parts.append(f"Functions: {', '.join(entry['functions'])}")
+                details = " | ".join(parts)
+            elif kind == "markdown":
+                details = "; ".join(entry.get("headings", []))
+            else:
+                title_text = entry.get("title") or "Untitled"
+                version = f" v{entry['version']}" if entry.get("version") else ""
+                details = (
+                    f"{title_text}{version} ({entry.get('operations', 0)} operations)"
+                )
+            yield f"- `{entry['path']}`" + (f" — {details}" if details else "")
+        if omitted.get(kind):
+            yield f"- *... {omitted[kind]} more files*"
+        yield ""
+
+
+def format_project_overview_as_markdown(
+    data: dict, budget: OutputBudget | None = None
+) -> str:
+    """Converts project_overview JSON data to markdown format.
 
-        lines.append("\n---\n")
+    Args:
+        data: Overview dictionary as built by build_project_overview.
+        budget: Optional output budget; unlimited by default.
 
-    return "\n".join(lines).strip()
+    Returns:
+        Markdown formatted string.
+    """
+    budget = budget or OutputBudget()
+    return budget.render(_project_overview_lines(data, budget))
+
+
+def _server_stats_lines(data: dict, budget: OutputBudget) -> Iterator[str]:
+    """Yield the markdown lines of a server_stats result."""
+    yield "# Server Statistics\n"
+    yield f"**Uptime:** {data.get('uptime_seconds', 0):.0f} s\n"
+
+    tools = data.get("tools") or {}
+    yield "## Tools\n"
+    if not tools:
+        yield "*No tool calls recorded*\n"
+    else:
+        yield "| Tool | Calls | Errors | p50 ms | p95 ms | p99 ms | Mean bytes | Max bytes |"
+        yield "|------|-------|--------|--------|--------|--------|------------|-----------|"
+        for name, m in tools.items():
+            yield (
+                f"| {name} | {m['calls']} | {m['errors']} | {m['p50_ms']} | "
+                f"{m['p95_ms']} | {m['p99_ms']} | {m['mean_output_bytes']} | "
+                f"{m['max_output_bytes']} |"
+            )
+        yield ""
+
+    caches = data.get("caches") or []
+    if caches:
+        yield "## Caches\n"
+        yield "| Cache | Entries | Hits | Index hits | Shared | Misses | Hit ratio |"
+        yield "|-------|---------|------|------------|--------|--------|-----------|"
+        for c in caches:
+            yield (
+                f"| {c['name']} | {c['size']} | {c['hits']} | "
+                f"{c.get('index_hits', 0)} | {c.get('shared', 0)} | {c['misses']} | "
+                f"{c['hit_ratio']:.1%} |"
+            )
+
+
+def format_server_stats_as_markdown(
+    data: dict, budget: OutputBudget | None = None
+) -> str:
+    """Converts server_stats JSON data to markdown format.
+
+    Args:
+        data: Metrics snapshot as returned by MetricsRegistry.snapshot.
+        budget: Optional output budget; unlimited by default.
+
+    Returns:
+        Markdown formatted string.
+    """
+    budget = budget or OutputBudget()
+    return budget.render(_server_stats_lines(data, budget))
+
+
+def _warmup_status_lines(data: dict) -> Iterator[str]:
+    """Yield the markdown lines of a warmup_status result."""
+    yield "# Warm-up\n"
+    if data["state"] == "disabled":
+        yield "*No warm-up roots or specs are configured.*"
+        return
+    total = data.get("total")
+    yield f"- **State:** {data['state']}"
+    yield f"- **Indexed:** {data['done']}" + (f" of {total}" if total else "")
+    yield f"- **Errors:** {data['errors']}"
+    yield f"- **Elapsed:** {data['elapsed_s']} s"
+    for key, title in (("roots", "Roots"), ("specs", "Specs")):
+        if data.get(key):
+            yield f"\n## {title}\n"
+            for path in data[key]:
+                yield f"- `{path}`"
+
+
+def format_warmup_status_as_markdown(data: dict) -> str:
+    """Converts warmup_status JSON data to markdown format.
+
+    Args:
+        data: Status as returned by ``get_warmup_status``.
+
+    Returns:
+        Markdown formatted string.
+    """
+    return join_lines(_warmup_status_lines(data))
@@ -3,9 +3,19 @@
 import json
 import os
 import urllib.parse
+from collections.abc import Iterable
 
+import pydantic_core
 from loguru import logger
 
+from ..config.logging import debug_enabled
+from .concurrency import map_ordered
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional, used when installed
+    orjson = None
+
 
 def strip_empty(d):
     """Recursively removes empty fields and lists from a dictionary/list."""
@@ -20,29 +30,78 @@ def strip_empty(d):
     return d
 
 
-def is_valid_path(path: str) -> tuple[bool, str]:
-    """Checks the path for validity: no URL-encoding, absolute, exists.
-
-    Args:
-        path: Path to validate.
+def _check_path(path: str) -> tuple[os.stat_result | None, str]:
+    """Validate a path with a single ``stat`` call.
 
     Returns:
-        Tuple of (is_valid, error_message).
+        Tuple of (stat result or None, error message).
     """
     # URL-encoding check
     if "%" in path or urllib.parse.unquote(path) != path:
         logger.warning("Path contains URL-encoding", path=path)
-        return False, "The path contains URL-encoding or invalid characters."
+        return None, "The path contains URL-encoding or invalid characters."
     # Absolute path check
     if not os.path.isabs(path):
         logger.warning("Path is not absolute", path=path)
-        return False, "The path is not absolute."
+        return None, "The path is not absolute."
     # Existence check
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
         logger.warning("Path does not exist", path=path)
-        return False, "The path does not exist on disk."
-    logger.debug("Path validation passed", path=path)
-    return True, ""
+        return None, "The path does not exist on disk."
+    if debug_enabled():
+        logger.debug("Path validation passed", path=path)
+    return st, ""
+
+
+def is_valid_path(path: str) -> tuple[bool, str]:
+    """Checks the path for validity: no URL-encoding, absolute, exists.
+
+    Args:
+        path: Path to validate.
+
+    Returns:
+        Tuple of (is_valid, error_message).
+    """
+    st, error = _check_path(path)
+    return st is not None, error
+
+
+# Path lists longer than this are stat'ed in the shared worker pool.
+CONCURRENT_VALIDATION_THRESHOLD = 64
+
+
+def validate_paths(
+    paths: Iterable[str],
+) -> tuple[dict[str, os.stat_result], dict[str, str]]:
+    """Validate many paths at once, like ``is_valid_path``.
+
+    Every path is checked, so all invalid paths can be reported together.
+    Each path is stat'ed once; the stat results can be passed on to the file
+    caches so the files are not stat'ed again. Long lists are checked
+    concurrently.
+
+    Args:
+        paths: Paths to validate; duplicates are checked once.
+
+    Returns:
+        Tuple of (stat result per valid path, error message per invalid
+        path), both in input order.
+    """
+    unique = list(dict.fromkeys(paths))
+    if len(unique) > CONCURRENT_VALIDATION_THRESHOLD:
+        checks = map_ordered(_check_path, unique)
+    else:
+        checks = map(_check_path, unique)
+    stats: dict[str, os.stat_result] = {}
+    errors: dict[str, str] = {}
+    for path, (st, error) in zip(unique, checks):
+        if st is None:
+            errors[path] = error
+        else:
+            stats[path] = st
+    return stats, errors
 
 
 def format_output(data: dict | str, output_format: str) -> dict | str:
@@ -70,3 +129,25 @@ def format_output(data: dict | str, output_format: str) -> dict | str:
         return json.dumps(data, indent=2)
 
     return str(data)
+
+
+def dumps_json(data) -> str:
+    """Serialize a tool result to compact JSON.
+
+    Uses orjson when it is installed and falls back to pydantic-core's
+    encoder otherwise. Values neither encoder supports are converted with
+    ``str``, as FastMCP's default serializer does.
+
+    Args:
+        data: Data to serialize.
+
+    Returns:
+        JSON string without indentation.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str).decode()
+        except TypeError:
+            # e.g. non-string dict keys or integers beyond 64 bits
+            pass
+    return pydantic_core.to_json(data, fallback=str).decode()
@@ -0,0 +1,167 @@
+"""Persistent project index shared by server processes.
+
+When the ``index_path`` setting names a file, values derived from files
+(directory listings, Python outlines, Markdown headings, OpenAPI operation
+lists) are also stored in a SQLite database in WAL mode, keyed by kind, path,
+modification time and size. Several server processes can use the same
+database: readers do not block each other or the writer, so a new session
+starts with the index built by earlier ones. The index is a cache: values are
+plain JSON, a stale entry is simply recomputed, and database errors only
+disable it for the failing lookup. ``sqlite3`` is only imported when the
+index is enabled.
+"""
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..config.settings import get_settings
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# Bumped when the stored JSON shape or contents of any kind change; older
+# databases are cleared when opened.
+SCHEMA_VERSION = 3
+
+# Seconds a writer waits for another process holding the write lock.
+BUSY_TIMEOUT = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (kind, path)
+) WITHOUT ROWID
+"""
+
+
+class ProjectIndex:
+    """SQLite store of JSON values keyed by file signature.
+
+    Each thread uses its own connection, as sqlite3 connections must not be
+    shared between threads.
+    """
+
+    def __init__(self, path: str):
+        """Open or create the index database.
+
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS entries")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> "sqlite3.Connection":
+        """Return the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            conn.execute("PRAGMA journal_mode = WAL")
+            # Durable enough for a cache, and no fsync per write in WAL mode.
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, kind: str, path: str, signature: tuple[int, int]) -> Any | None:
+        """Return the stored value of a file if its signature still matches.
+
+        Args:
+            kind: Kind of value, e.g. the name of the cache.
+            path: Path of the file or directory.
+            signature: (mtime_ns, size) of the file.
+
+        Returns:
+            The decoded JSON value, or None if missing or stale.
+        """
+        import sqlite3
+
+        try:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM entries WHERE kind = ? AND path = ? "
+                    "AND mtime_ns = ? AND size = ?",
+                    (kind, path, *signature),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.warning("Project index lookup failed", path=path, error=str(e))
+            return None
+        return None if row is None else json.loads(row[0])
+
+    def put(self, kind: str, path: str, signature: tuple[int, int], value: Any) -> None:
+        """Store the value of a file, replacing any older one.
+
+        Args:
+            kind: Kind of value.
+            path: Path of the file or directory.
+            signature: (mtime_ns, size) of the file the value was computed from.
+            value: JSON-serializable value; tuples are stored as arrays.
+        """
+        import sqlite3
+
+        data = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (kind, path, *signature, data),
+                )
+        except sqlite3.Error as e:
+            logger.warning("Project index write failed", path=path, error=str(e))
+
+    def count(self) -> dict[str, int]:
+        """Return the number of stored entries per kind."""
+        rows = (
+            self._connect()
+            .execute("SELECT kind, COUNT(*) FROM entries GROUP BY kind")
+            .fetchall()
+        )
+        return dict(rows)
+
+
+_index: ProjectIndex | None = None
+_index_path: str | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> ProjectIndex | None:
+    """Return the project index of the ``index_path`` setting, if enabled.
+
+    The database is opened on first use and reopened when the setting
+    changes. An index that cannot be opened is logged and left disabled.
+    """
+    global _index, _index_path
+    path = get_settings().index_path
+    if path == _index_path:
+        return _index
+    with _index_lock:
+        if path != _index_path:
+            index = None
+            if path:
+                import sqlite3
+
+                try:
+                    index = ProjectIndex(path)
+                    logger.info("Opened project index", path=path)
+                except (sqlite3.Error, OSError) as e:
+                    logger.error("Cannot open project index", path=path, error=str(e))
+            _index, _index_path = index, path
+    return _index
@@ -0,0 +1,118 @@
+"""Incremental reading of large JSON documents.
+
+``JSONStream`` walks the members of JSON objects without loading the whole
+document: it keeps a window of the text in memory, decodes one value at a
+time with the C decoder of the ``json`` module, and reads more of the file
+when a value crosses the end of the window. Callers descend into the objects
+they care about and decode or skip the other values, so peak memory is the
+largest single value read rather than the whole object graph.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Iterator
+from typing import IO, Any
+
+# Bytes read from the file at a time; a value longer than the window doubles
+# it.
+CHUNK_BYTES = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONStream:
+    """Reader of the values of a JSON text from a binary file, in order."""
+
+    def __init__(self, f: IO[bytes], chunk_bytes: int = CHUNK_BYTES):
+        """Create a reader positioned at the start of the document.
+
+        Args:
+            f: File opened in binary mode; the text must be UTF-8.
+            chunk_bytes: Bytes read from the file at a time.
+        """
+        self._file = f
+        self._chunk = chunk_bytes
+        self._utf8 = codecs.getincrementaldecoder("utf-8-sig")()
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> None:
+        """Read ``size`` more bytes, dropping the text already consumed."""
+        data = self._file.read(size)
+        self._eof = not data
+        self._buf = self._buf[self._pos :] + self._utf8.decode(data, final=self._eof)
+        self._pos = 0
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        while True:
+            match = _WHITESPACE.match(self._buf, self._pos)
+            assert match is not None  # the pattern matches the empty string
+            self._pos = match.end()
+            if self._pos < len(self._buf) or self._eof:
+                return self._buf[self._pos : self._pos + 1]
+            self._fill(self._chunk)
+
+    def expect(self, char: str) -> None:
+        """Consume the next character, which must be ``char``.
+
+        Raises:
+            ValueError: if another character or the end of the text follows.
+        """
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found or 'end of document'!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode and return the next value.
+
+        Raises:
+            ValueError: if the text at the current position is not valid JSON.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._fill(max(self._chunk, len(self._buf)))
+                continue
+            # A number ending the window may continue in the file.
+            if end == len(self._buf) and not self._eof:
+                self._fill(self._chunk)
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        """Consume the next value."""
+        self.value()
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the object at the current position.
+
+        After each key the caller must consume its value with ``value``,
+        ``skip`` or a nested ``members`` before asking for the next key.
+
+        Raises:
+            ValueError: if the text is not a valid JSON object.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ValueError("Expected an object key")
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self._pos += 1
+                return
+            self.expect(",")
@@ -0,0 +1,102 @@
+"""Concurrency limits of tool calls for a server shared by several clients.
+
+With the HTTP or SSE transport one server process serves every connected
+client, so they share its caches, project index and worker pool. Two limits
+keep the clients from starving each other:
+
+- ``ConcurrencyLimitMiddleware`` lets each client session run at most
+  ``max_calls_per_client`` tool calls at a time; further calls of that
+  session wait for one of its own calls to finish, while other sessions go
+  ahead.
+- ``call_limiter`` bounds the worker threads running tool work across all
+  sessions (see ``run_with_progress``) to ``max_concurrent_calls``.
+"""
+
+from anyio import CapacityLimiter
+from anyio.lowlevel import RunVar
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from loguru import logger
+
+from ..config.settings import get_settings
+
+# Key of calls made without an MCP session, e.g. directly in tests.
+NO_SESSION = "default"
+
+# One limiter per event loop, as anyio primitives belong to the loop that
+# uses them.
+_call_limiter: RunVar[CapacityLimiter] = RunVar("_call_limiter")
+
+
+def call_limiter() -> CapacityLimiter:
+    """Return the limiter of worker threads running tool work.
+
+    Created on first use in the running event loop with
+    ``max_concurrent_calls`` tokens; resized when the setting changes.
+    """
+    tokens = max(get_settings().max_concurrent_calls, 1)
+    try:
+        limiter = _call_limiter.get()
+    except LookupError:
+        limiter = CapacityLimiter(tokens)
+        _call_limiter.set(limiter)
+    if limiter.total_tokens != tokens:
+        limiter.total_tokens = tokens
+    return limiter
+
+
+def _session_key(context: MiddlewareContext) -> str:
+    """Return the key of the client session making a request."""
+    ctx = context.fastmcp_context
+    if ctx is None or ctx.request_context is None:
+        return NO_SESSION
+    return ctx.session_id
+
+
+class ConcurrencyLimitMiddleware(Middleware):
+    """Limits the number of concurrent tool calls of each client session."""
+
+    def __init__(self, per_client: int):
+        """Create the middleware.
+
+        Args:
+            per_client: Maximum number of concurrent calls per session; 0 or
+                less disables the limit. May be changed later; sessions with
+                calls running switch to the new limit on their next call.
+        """
+        self.per_client = per_client
+        # Limiters of the sessions with calls running or waiting, and the
+        # number of those calls; a limiter is dropped with its last call.
+        self._limiters: dict[str, CapacityLimiter] = {}
+        self._calls: dict[str, int] = {}
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> ToolResult:
+        """Run a tool call once its session is below the limit."""
+        if self.per_client <= 0:
+            return await call_next(context)
+        key = _session_key(context)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = CapacityLimiter(self.per_client)
+        elif limiter.total_tokens != self.per_client:
+            limiter.total_tokens = self.per_client
+        self._calls[key] = self._calls.get(key, 0) + 1
+        try:
+            if not limiter.available_tokens:
+                logger.debug(
+                    "Tool call waiting for session limit",
+                    tool=context.message.name,
+                    session=key,
+                )
+            async with limiter:
+                return await call_next(context)
+        finally:
+            self._calls[key] -= 1
+            if not self._calls[key]:
+                del self._calls[key], self._limiters[key]
+
+    def sessions(self) -> dict[str, int]:
+        """Return the number of running or waiting calls per session."""
+        return dict(self._calls)
@@ -0,0 +1,323 @@
+"""Markdown parsing utilities for the project explorer MCP server."""
+
+import codecs
+import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from .cache import FileCache
+from .reader import max_file_bytes, open_buffer, read_limit_variant
+
+# Lines that can start or end a heading or fenced code block. Everything else
+# is skipped by the regex engine without ever reaching Python code; anchoring
+# on the literal newline lets the engine use its fast literal scan.
+_CANDIDATE = rb"( {0,3})(?:#|`{3,}|~{3,}|=+[ \t]*\r?$|-+[ \t]*\r?$)"
+_CANDIDATE_RE = re.compile(rb"\n(?=" + _CANDIDATE + rb")", re.MULTILINE)
+_FIRST_LINE_CANDIDATE_RE = re.compile(rb"(?=" + _CANDIDATE + rb")", re.MULTILINE)
+_HASH, _BACKTICK, _TILDE, _EQUALS = b"#`~="
+_ATX_RE = re.compile(rb" {0,3}(#{1,6})(?:[ \t]+(.*?))?[ \t]*\r?$")
+_ATX_CLOSING_RE = re.compile(rb"(?:^|[ \t]+)#+$")
+_FENCE_RE = re.compile(rb" {0,3}(`{3,}|~{3,})(.*?)\r?$")
+_FRONT_MATTER_END_RE = re.compile(rb"^(?:---|\.\.\.)[ \t]*\r?$", re.MULTILINE)
+# Paragraph lines that cannot be turned into a setext heading by the line below.
+_NOT_PARAGRAPH_RE = re.compile(rb" {0,3}(?:[>#|<]|[-+*][ \t]|\d{1,9}[.)][ \t])")
+
+
+class MarkdownHeading(NamedTuple):
+    """A heading found by the scanner.
+
+    Attributes:
+        level: Heading level (1-6).
+        text: Heading text without markers.
+        line: 1-based line number of the heading text.
+        offset: Byte offset of the start of the heading line.
+    """
+
+    level: int
+    text: str
+    line: int
+    offset: int
+
+
+class MarkdownSection(NamedTuple):
+    """A slice of a Markdown file starting at a heading.
+
+    Attributes:
+        heading: Heading the section starts with.
+        content: Section text, including the heading line.
+        size: Full size of the section in bytes; for a section running past
+            the outlined part of a large file, the size up to the end of the
+            file.
+        truncated: Whether content was cut at the byte limit or at the end of
+            the outlined part of the file.
+    """
+
+    heading: MarkdownHeading
+    content: str
+    size: int
+    truncated: bool
+
+
+@lru_cache(maxsize=32)
+def _closing_fence_re(char: bytes, length: int) -> re.Pattern[bytes]:
+    """Build a pattern matching the closing line of a fence."""
+    return re.compile(
+        rb"^ {0,3}" + re.escape(char) + rb"{%d,}[ \t]*\r?$" % length, re.MULTILINE
+    )
+
+
+def _line_end(buf, pos: int) -> int:
+    """Return the offset of the newline ending the line at pos (or buffer end)."""
+    end = buf.find(b"\n", pos)
+    return len(buf) if end == -1 else end
+
+
+def _skip_front_matter(buf) -> int:
+    """Return the offset right after a leading YAML front matter block, or 0."""
+    if not (buf[:4] == b"---\n" or buf[:5] == b"---\r\n"):
+        return 0
+    m = _FRONT_MATTER_END_RE.search(buf, buf.find(b"\n") + 1)
+    if m is None:
+        return 0
+    return _line_end(buf, m.start()) + 1
+
+
+def scan_markdown_headings(buf) -> list[MarkdownHeading]:
+    """Extract ATX and setext headings from a Markdown byte buffer in one pass.
+
+    Lines inside fenced code blocks (``` or ~~~) and YAML front matter are
+    ignored. The buffer may be ``bytes`` or a read-only ``mmap``.
+
+    Args:
+        buf: Markdown document as a bytes-like object.
+
+    Returns:
+        Headings in document order.
+    """
+    count: Callable[[bytes, int, int], int]
+    if isinstance(buf, bytes):
+        count = buf.count
+    else:
+
+        def count_slice(sub: bytes, start: int, end: int) -> int:
+            return buf[start:end].count(sub)
+
+        count = count_slice
+
+    headings: list[MarkdownHeading] = []
+    size = len(buf)
+    pos = _skip_front_matter(buf)
+    # Line numbers are only computed when a heading is emitted: ``line`` is the
+    # number of the line starting at offset ``counted``.
+    line = 1
+    counted = 0
+    # Offset up to which lines were consumed by a heading or fence; a setext
+    # underline never applies to a line before it.
+    consumed = pos
+
+    while True:
+        m = _FIRST_LINE_CANDIDATE_RE.match(buf) if pos == 0 else None
+        if m is None:
+            m = _CANDIDATE_RE.search(buf, max(pos - 1, 0))
+            if m is None:
+                break
+        start = m.end()
+        marker = buf[start + len(m.group(1))]
+        end = buf.find(b"\n", start)
+        if end == -1:
+            end = size
+        pos = end + 1
+
+        if marker == _HASH:
+            atx = _ATX_RE.match(buf, start, end)
+            if atx is None:
+                continue
+            consumed = pos
+            text = atx.group(2)
+            if text and text.endswith(b"#"):
+                text = _ATX_CLOSING_RE.sub(b"", text).rstrip()
+            if text:
+                line += count(b"\n", counted, start)
+                counted = start
+                headings.append(
+                    MarkdownHeading(
+                        len(atx.group(1)), text.decode("utf-8", "replace"), line, start
+                    )
+                )
+        elif marker == _BACKTICK or marker == _TILDE:
+            fence = _FENCE_RE.match(buf, start, end)
+            if fence is None or (marker == _BACKTICK and b"`" in fence.group(2)):
+                continue
+            close = _closing_fence_re(fence.group(1)[:1], len(fence.group(1))).search(
+                buf, pos
+            )
+            # An unclosed fence runs to the end of the document.
+            if close is None:
+                break
+            end = buf.find(b"\n", close.start())
+            pos = consumed = size + 1 if end == -1 else end + 1
+        else:
+            if start == 0:
+                continue
+            # Walk back over the paragraph the underline ends, up to a blank
+            # line or a line consumed by an earlier heading or fence.
+            lines: list[tuple[int, bytes]] = []
+            line_end = start - 1
+            while line_end > consumed:
+                line_start = buf.rfind(b"\n", 0, line_end) + 1
+                if line_start < consumed:
+                    break
+                text = buf[line_start:line_end].rstrip()
+                if not text:
+                    break
+                lines.append((line_start, text))
+                line_end = line_start - 1
+            # A paragraph does not start with indented code, and a list item,
+            # quote or the like before the underline makes it a thematic
+            # break instead.
+            while lines and lines[-1][1].startswith((b"    ", b"\t")):
+                lines.pop()
+            if not lines or any(_NOT_PARAGRAPH_RE.match(text) for _, text in lines):
+                continue
+            prev_start = lines[-1][0]
+            consumed = pos
+            line += count(b"\n", counted, prev_start)
+            counted = prev_start
+            headings.append(
+                MarkdownHeading(
+                    1 if marker == _EQUALS else 2,
+                    b" ".join(text.strip() for _, text in reversed(lines)).decode(
+                        "utf-8", "replace"
+                    ),
+                    line,
+                    prev_start,
+                )
+            )
+
+    return headings
+
+
+def outline_markdown_file(path: str | Path) -> list[MarkdownHeading]:
+    """Scan a Markdown file and return its headings.
+
+    Only the first ``max_file_bytes`` of the file are scanned.
+
+    Args:
+        path: Path to the Markdown file.
+
+    Returns:
+        Headings in document order.
+
+    Raises:
+        SkippedFile: if the file is binary or not UTF-8 text.
+    """
+    with open_buffer(path, max_file_bytes()) as buf:
+        return scan_markdown_headings(buf.data)
+
+
+# Headings (with byte offsets) of recently outlined files, shared by the
+# outline and section tools; they depend on the read limit.
+headings_cache: FileCache[list[MarkdownHeading]] = FileCache(
+    "markdown_headings",
+    decode=lambda data: [MarkdownHeading(*h) for h in data],
+    variant=read_limit_variant,
+)
+
+
+def get_markdown_headings(
+    path: str, st: os.stat_result | None = None
+) -> list[MarkdownHeading]:
+    """Return the headings of a Markdown file, using the headings cache.
+
+    Args:
+        path: Path to the Markdown file.
+        st: Fresh ``stat`` result of the path, if already known.
+
+    Returns:
+        Headings in document order.
+    """
+    return headings_cache.get_or_compute(path, outline_markdown_file, st)
+
+
+def read_markdown_section(
+    path: str,
+    heading: str | None = None,
+    line: int | None = None,
+    max_bytes: int | None = None,
+) -> MarkdownSection:
+    """Read one section of a Markdown file without reading the rest of it.
+
+    The section runs from the selected heading to the next heading of the same
+    or a higher level. Its byte range comes from the cached outline, so only
+    the section itself is read from disk. Only the first ``max_file_bytes`` of
+    a file are outlined, so a section without a following heading is read up
+    to that limit at most.
+
+    Args:
+        path: Path to the Markdown file.
+        heading: Heading text (exact match first, then case-insensitive).
+        line: Line number of the heading, to pick one of several duplicates.
+        max_bytes: Maximum number of bytes of the section to return.
+
+    Returns:
+        The selected section.
+
+    Raises:
+        ValueError: if no heading matches the selector.
+    """
+    if heading is None and line is None:
+        raise ValueError("Either heading or line must be provided.")
+    headings = get_markdown_headings(path)
+
+    candidates = list(range(len(headings)))
+    if line is not None:
+        candidates = [i for i in candidates if headings[i].line == line]
+    if heading is not None:
+        wanted = heading.strip().lstrip("#").strip()
+        exact = [i for i in candidates if headings[i].text == wanted]
+        candidates = exact or [
+            i for i in candidates if headings[i].text.casefold() == wanted.casefold()
+        ]
+    if not candidates:
+        message = f"Heading not found: {heading!r}" + (
+            f" at line {line}" if line else ""
+        )
+        limit = max_file_bytes()
+        if limit is not None and os.stat(path).st_size > limit:
+            message += f" (only the first {limit:,} bytes of the file are outlined)"
+        raise ValueError(message)
+
+    index = candidates[0]
+    selected = headings[index]
+    end = None
+    for following in headings[index + 1 :]:
+        if following.level <= selected.level:
+            end = following.offset
+            break
+
+    with open(path, "rb") as f:
+        if end is None:
+            # Headings past the outlined part of the file are unknown, so the
+            # section is cut there.
+            end = f.seek(0, 2)
+            outlined = max_file_bytes()
+            size = end - selected.offset
+            if outlined is not None:
+                end = min(end, outlined)
+        else:
+            size = end - selected.offset
+        limit = end - selected.offset
+        if max_bytes is not None:
+            limit = min(limit, max(max_bytes, 0))
+        f.seek(selected.offset)
+        data = f.read(limit)
+
+    truncated = limit < size
+    # An incremental decoder drops a multi-byte character cut at the limit.
+    content = codecs.getincrementaldecoder("utf-8")("replace").decode(
+        data, final=not truncated
+    )
+    return MarkdownSection(selected, content, size, truncated)
@@ -0,0 +1,207 @@
+"""Tool call metrics for the project explorer MCP server."""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from loguru import logger
+from mcp.types import TextContent
+
+from .cache import cache_stats
+
+# Number of recent calls per tool used for latency percentiles.
+WINDOW = 1000
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of sorted values, nearest rank."""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+class ToolMetrics:
+    """Counters and a latency window for one tool."""
+
+    def __init__(self):
+        """Create empty metrics."""
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.output_bytes = 0
+        self.max_output_bytes = 0
+        self.durations: deque[float] = deque(maxlen=WINDOW)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the metrics as a JSON-serializable dict."""
+        ordered = sorted(self.durations)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "p50_ms": round(_percentile(ordered, 50) * 1000, 3),
+            "p95_ms": round(_percentile(ordered, 95) * 1000, 3),
+            "p99_ms": round(_percentile(ordered, 99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+            "output_bytes": self.output_bytes,
+            "mean_output_bytes": self.output_bytes // self.calls if self.calls else 0,
+            "max_output_bytes": self.max_output_bytes,
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe per-tool metrics.
+
+    Call counts, error counts and output sizes are kept for the lifetime of
+    the process; latency percentiles cover the last ``WINDOW`` calls of each
+    tool.
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self.started = time.time()
+        self._tools: dict[str, ToolMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tool: str, seconds: float, output_bytes: int, error: bool) -> None:
+        """Record one tool call.
+
+        Args:
+            tool: Tool name.
+            seconds: Call duration.
+            output_bytes: Size of the response text in bytes.
+            error: Whether the call failed or returned an error result.
+        """
+        with self._lock:
+            metrics = self._tools.get(tool)
+            if metrics is None:
+                metrics = self._tools[tool] = ToolMetrics()
+            metrics.calls += 1
+            metrics.errors += error
+            metrics.total_seconds += seconds
+            metrics.output_bytes += output_bytes
+            metrics.max_output_bytes = max(metrics.max_output_bytes, output_bytes)
+            metrics.durations.append(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return tool and cache metrics as a JSON-serializable dict."""
+        with self._lock:
+            tools = {name: m.snapshot() for name, m in sorted(self._tools.items())}
+        return {
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "tools": tools,
+            "caches": cache_stats(),
+        }
+
+    def reset(self) -> None:
+        """Drop all tool metrics."""
+        with self._lock:
+            self._tools.clear()
+            self.started = time.time()
+
+
+# Process-wide metrics of the server.
+metrics = MetricsRegistry()
+
+
+def _is_error_result(result: ToolResult) -> bool:
+    """Whether a tool reported an error in its result instead of raising."""
+    structured = result.structured_content
+    if isinstance(structured, dict) and structured.keys() == {"result"}:
+        # Results of tools returning dict | str are wrapped by FastMCP.
+        structured = structured["result"]
+    if isinstance(structured, dict) and structured.get("error"):
+        return True
+    first = result.content[0] if result.content else None
+    return isinstance(first, TextContent) and first.text.startswith("**Error:**")
+
+
+def _result_size(result: ToolResult) -> int:
+    """Size of the text content of a tool result in bytes."""
+    return sum(
+        len(block.text.encode("utf-8"))
+        for block in result.content
+        if isinstance(block, TextContent)
+    )
+
+
+class MetricsMiddleware(Middleware):
+    """Records duration, output size and errors of every tool call."""
+
+    def __init__(self, registry: MetricsRegistry = metrics, enabled: bool = True):
+        """Create the middleware.
+
+        Args:
+            registry: Registry receiving the measurements.
+            enabled: Record calls; may be switched later.
+        """
+        self.registry = registry
+        self.enabled = enabled
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> ToolResult:
+        """Time a tool call and record its outcome."""
+        if not self.enabled:
+            return await call_next(context)
+        tool = context.message.name
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+        except Exception:
+            self.registry.record(tool, time.perf_counter() - start, 0, True)
+            raise
+        self.registry.record(
+            tool,
+            time.perf_counter() - start,
+            _result_size(result),
+            _is_error_result(result),
+        )
+        return result
+
+
+def dump_metrics(path: str, registry: MetricsRegistry = metrics) -> None:
+    """Write a metrics snapshot to a JSON file, replacing it atomically.
+
+    Args:
+        path: Destination file.
+        registry: Registry to dump.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(registry.snapshot(), f, indent=2)
+    os.replace(tmp, path)
+
+
+def start_metrics_dump(
+    path: str, interval: float, registry: MetricsRegistry = metrics
+) -> threading.Thread:
+    """Dump metrics to a file every ``interval`` seconds in a daemon thread.
+
+    Args:
+        path: Destination file.
+        interval: Seconds between dumps.
+        registry: Registry to dump.
+
+    Returns:
+        The started thread.
+    """
+
+    def loop() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                dump_metrics(path, registry)
+            except OSError as e:
+                logger.warning("Failed to write metrics", path=path, error=str(e))
+
+    thread = threading.Thread(target=loop, name="metrics-dump", daemon=True)
+    thread.start()
+    return thread
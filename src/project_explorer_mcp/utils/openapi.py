@@ -1,13 +1,51 @@
 """OpenAPI parsing utilities for the project explorer MCP server."""
 
 import json
-from collections.abc import Iterable, Mapping, MutableMapping
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-import yaml
 from loguru import logger
 
+from .cache import FileCache
+from .formatters import OutputBudget, join_lines
+from .jsonstream import JSONStream
+from .openapi_model import (
+    HTTP_METHODS,
+    SCHEMA_REF_PREFIX,
+    OpenAPIModel,
+    OpenAPIModelOperation,
+    normalize_openapi,
+    resolve_pointer,
+)
+from .progress import Progress
+
+
+# Top-level "openapi: 3.x" / "swagger: 2.0" key in JSON or YAML.
+_OPENAPI_MARKER_RE = re.compile(rb"""["']?(?:openapi|swagger)["']?\s*:\s*["']?\d""")
+
+
+def looks_like_openapi(path: str | Path, head_bytes: int = 4096) -> bool:
+    """Check cheaply whether a JSON or YAML file is an OpenAPI document.
+
+    Only the first ``head_bytes`` of the file are read.
+
+    Args:
+        path: Path to the file.
+        head_bytes: Number of bytes to inspect.
+
+    Returns:
+        True if an ``openapi`` or ``swagger`` version key is found.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(head_bytes)
+    except OSError:
+        return False
+    return _OPENAPI_MARKER_RE.search(head) is not None
+
 
 def load_openapi_spec(path: Path) -> MutableMapping[str, Any]:
     """Load OpenAPI spec from JSON or YAML file.
@@ -29,6 +67,9 @@ def load_openapi_spec(path: Path) -> MutableMapping[str, Any]:
     except json.JSONDecodeError:
         logger.debug("Not JSON, trying YAML", path=str(path))
 
+    # Imported on first use: PyYAML is the slowest import of the server.
+    import yaml
+
     try:
         data = yaml.safe_load(text)
         logger.debug("Loaded YAML OpenAPI document", path=str(path))
@@ -39,13 +80,73 @@ def load_openapi_spec(path: Path) -> MutableMapping[str, Any]:
         raise ValueError(f"Failed to parse specification: {exc}") from exc
 
 
-def iter_openapi_operations(
-    spec: Mapping[str, Any],
-) -> Iterable[dict[str, str | list[str] | None]]:
+class OpenAPIOperation(NamedTuple):
+    """An operation of an OpenAPI spec, as listed by ``openapi_list_operations``.
+
+    Attributes:
+        method: Upper-case HTTP method.
+        path: Path template, e.g. ``/users/{id}``.
+        operation_id: operationId, if any.
+        summary: Summary, or the first line of the description.
+        tags: Tags of the operation, shared with the spec.
+    """
+
+    method: str
+    path: str
+    operation_id: str | None
+    summary: str | None
+    tags: Sequence[str]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON shape of the operation."""
+        return {
+            "method": self.method,
+            "path": self.path,
+            "operation_id": self.operation_id,
+            "summary": self.summary,
+            "tags": self.tags,
+        }
+
+
+def _path_item_operations(
+    raw_path: str, methods: Mapping[str, Any]
+) -> Iterator[OpenAPIOperation]:
+    """Yield the operations of one path item."""
+    for method, operation in methods.items():
+        # HTTP verbs in OpenAPI are lower-case (get/post/put/...)
+        if method.lower() not in HTTP_METHODS:
+            # skip parameters or vendor extensions under a path
+            continue
+
+        if not isinstance(operation, Mapping):
+            continue
+
+        summary = operation.get("summary")
+        description = operation.get("description")
+
+        # Prefer a brief summary, fall back to first line of description
+        brief: str | None
+        if summary:
+            brief = str(summary).strip()
+        elif description:
+            brief = str(description).strip().splitlines()[0]
+        else:
+            brief = None
+
+        yield OpenAPIOperation(
+            method.upper(),
+            raw_path,
+            operation.get("operationId"),
+            brief,
+            operation.get("tags", []),
+        )
+
+
+def iter_openapi_operations(spec: Mapping[str, Any]) -> Iterator[OpenAPIOperation]:
     """Yield operations found in the OpenAPI spec.
 
-    For each operation yields a dict with keys: method, path, operation_id,
-    summary.
+    Records are small tuples; call ``to_dict`` on the ones that are returned
+    to the client.
     """
     # OpenAPI 3.x and Swagger 2.0 both use top-level 'paths'
     paths = spec.get("paths")
@@ -54,50 +155,313 @@ def iter_openapi_operations(
         return
 
     for raw_path, methods in paths.items():
-        if not isinstance(methods, Mapping):
-            continue
-        for method, operation in methods.items():
-            # HTTP verbs in OpenAPI are lower-case (get/post/put/...)
-            if method.lower() not in {
-                "get",
-                "post",
-                "put",
-                "delete",
-                "patch",
-                "options",
-                "head",
-                "trace",
-            }:
-                # skip parameters or vendor extensions under a path
-                continue
+        if isinstance(methods, Mapping):
+            yield from _path_item_operations(raw_path, methods)
+
 
-            if not isinstance(operation, Mapping):
+def scan_openapi_operations(
+    path: str, progress: Progress | None = None
+) -> list[OpenAPIOperation]:
+    """List the operations of a JSON spec without loading the whole document.
+
+    Path items are decoded one at a time with ``JSONStream``; other
+    top-level values are skipped, and reading stops after ``paths``.
+
+    Args:
+        path: Path to the JSON spec file.
+        progress: Optional progress, advanced per path item; cancellation is
+            checked between path items.
+
+    Returns:
+        Operations in document order, as ``iter_openapi_operations`` lists
+        them from the loaded spec.
+
+    Raises:
+        ValueError: if the file is not a JSON object.
+    """
+    progress = progress or Progress()
+    operations: list[OpenAPIOperation] = []
+    with open(path, "rb") as f:
+        stream = JSONStream(f)
+        for key in stream.members():
+            if key != "paths" or stream.peek() != "{":
+                stream.skip()
                 continue
+            for raw_path in stream.members():
+                progress.advance()
+                methods = stream.value()
+                if isinstance(methods, Mapping):
+                    operations.extend(_path_item_operations(raw_path, methods))
+            break
+    return operations
+
+
+# Specs from this size on are listed by scanning them when they are JSON,
+# leaving the full parse to the detail calls; smaller ones are loaded, which
+# also serves the detail calls from the spec cache.
+SCAN_MIN_BYTES = 1024 * 1024
+
+
+def _starts_like_json(path: str) -> bool:
+    """Check whether the first non-blank character of a file is "{"."""
+    with open(path, "rb") as f:
+        head = f.read(4096).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return head.startswith(b"{")
+
+
+def _load_model(path: str, progress: Progress | None = None) -> OpenAPIModel:
+    """Load a spec and normalize it."""
+    spec = load_openapi_spec(Path(path))
+    if not isinstance(spec, Mapping):
+        raise ValueError("Specification is not a mapping")
+    return normalize_openapi(spec, progress)
+
+
+# Normalized models, with the parsed documents, of recently read specs; a
+# large spec takes tens of MB in memory, so only a few are kept.
+spec_cache: FileCache[OpenAPIModel] = FileCache("openapi_spec", maxsize=4)
+
+
+def get_openapi_model(
+    path: str, st: os.stat_result | None = None, progress: Progress | None = None
+) -> OpenAPIModel:
+    """Return the normalized model of a spec file, using the spec cache.
+
+    The spec is parsed and normalized once per version; concurrent calls
+    for the same spec share that work. The model is shared by all callers
+    and must not be modified.
+
+    Args:
+        path: Path to the spec file.
+        st: Fresh ``stat`` result of the path, if already known.
+        progress: Optional progress of a call loading the model, advanced
+            per path item.
+
+    Returns:
+        The normalized model, with the parsed document as ``spec``.
+
+    Raises:
+        ValueError: if the file cannot be parsed.
+    """
+    return spec_cache.get_or_compute(path, lambda p: _load_model(p, progress), st)
+
+
+def get_openapi_spec(path: str, st: os.stat_result | None = None) -> Mapping[str, Any]:
+    """Return the parsed document of a spec file, using the spec cache.
+
+    Args:
+        path: Path to the spec file.
+        st: Fresh ``stat`` result of the path, if already known.
+
+    Returns:
+        Parsed document as a dict-like object, which must not be modified.
+
+    Raises:
+        ValueError: if the file cannot be parsed.
+    """
+    return get_openapi_model(path, st).spec
+
+
+def _listed(operation: OpenAPIModelOperation) -> OpenAPIOperation:
+    """Return the listing record of a model operation."""
+    brief = operation.summary
+    if not brief and operation.description:
+        brief = operation.description.splitlines()[0]
+    return OpenAPIOperation(
+        operation.method,
+        operation.path,
+        operation.operation_id,
+        brief,
+        operation.tags,
+    )
+
+
+def _list_operations(
+    path: str, progress: Progress | None = None
+) -> list[OpenAPIOperation]:
+    """List the operations of a spec, scanning large JSON specs."""
+    if os.path.getsize(path) >= SCAN_MIN_BYTES and _starts_like_json(path):
+        try:
+            return scan_openapi_operations(path, progress)
+        except ValueError as e:
+            # e.g. YAML in flow style; the full parse reports real errors.
+            logger.debug("Scanning spec failed, loading it", path=path, error=str(e))
+    model = get_openapi_model(path, progress=progress)
+    return [_listed(op) for op in model.operations]
+
+
+# Operation lists of recently listed specs; with the project index enabled a
+# spec is only parsed once across server processes until it changes.
+operations_cache: FileCache[list[OpenAPIOperation]] = FileCache(
+    "openapi_operations",
+    maxsize=64,
+    decode=lambda data: [OpenAPIOperation(*op) for op in data],
+)
+
+
+def get_openapi_operations(
+    path: str, st: os.stat_result | None = None, progress: Progress | None = None
+) -> list[OpenAPIOperation]:
+    """Return the operations of a spec file, using the operations cache.
+
+    Args:
+        path: Path to the spec file.
+        st: Fresh ``stat`` result of the path, if already known.
+        progress: Optional progress of a call listing the operations,
+            advanced per path item.
 
-            operation_id = operation.get("operationId")
-            summary = operation.get("summary")
-            description = operation.get("description")
+    Returns:
+        Operations in document order.
 
-            # Prefer a brief summary, fall back to first line of description
-            brief: str | None
-            if summary:
-                brief = str(summary).strip()
-            elif description:
-                brief = str(description).strip().splitlines()[0]
+    Raises:
+        ValueError: if the file cannot be parsed.
+    """
+    return operations_cache.get_or_compute(
+        path, lambda p: _list_operations(p, progress), st
+    )
+
+
+def _resolve_ref(model: OpenAPIModel, ref: str) -> Any:
+    """Resolve a local JSON Reference (e.g. '#/components/schemas/IssueBean')."""
+    if not isinstance(ref, str) or not ref.startswith("#/"):
+        return None
+    if ref.startswith(SCHEMA_REF_PREFIX):
+        name = ref[len(SCHEMA_REF_PREFIX) :].replace("~1", "/").replace("~0", "~")
+        return model.schemas.get(name)
+    return resolve_pointer(model.spec, ref)
+
+
+def _summarize_schema(
+    model: OpenAPIModel,
+    schema: Any,
+    expand_refs: bool,
+    depth: int = 0,
+    local_expand_refs: bool = False,
+) -> Any:
+    """Return a short summary or expanded schema depending on expand_refs.
+
+    If expand_refs is False, returns small strings like 'object{a,b}' or 'array[type]'
+    If expand_refs is True, returns resolved mappings (up to a depth limit).
+    """
+    use_expand = local_expand_refs or expand_refs
+    if schema is None:
+        return None
+
+    def summarize(sub: Any) -> Any:
+        return _summarize_schema(model, sub, expand_refs, depth + 1, local_expand_refs)
+
+    # Handle $ref
+    if isinstance(schema, Mapping) and schema.get("$ref"):
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and use_expand:
+            resolved = _resolve_ref(model, ref)
+            # prevent infinite recursion
+            if resolved is not None and depth < 3:
+                return summarize(resolved)
+            return resolved or ref
+        return ref
+
+    if isinstance(schema, Mapping):
+        stype = schema.get("type")
+        desc = schema.get("description")
+        default_val = schema.get("default")
+        result = {"type": stype}
+        if schema.get("nullable"):
+            result["nullable"] = True
+        if desc:
+            result["description"] = desc
+        if default_val is not None:
+            result["default"] = default_val
+        if stype == "object":
+            props = schema.get("properties") or {}
+            if use_expand:
+                # expand properties with descriptions
+                props_expanded = {}
+                for k, v in props.items():
+                    sub = summarize(v)
+                    if isinstance(sub, dict):
+                        props_expanded[k] = sub
+                    else:
+                        props_expanded[k] = {"type": sub}
+                    # add description if available
+                    if isinstance(v, dict) and v.get("description"):
+                        props_expanded[k]["description"] = v["description"]
+                    # add default if available
+                    if isinstance(v, dict) and v.get("default") is not None:
+                        props_expanded[k]["default"] = v["default"]
+                result["properties"] = props_expanded
+            else:
+                # non-expanded short form
+                if isinstance(props, Mapping):
+                    keys = list(props.keys())[:5]
+                    result["properties"] = (
+                        f"{{{', '.join(keys)}{', ...' if len(props) > 5 else ''}}}"
+                    )
+                else:
+                    result["properties"] = "{}"
+        elif stype == "array":
+            item_sum = summarize(schema.get("items"))
+            if use_expand:
+                result["items"] = item_sum
             else:
-                brief = None
-
-            yield {
-                "method": method.upper(),
-                "path": raw_path,
-                "operation_id": operation_id if operation_id is not None else None,
-                "summary": brief,
-                "tags": operation.get("tags", []),
+                result["items"] = item_sum or "?"
+        return result
+
+
+def _operation_record(
+    model: OpenAPIModel, operation: OpenAPIModelOperation, expand_refs: bool
+) -> dict[str, Any]:
+    """Build the detailed record of a model operation."""
+
+    def summarize(schema: Any, local_expand_refs: bool = False) -> Any:
+        return _summarize_schema(
+            model, schema, expand_refs, local_expand_refs=local_expand_refs
+        )
+
+    def content(media: Mapping[str, Any]) -> dict[str, Any]:
+        return {
+            ctype: summarize(schema, local_expand_refs=True)
+            for ctype, schema in media.items()
+        }
+
+    request_body = None
+    if operation.request_body is not None:
+        request_body = {
+            "description": operation.request_body["description"],
+            "content": content(operation.request_body["content"]),
+        }
+    return {
+        "method": operation.method,
+        "path": operation.path,
+        "operation_id": operation.operation_id,
+        "summary": operation.summary,
+        "description": operation.description,
+        "parameters": [
+            {
+                "name": p.name,
+                "in": p.location,
+                "required": p.required,
+                "schema": summarize(p.schema),
+                "description": p.description,
+            }
+            for p in operation.parameters
+        ],
+        "requestBody": request_body,
+        "responses": {
+            code: {
+                "description": response["description"],
+                "content": content(response["content"]),
             }
+            for code, response in operation.responses.items()
+        },
+    }
 
 
 def get_openapi_operation_details(
-    spec: Mapping[str, Any], selectors: Iterable[str], expand_refs: bool = False
+    model: OpenAPIModel,
+    selectors: Iterable[str],
+    expand_refs: bool = False,
+    progress: Progress | None = None,
 ) -> list[dict[str, Any]]:
     """Return full operation records for selectors.
 
@@ -107,394 +471,219 @@ def get_openapi_operation_details(
     - just a path (e.g. "/users/{id}") which will match all methods on that path
 
     Returned records include: method, path, operation_id, summary, description,
-    parameters, requestBody, responses.
-    """
-    results: list[dict[str, str | None]] = []
-
-    paths = spec.get("paths")
-    if not isinstance(paths, Mapping):
-        return results
-
-    # build lookup by operationId for quick access
-    opid_index: dict[str, dict[str, Any]] = {}
-
-    def resolve_ref(ref: str) -> Any:
-        """Resolve a local JSON Reference (e.g. '#/components/schemas/IssueBean')."""
-        if not isinstance(ref, str) or not ref.startswith("#/"):
-            return None
-        parts = ref.lstrip("#/").split("/")
-        node: Any = spec
-        for p in parts:
-            if isinstance(node, Mapping):
-                node = node.get(p)
-            else:
-                return None
-        return node
-
-    def summarize_schema(
-        schema: Any, depth: int = 0, local_expand_refs: bool = False
-    ) -> Any:
-        """Return a short summary or expanded schema depending on expand_refs.
-
-        If expand_refs is False, returns small strings like 'object{a,b}' or 'array[type]'
-        If expand_refs is True, returns resolved mappings (up to a depth limit).
-        """
-        use_expand = local_expand_refs or expand_refs
-        if schema is None:
-            return None
-
-        # Handle $ref
-        if isinstance(schema, Mapping) and schema.get("$ref"):
-            ref = schema.get("$ref")
-            if isinstance(ref, str) and use_expand:
-                resolved = resolve_ref(ref)
-                # prevent infinite recursion
-                if resolved is not None and depth < 3:
-                    return summarize_schema(resolved, depth + 1, local_expand_refs)
-                return resolved or ref
-            return ref
-
-        if isinstance(schema, Mapping):
-            stype = schema.get("type")
-            desc = schema.get("description")
-            default_val = schema.get("default")
-            result = {"type": stype}
-            if desc:
-                result["description"] = desc
-            if default_val is not None:
-                result["default"] = default_val
-            if stype == "object":
-                props = schema.get("properties") or {}
-                if use_expand:
-                    # expand properties with descriptions
-                    props_expanded = {}
-                    for k, v in props.items():
-                        sub = summarize_schema(v, depth + 1, local_expand_refs)
-                        if isinstance(sub, dict):
-                            props_expanded[k] = sub
-                        else:
-                            props_expanded[k] = {"type": sub}
-                        # add description if available
-                        if isinstance(v, dict) and v.get("description"):
-                            props_expanded[k]["description"] = v["description"]
-                        # add default if available
-                        if isinstance(v, dict) and v.get("default") is not None:
-                            props_expanded[k]["default"] = v["default"]
-                    result["properties"] = props_expanded
-                else:
-                    # non-expanded short form
-                    if isinstance(props, Mapping):
-                        keys = list(props.keys())[:5]
-                        result["properties"] = (
-                            f"{{{', '.join(keys)}{', ...' if len(props) > 5 else ''}}}"
-                        )
-                    else:
-                        result["properties"] = "{}"
-            elif stype == "array":
-                items = schema.get("items")
-                item_sum = summarize_schema(items, depth + 1, local_expand_refs)
-                if use_expand:
-                    result["items"] = item_sum
-                else:
-                    result["items"] = item_sum or "?"
-            return result
-
-    for raw_path, methods in paths.items():
-        if not isinstance(methods, Mapping):
-            continue
-        for method, operation in methods.items():
-            if not isinstance(operation, Mapping):
-                continue
-            method_upper = method.upper()
-            operation_id = operation.get("operationId")
-            summary = operation.get("summary")
-            description = operation.get("description")
-            # parameters, requestBody, responses
-            params = []
-            for p in operation.get("parameters") or []:
-                if not isinstance(p, Mapping):
-                    continue
-                pname = p.get("name")
-                pin = p.get("in")
-                preq = p.get("required") or False
-                pdesc = p.get("description")
-                pschema = summarize_schema(p.get("schema"))
-                params.append(
-                    {
-                        "name": pname,
-                        "in": pin,
-                        "required": bool(preq),
-                        "schema": pschema,
-                        "description": str(pdesc).strip() if pdesc else None,
-                    }
-                )
-
-            request_body = None
-            if "requestBody" in operation and operation.get("requestBody"):
-                rb = operation.get("requestBody")
-                if isinstance(rb, Mapping):
-                    # OpenAPI 3 requestBody may have description and content mapping
-                    rb_desc = rb.get("description")
-                    content = {}
-                    for ctype, media in (rb.get("content") or {}).items():
-                        if isinstance(media, Mapping):
-                            schema = media.get("schema")
-                            schema_summary = summarize_schema(
-                                schema, local_expand_refs=True
-                            )
-                            content[ctype] = schema_summary
-                    request_body = {
-                        "description": str(rb_desc).strip() if rb_desc else None,
-                        "content": content,
-                    }
-
-            responses = {}
-            for code, resp in (operation.get("responses") or {}).items():
-                if not isinstance(resp, Mapping):
-                    continue
-                rdesc = resp.get("description")
-                rcontent = {}
-                for ctype, media in (resp.get("content") or {}).items():
-                    if isinstance(media, Mapping):
-                        schema = media.get("schema")
-                        schema_summary = summarize_schema(
-                            schema, local_expand_refs=True
-                        )
-                        rcontent[ctype] = schema_summary
-                responses[code] = {
-                    "description": str(rdesc).strip() if rdesc else None,
-                    "content": rcontent,
-                }
-            record = {
-                "method": method_upper,
-                "path": raw_path,
-                "operation_id": operation_id if operation_id is not None else None,
-                "summary": str(summary).strip() if summary else None,
-                "description": str(description).strip() if description else None,
-                "parameters": params,
-                "requestBody": request_body,
-                "responses": responses,
-            }
-
-            if operation_id:
-                opid_index[str(operation_id)] = record
+    parameters, requestBody, responses. Operations are looked up in the
+    indexes of the normalized model, so only the returned records are built.
 
+    When ``progress`` is given, each selector is one unit of progress and
+    cancellation is checked between selectors.
+    """
+    progress = progress or Progress()
+    selectors = [sel.strip() for sel in selectors]
+    progress.total = (progress.total or 0) + len(selectors)
+    results: list[dict[str, Any]] = []
     for sel in selectors:
-        sel = sel.strip()
+        progress.advance()
         if not sel:
             continue
 
-        # METHOD + path
         if " " in sel:
+            # METHOD + path
             maybe_method, maybe_path = sel.split(" ", 1)
             method = maybe_method.upper()
-            path = maybe_path
-            # find exact match
-            for raw_path, methods in paths.items():
-                if raw_path != path:
-                    continue
-                if not isinstance(methods, Mapping):
-                    continue
-                op = methods.get(method.lower())
-                if isinstance(op, Mapping):
-                    results.append(
-                        {
-                            "method": method,
-                            "path": raw_path,
-                            "operation_id": op.get("operationId"),
-                            "summary": op.get("summary"),
-                            "description": op.get("description"),
-                        }
-                    )
-                    break
-            continue
-
-        # operationId
-        if sel in opid_index:
-            results.append(opid_index[sel])
-            continue
-
-        # treat as path: return all methods under the path
-        path = sel
-        for raw_path, methods in paths.items():
-            if raw_path != path:
-                continue
-            if not isinstance(methods, Mapping):
-                continue
-            for method, operation in methods.items():
-                if not isinstance(operation, Mapping):
-                    continue
-                results.append(
-                    {
-                        "method": method.upper(),
-                        "path": raw_path,
-                        "operation_id": operation.get("operationId"),
-                        "summary": operation.get("summary"),
-                        "description": operation.get("description"),
-                    }
-                )
-
+            operations = [
+                op
+                for op in model.operations_by_path.get(maybe_path, [])
+                if op.method == method
+            ][:1]
+        elif sel in model.operations_by_id:
+            operations = [model.operations_by_id[sel]]
+        else:
+            # treat as path: return all methods under the path
+            operations = model.operations_by_path.get(sel, [])
+        results.extend(_operation_record(model, op, expand_refs) for op in operations)
     return results
 
 
-def format_openapi_details(records: Iterable[Mapping[str, Any]]) -> str:
-    """Format detailed operation records into text with full description."""
-    out_lines: list[str] = []
+def _openapi_details_text_lines(records: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """Yield the text lines of detailed operation records."""
     for r in records:
         method = r.get("method") or ""
         path = r.get("path") or ""
         opid = r.get("operation_id") or "-"
         summary = r.get("summary") or "-"
         description = r.get("description") or "-"
-        out_lines.append(f"{method} {path}  ({opid})")
-        out_lines.append(f"Summary: {summary}")
-        out_lines.append("Description:")
-        out_lines.extend([line.rstrip() for line in str(description).splitlines()])
+        yield f"{method} {path}  ({opid})"
+        yield f"Summary: {summary}"
+        yield "Description:"
+        for line in str(description).splitlines():
+            yield line.rstrip()
         # Parameters
         params = r.get("parameters") or []
         if params:
-            out_lines.append("")
-            out_lines.append("Parameters:")
+            yield ""
+            yield "Parameters:"
             for p in params:
                 pname = p.get("name")
                 pin = p.get("in")
                 preq = p.get("required")
                 pschema = p.get("schema")
                 pdesc = p.get("description")
-                out_lines.append(
-                    f" - {pname} (in: {pin}) required={preq} schema={pschema}"
-                )
+                yield f" - {pname} (in: {pin}) required={preq} schema={pschema}"
                 if pdesc:
-                    out_lines.append(f"   {pdesc}")
+                    yield f"   {pdesc}"
 
         # Request body
         rb = r.get("requestBody")
         if rb:
-            out_lines.append("")
-            out_lines.append("Request Body:")
+            yield ""
+            yield "Request Body:"
             if rb.get("description"):
-                out_lines.append(f"  {rb.get('description')}")
+                yield f"  {rb.get('description')}"
             for ctype, schema in (rb.get("content") or {}).items():
-                out_lines.append(f"  - {ctype}: {schema}")
+                yield f"  - {ctype}: {schema}"
 
         # Responses
         resps = r.get("responses") or {}
         if resps:
-            out_lines.append("")
-            out_lines.append("Responses:")
+            yield ""
+            yield "Responses:"
             for code, info in resps.items():
-                out_lines.append(f" {code}: {info.get('description')}")
+                yield f" {code}: {info.get('description')}"
                 for ctype, schema in (info.get("content") or {}).items():
-                    out_lines.append(f"    - {ctype}: {schema}")
-        out_lines.append("-" * 80)
-    return "\n".join(out_lines)
+                    yield f"    - {ctype}: {schema}"
+        yield "-" * 80
 
 
-def format_openapi_details_markdown(records: Iterable[Mapping[str, Any]]) -> str:
-    """Format detailed operation records into markdown with full description."""
-    lines = []
-    lines.append("# OpenAPI Operation Details")
-    lines.append("")
+def format_openapi_details(records: Iterable[Mapping[str, Any]]) -> str:
+    """Format detailed operation records into text with full description."""
+    return join_lines(_openapi_details_text_lines(records))
+
+
+def _openapi_details_lines(
+    records: Iterable[Mapping[str, Any]], budget: OutputBudget
+) -> Iterator[str]:
+    """Yield the markdown lines of detailed operation records."""
+    yield "# OpenAPI Operation Details"
+    yield ""
 
     for r in records:
         method = r.get("method") or ""
         path = r.get("path") or ""
         opid = r.get("operation_id") or "-"
         summary = r.get("summary") or "-"
-        description = r.get("description") or "-"
+        description = budget.shorten(r.get("description") or "-")
 
-        lines.append(f"## {method} {path}")
-        lines.append("")
+        yield f"## {method} {path}"
+        yield ""
         if opid != "-":
-            lines.append(f"**Operation ID:** {opid}")
-            lines.append("")
-        lines.append(f"**Summary:** {summary}")
-        lines.append("")
-        lines.append("**Description:**")
-        lines.append("")
-        lines.extend(
-            [
-                f"{line.rstrip()}"
-                for line in str(description).splitlines()
-                if line.strip()
-            ]
-        )
-        lines.append("")
+            yield f"**Operation ID:** {opid}"
+            yield ""
+        yield f"**Summary:** {summary}"
+        yield ""
+        yield "**Description:**"
+        yield ""
+        for line in str(description).splitlines():
+            if line.strip():
+                yield line.rstrip()
+        yield ""
 
         # Parameters
-        params = r.get("parameters") or []
+        params, omitted = budget.take(r.get("parameters") or [])
         if params:
-            lines.append("### Parameters")
-            lines.append("")
-            lines.append("| Name | In | Required | Schema | Description |")
-            lines.append("|------|----|----------|--------|-------------|")
+            yield "### Parameters"
+            yield ""
+            yield "| Name | In | Required | Schema | Description |"
+            yield "|------|----|----------|--------|-------------|"
             for p in params:
                 pname = p.get("name") or ""
                 pin = p.get("in") or ""
                 preq = "Yes" if p.get("required") else "No"
                 pschema = p.get("schema") or ""
-                pdesc = p.get("description") or ""
-                lines.append(f"| {pname} | {pin} | {preq} | `{pschema}` | {pdesc} |")
-            lines.append("")
+                pdesc = budget.shorten(p.get("description") or "")
+                yield f"| {pname} | {pin} | {preq} | `{pschema}` | {pdesc} |"
+            if omitted:
+                yield f"| *... {omitted} more* | | | | |"
+            yield ""
 
         # Request body
         rb = r.get("requestBody")
         if rb:
-            lines.append("### Request Body")
-            lines.append("")
+            yield "### Request Body"
+            yield ""
             if rb.get("description"):
-                lines.append(f"{rb.get('description')}")
-                lines.append("")
-            lines.append("**Content Types:**")
-            lines.append("")
+                yield f"{budget.shorten(rb.get('description'))}"
+                yield ""
+            yield "**Content Types:**"
+            yield ""
             for ctype, schema in (rb.get("content") or {}).items():
-                lines.append(f"- `{ctype}`: `{schema}`")
-            lines.append("")
+                yield f"- `{ctype}`: `{schema}`"
+            yield ""
 
         # Responses
-        resps = r.get("responses") or {}
+        resps, omitted = budget.take(list((r.get("responses") or {}).items()))
         if resps:
-            lines.append("### Responses")
-            lines.append("")
-            for code, info in resps.items():
-                lines.append(f"#### {code}")
-                lines.append("")
+            yield "### Responses"
+            yield ""
+            for code, info in resps:
+                yield f"#### {code}"
+                yield ""
                 if info.get("description"):
-                    lines.append(f"{info.get('description')}")
-                    lines.append("")
+                    yield f"{budget.shorten(info.get('description'))}"
+                    yield ""
                 if info.get("content"):
-                    lines.append("**Content Types:**")
-                    lines.append("")
+                    yield "**Content Types:**"
+                    yield ""
                     for ctype, schema in info.get("content", {}).items():
-                        lines.append(f"- `{ctype}`: `{schema}`")
-                    lines.append("")
-        lines.append("---")
-        lines.append("")
+                        yield f"- `{ctype}`: `{schema}`"
+                    yield ""
+            if omitted:
+                yield f"*... {omitted} more responses*"
+                yield ""
+        yield "---"
+        yield ""
 
-    return "\n".join(lines).strip()
 
+def format_openapi_details_markdown(
+    records: Iterable[Mapping[str, Any]], budget: OutputBudget | None = None
+) -> str:
+    """Format detailed operation records into markdown with full description.
 
-def format_openapi_text(ops: Iterable[Mapping[str, str | None]]) -> str:
-    """Format operations as a human-readable table-like text."""
-    rows = []
+    Args:
+        records: Detailed operation records.
+        budget: Optional output budget; unlimited by default.
+
+    Returns:
+        Markdown formatted string.
+    """
+    budget = budget or OutputBudget()
+    return budget.render(_openapi_details_lines(records, budget))
+
+
+def _openapi_text_lines(ops: Iterable[Mapping[str, str | None]]) -> Iterator[str]:
+    """Yield the lines of the operations text table."""
+    yield f"{'METHOD':6} {'PATH':40} {'OPERATION_ID':30} SUMMARY"
+    yield "-" * 100
     for op in ops:
         method = op.get("method") or ""
         path = op.get("path") or ""
         opid = op.get("operation_id") or "-"
         summary = op.get("summary") or "-"
-        rows.append(f"{method:6} {path:40} {opid:30} {summary}")
+        yield f"{method:6} {path:40} {opid:30} {summary}"
 
-    header = f"{'METHOD':6} {'PATH':40} {'OPERATION_ID':30} SUMMARY"
-    return "\n".join([header, "-" * 100] + rows)
 
+def format_openapi_text(ops: Iterable[Mapping[str, str | None]]) -> str:
+    """Format operations as a human-readable table-like text."""
+    return join_lines(_openapi_text_lines(ops))
 
-def format_openapi_markdown(ops: Iterable[Mapping[str, str | list | None]]) -> str:
-    """Format operations as a markdown table."""
-    lines = []
-    lines.append("# OpenAPI Operations")
-    lines.append("")
-    lines.append("| Method | Path | Operation ID | Summary | Tags |")
-    lines.append("|--------|------|--------------|---------|------|")
+
+def _openapi_markdown_lines(
+    ops: Iterable[Mapping[str, str | list | None]],
+) -> Iterator[str]:
+    """Yield the lines of the operations markdown table."""
+    yield "# OpenAPI Operations"
+    yield ""
+    yield "| Method | Path | Operation ID | Summary | Tags |"
+    yield "|--------|------|--------------|---------|------|"
 
     for op in ops:
         method = op.get("method") or ""
@@ -503,6 +692,9 @@ def format_openapi_markdown(ops: Iterable[Mapping[str, str | list | None]]) -> s
         summary = op.get("summary") or "-"
         tags = op.get("tags", [])
         tags_str = ", ".join(tags) if tags else "-"
-        lines.append(f"| {method} | `{path}` | {opid} | {summary} | {tags_str} |")
+        yield f"| {method} | `{path}` | {opid} | {summary} | {tags_str} |"
+
 
-    return "\n".join(lines)
+def format_openapi_markdown(ops: Iterable[Mapping[str, str | list | None]]) -> str:
+    """Format operations as a markdown table."""
+    return join_lines(_openapi_markdown_lines(ops))
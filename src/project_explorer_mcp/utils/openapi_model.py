@@ -0,0 +1,438 @@
+"""Normalized model of OpenAPI specs.
+
+Swagger 2.0, OpenAPI 3.0 and OpenAPI 3.1 documents describe the same things
+differently: Swagger has ``body`` and ``formData`` parameters, ``consumes``
+and ``produces`` lists and ``definitions``; OpenAPI 3 has ``requestBody``,
+``content`` and ``components``; OpenAPI 3.1 writes nullable types as type
+arrays. ``normalize_openapi`` converts a parsed spec of any of these versions
+once into an ``OpenAPIModel`` in OpenAPI 3.0 terms, which the OpenAPI tools
+read instead of branching on the raw document at every call:
+
+- operations with path-level parameters merged in and ``$ref`` parameters,
+  request bodies and responses resolved;
+- Swagger ``body`` and ``formData`` parameters as request bodies, and
+  response schemas under the ``produces`` media types;
+- schemas with references to ``#/components/schemas/<name>``, and
+  ``["<type>", "null"]`` types and Swagger ``x-nullable`` as
+  ``nullable: true``.
+"""
+
+from collections.abc import Mapping, Sequence
+from typing import Any, NamedTuple
+
+from .progress import Progress
+
+# HTTP verbs of operations under a path item; other keys are parameters or
+# vendor extensions.
+HTTP_METHODS = frozenset(
+    {"get", "post", "put", "delete", "patch", "options", "head", "trace"}
+)
+
+# Prefix of the references of named schemas in the model.
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+# Swagger 2.0 reference prefixes and the OpenAPI 3 ones they map to.
+_SWAGGER_REF_PREFIXES = (("#/definitions/", SCHEMA_REF_PREFIX),)
+
+# Keywords of Swagger 2.0 non-body parameters that describe their schema.
+_PARAMETER_SCHEMA_KEYS = (
+    "type",
+    "format",
+    "items",
+    "enum",
+    "default",
+    "minimum",
+    "maximum",
+    "pattern",
+)
+
+# Keywords whose value is a subschema, a list of subschemas, or a map of
+# names to subschemas. Other keywords (enum, default, example, const, vendor
+# extensions, ...) hold plain values and are copied as they are.
+_SUBSCHEMA_KEYWORDS = frozenset(
+    {
+        "items",
+        "additionalItems",
+        "additionalProperties",
+        "not",
+        "contains",
+        "propertyNames",
+        "if",
+        "then",
+        "else",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+_SUBSCHEMA_LIST_KEYWORDS = frozenset({"allOf", "anyOf", "oneOf", "prefixItems"})
+_SUBSCHEMA_MAP_KEYWORDS = frozenset(
+    {"properties", "patternProperties", "definitions", "$defs", "dependentSchemas"}
+)
+
+# Media types of Swagger 2.0 operations without consumes/produces.
+_DEFAULT_MEDIA_TYPES = ("application/json",)
+
+_FORM_MEDIA_TYPES = ("application/x-www-form-urlencoded", "multipart/form-data")
+
+
+class OpenAPIParameter(NamedTuple):
+    """A parameter of an operation, in OpenAPI 3 terms."""
+
+    name: str | None
+    location: str | None
+    required: bool
+    schema: Any
+    description: str | None
+
+
+class OpenAPIModelOperation(NamedTuple):
+    """An operation of a normalized spec.
+
+    Attributes:
+        method: Upper-case HTTP method.
+        path: Path template.
+        operation_id: operationId, if any.
+        summary: Stripped summary, if any.
+        description: Stripped description, if any.
+        tags: Tags of the operation.
+        parameters: Path-level and operation parameters, without body
+            parameters.
+        request_body: {"description", "content": {media type: schema}}, or
+            None.
+        responses: {status code: {"description", "content": {media type:
+            schema}}}.
+    """
+
+    method: str
+    path: str
+    operation_id: str | None
+    summary: str | None
+    description: str | None
+    tags: Sequence[str]
+    parameters: Sequence[OpenAPIParameter]
+    request_body: Mapping[str, Any] | None
+    responses: Mapping[str, Mapping[str, Any]]
+
+
+class OpenAPIModel(NamedTuple):
+    """A spec converted to the normalized model.
+
+    Attributes:
+        spec: The parsed document, as read.
+        version: Value of the ``openapi`` or ``swagger`` key.
+        title: Title of the API.
+        api_version: Version of the API.
+        operations: Operations in document order.
+        schemas: Normalized named schemas by name.
+        schema_pointers: Location of each named schema in the document.
+        operations_by_id: Operations by operationId.
+        operations_by_path: Operations by path template.
+    """
+
+    spec: Mapping[str, Any]
+    version: str | None
+    title: str | None
+    api_version: str | None
+    operations: list[OpenAPIModelOperation]
+    schemas: dict[str, Any]
+    schema_pointers: dict[str, str]
+    operations_by_id: dict[str, OpenAPIModelOperation]
+    operations_by_path: dict[str, list[OpenAPIModelOperation]]
+
+
+def escape_pointer(name: str) -> str:
+    """Escape a name for use in a JSON pointer."""
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+def resolve_pointer(spec: Mapping[str, Any], pointer: str) -> Any:
+    """Return the node of a local reference such as ``#/definitions/A``.
+
+    Args:
+        spec: Parsed spec.
+        pointer: Local JSON reference.
+
+    Returns:
+        The referenced node, or None if it does not exist.
+    """
+    node: Any = spec
+    for part in pointer[2:].split("/"):
+        if not isinstance(node, Mapping):
+            return None
+        node = node.get(part.replace("~1", "/").replace("~0", "~"))
+    return node
+
+
+def _normalize_ref(ref: str) -> str:
+    """Map a Swagger 2.0 schema reference to its OpenAPI 3 form."""
+    for old, new in _SWAGGER_REF_PREFIXES:
+        if ref.startswith(old):
+            return new + ref[len(old) :]
+    return ref
+
+
+def normalize_schema(schema: Any) -> Any:
+    """Return a copy of a schema in OpenAPI 3.0 terms.
+
+    Schema references point to ``#/components/schemas``, type arrays with
+    ``"null"`` and Swagger's ``x-nullable`` become ``nullable: true``, and a
+    type array with a single other type becomes that type. Only subschemas
+    are normalized; values such as ``enum``, ``default`` or ``example`` are
+    kept as written.
+    """
+    if not isinstance(schema, Mapping):
+        return schema
+    result: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "$ref" and isinstance(value, str):
+            result[key] = _normalize_ref(value)
+        elif key == "type" and isinstance(value, list):
+            types = [t for t in value if t != "null"]
+            if len(types) < len(value):
+                result["nullable"] = True
+            result[key] = types[0] if len(types) == 1 else types
+        elif key == "x-nullable":
+            if value:
+                result["nullable"] = True
+        elif key in _SUBSCHEMA_KEYWORDS:
+            # Draft 4 tuple validation lists the schemas of the items.
+            if isinstance(value, list):
+                result[key] = [normalize_schema(item) for item in value]
+            else:
+                result[key] = normalize_schema(value)
+        elif key in _SUBSCHEMA_LIST_KEYWORDS and isinstance(value, list):
+            result[key] = [normalize_schema(item) for item in value]
+        elif key in _SUBSCHEMA_MAP_KEYWORDS and isinstance(value, Mapping):
+            result[key] = {name: normalize_schema(sub) for name, sub in value.items()}
+        else:
+            result[key] = value
+    return result
+
+
+def _deref(spec: Mapping[str, Any], node: Any) -> Any:
+    """Resolve a ``$ref`` object, following chains of references."""
+    seen: set[str] = set()
+    while isinstance(node, Mapping) and isinstance(node.get("$ref"), str):
+        ref = node["$ref"]
+        if not ref.startswith("#/") or ref in seen:
+            break
+        seen.add(ref)
+        node = resolve_pointer(spec, ref)
+    return node
+
+
+def _text(value: Any) -> str | None:
+    """Return a stripped text, or None for empty values."""
+    return str(value).strip() if value else None
+
+
+def _content(media: Any) -> dict[str, Any]:
+    """Normalize an OpenAPI 3 content map to {media type: schema}."""
+    if not isinstance(media, Mapping):
+        return {}
+    return {
+        ctype: normalize_schema(entry.get("schema"))
+        for ctype, entry in media.items()
+        if isinstance(entry, Mapping)
+    }
+
+
+def _media_types(value: Any, default: Sequence[str]) -> Sequence[str]:
+    """Return Swagger consumes/produces media types, or the default."""
+    if isinstance(value, list) and value:
+        return [str(v) for v in value]
+    return default
+
+
+class _Normalizer:
+    """Conversion of one spec to the model."""
+
+    def __init__(self, spec: Mapping[str, Any], progress: Progress):
+        self.spec = spec
+        self.progress = progress
+        self.swagger = "swagger" in spec
+        self.consumes = _media_types(spec.get("consumes"), _DEFAULT_MEDIA_TYPES)
+        self.produces = _media_types(spec.get("produces"), _DEFAULT_MEDIA_TYPES)
+
+    def parameters(self, raw: Any) -> dict[tuple[Any, Any], Mapping[str, Any]]:
+        """Resolve a parameter list, keyed by (name, in)."""
+        result: dict[tuple[Any, Any], Mapping[str, Any]] = {}
+        for p in raw if isinstance(raw, list) else []:
+            p = _deref(self.spec, p)
+            if isinstance(p, Mapping):
+                result[(p.get("name"), p.get("in"))] = p
+        return result
+
+    def parameter(self, p: Mapping[str, Any]) -> OpenAPIParameter:
+        """Convert a non-body parameter."""
+        if "schema" in p or not self.swagger:
+            schema = p.get("schema")
+        else:
+            schema = {k: p[k] for k in _PARAMETER_SCHEMA_KEYS if k in p} or None
+        return OpenAPIParameter(
+            p.get("name"),
+            p.get("in"),
+            bool(p.get("required")),
+            normalize_schema(schema),
+            _text(p.get("description")),
+        )
+
+    def swagger_body(
+        self, params: list[Mapping[str, Any]], consumes: Sequence[str]
+    ) -> dict[str, Any] | None:
+        """Convert Swagger ``body`` or ``formData`` parameters to a body."""
+        body = next((p for p in params if p.get("in") == "body"), None)
+        if body is not None:
+            body_schema = normalize_schema(body.get("schema"))
+            return {
+                "description": _text(body.get("description")),
+                "content": {ctype: body_schema for ctype in consumes},
+            }
+        fields = [p for p in params if p.get("in") == "formData"]
+        if not fields:
+            return None
+        schema: dict[str, Any] = {
+            "type": "object",
+            "properties": {p.get("name"): self.parameter(p).schema for p in fields},
+        }
+        required = [p.get("name") for p in fields if p.get("required")]
+        if required:
+            schema["required"] = required
+        ctypes = [c for c in consumes if c in _FORM_MEDIA_TYPES]
+        return {
+            "description": None,
+            "content": {ctype: schema for ctype in ctypes or _FORM_MEDIA_TYPES[:1]},
+        }
+
+    def request_body(self, raw: Any) -> dict[str, Any] | None:
+        """Convert an OpenAPI 3 request body."""
+        raw = _deref(self.spec, raw)
+        if not isinstance(raw, Mapping) or not raw:
+            return None
+        return {
+            "description": _text(raw.get("description")),
+            "content": _content(raw.get("content")),
+        }
+
+    def responses(self, raw: Any, produces: Sequence[str]) -> dict[str, dict[str, Any]]:
+        """Convert the responses of an operation."""
+        result = {}
+        for code, resp in raw.items() if isinstance(raw, Mapping) else []:
+            resp = _deref(self.spec, resp)
+            if not isinstance(resp, Mapping):
+                continue
+            if self.swagger:
+                content = {}
+                if resp.get("schema") is not None:
+                    schema = normalize_schema(resp["schema"])
+                    content = {ctype: schema for ctype in produces}
+            else:
+                content = _content(resp.get("content"))
+            result[str(code)] = {
+                "description": _text(resp.get("description")),
+                "content": content,
+            }
+        return result
+
+    def operation(
+        self,
+        raw_path: str,
+        method: str,
+        op: Mapping[str, Any],
+        shared: dict[tuple[Any, Any], Mapping[str, Any]],
+    ) -> OpenAPIModelOperation:
+        """Convert one operation, with the parameters of its path item."""
+        params = list({**shared, **self.parameters(op.get("parameters"))}.values())
+        if self.swagger:
+            consumes = _media_types(op.get("consumes"), self.consumes)
+            request_body = self.swagger_body(params, consumes)
+            params = [p for p in params if p.get("in") not in ("body", "formData")]
+            produces = _media_types(op.get("produces"), self.produces)
+        else:
+            request_body = self.request_body(op.get("requestBody"))
+            produces = ()
+        operation_id = op.get("operationId")
+        return OpenAPIModelOperation(
+            method.upper(),
+            raw_path,
+            operation_id,
+            _text(op.get("summary")),
+            _text(op.get("description")),
+            op.get("tags", []),
+            [self.parameter(p) for p in params],
+            request_body,
+            self.responses(op.get("responses"), produces),
+        )
+
+    def model(self) -> OpenAPIModel:
+        """Convert the whole spec."""
+        spec = self.spec
+        operations = []
+        paths = spec.get("paths")
+        if not isinstance(paths, Mapping):
+            paths = {}
+        self.progress.total = (self.progress.total or 0) + len(paths)
+        for raw_path, item in paths.items():
+            self.progress.advance()
+            if not isinstance(item, Mapping):
+                continue
+            shared = self.parameters(item.get("parameters"))
+            for method, op in item.items():
+                if method.lower() in HTTP_METHODS and isinstance(op, Mapping):
+                    operations.append(self.operation(raw_path, method, op, shared))
+
+        schemas: dict[str, Any] = {}
+        pointers: dict[str, str] = {}
+        components = spec.get("components")
+        for prefix, named in (
+            (
+                SCHEMA_REF_PREFIX,
+                components.get("schemas") if isinstance(components, Mapping) else None,
+            ),
+            ("#/definitions/", spec.get("definitions")),
+        ):
+            if not isinstance(named, Mapping):
+                continue
+            for name, schema in named.items():
+                if isinstance(schema, Mapping) and name not in schemas:
+                    schemas[name] = normalize_schema(schema)
+                    pointers[name] = prefix + escape_pointer(name)
+
+        by_id: dict[str, OpenAPIModelOperation] = {}
+        by_path: dict[str, list[OpenAPIModelOperation]] = {}
+        for operation in operations:
+            if operation.operation_id:
+                by_id[str(operation.operation_id)] = operation
+            by_path.setdefault(operation.path, []).append(operation)
+
+        info = spec.get("info")
+        if not isinstance(info, Mapping):
+            info = {}
+        version = spec.get("openapi") or spec.get("swagger")
+        return OpenAPIModel(
+            spec,
+            None if version is None else str(version),
+            info.get("title"),
+            None if info.get("version") is None else str(info["version"]),
+            operations,
+            schemas,
+            pointers,
+            by_id,
+            by_path,
+        )
+
+
+def normalize_openapi(
+    spec: Mapping[str, Any], progress: Progress | None = None
+) -> OpenAPIModel:
+    """Convert a parsed Swagger 2.0, OpenAPI 3.0 or 3.1 spec to the model.
+
+    Args:
+        spec: Parsed spec.
+        progress: Optional progress, advanced per path item; cancellation is
+            checked between path items.
+
+    Returns:
+        The normalized model, which keeps a reference to ``spec``.
+    """
+    return _Normalizer(spec, progress or Progress()).model()
@@ -0,0 +1,341 @@
+"""Catalog of the component schemas of OpenAPI specs.
+
+The catalog lists the schemas under ``components/schemas`` (OpenAPI 3) and
+``definitions`` (Swagger 2) with their property counts, the schemas they
+reference and are referenced by, the operations using them and whether they
+take part in a reference cycle. It is built in one pass over the spec and
+cached per spec version, so the schema tools answer "what is X and who uses
+it" without walking the operations again.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, NamedTuple
+
+from .cache import FileCache
+from .formatters import OutputBudget, join_lines
+from .openapi import get_openapi_model
+from .openapi_model import (
+    SCHEMA_REF_PREFIX,
+    OpenAPIModel,
+    escape_pointer,
+    resolve_pointer,
+)
+
+
+class SchemaInfo(NamedTuple):
+    """A named schema of an OpenAPI spec, as listed by ``openapi_list_schemas``.
+
+    Attributes:
+        name: Schema name.
+        pointer: Local reference of the schema, e.g. ``#/components/schemas/A``.
+        type: Type of the schema, its composition keyword (``allOf``, ...) or
+            ``$ref`` for an alias.
+        description: Title, or the first line of the description.
+        property_count: Properties of the schema and its inline ``allOf``
+            parts.
+        references: Schemas it references directly.
+        referenced_by: Schemas referencing it directly.
+        operations: Operations ("METHOD /path") referencing it directly or
+            through shared parameters, request bodies and responses.
+        cyclic: Whether it can reach itself through references.
+    """
+
+    name: str
+    pointer: str
+    type: str | None
+    description: str | None
+    property_count: int
+    references: Sequence[str]
+    referenced_by: Sequence[str]
+    operations: Sequence[str]
+    cyclic: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON shape of the schema entry."""
+        return self._asdict()
+
+    def summary(self) -> dict[str, Any]:
+        """Return the JSON shape of the entry with its lists as counts."""
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "property_count": self.property_count,
+            "reference_count": len(self.references),
+            "referenced_by_count": len(self.referenced_by),
+            "operation_count": len(self.operations),
+            "cyclic": self.cyclic,
+        }
+
+
+def _local_refs(node: Any) -> Iterator[str]:
+    """Yield the local ``$ref`` values found anywhere in a node."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Mapping):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/"):
+                yield ref
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _schema_type(schema: Mapping[str, Any]) -> str | None:
+    """Return the type of a schema for the catalog."""
+    stype = schema.get("type")
+    if stype is not None:
+        types = [str(t) for t in stype] if isinstance(stype, list) else [str(stype)]
+        if schema.get("nullable"):
+            types.append("null")
+        return " | ".join(types)
+    for keyword in ("allOf", "oneOf", "anyOf", "$ref"):
+        if keyword in schema:
+            return keyword
+    return None
+
+
+def _property_count(schema: Mapping[str, Any]) -> int:
+    """Count the properties of a schema and of its inline allOf parts."""
+    count = 0
+    for part in [schema, *(schema.get("allOf") or [])]:
+        if isinstance(part, Mapping) and "$ref" not in part:
+            properties = part.get("properties")
+            if isinstance(properties, Mapping):
+                count += len(properties)
+    return count
+
+
+def _brief(schema: Mapping[str, Any]) -> str | None:
+    """Return the title or the first line of the description of a schema."""
+    text = schema.get("title") or schema.get("description")
+    if not text:
+        return None
+    return next((line.strip() for line in str(text).splitlines() if line.strip()), None)
+
+
+def _cyclic(graph: Mapping[str, Iterable[str]]) -> set[str]:
+    """Return the nodes of a graph that lie on a cycle.
+
+    Iterative Tarjan: a node is cyclic if its strongly connected component
+    has several nodes or it references itself.
+    """
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    cyclic: set[str] = set()
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph[child])))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in graph[node]:
+                        cyclic.update(component)
+    return cyclic
+
+
+def build_schema_catalog(model: OpenAPIModel) -> dict[str, SchemaInfo]:
+    """Build the catalog of the named schemas of a spec.
+
+    Args:
+        model: Normalized OpenAPI 3 or Swagger 2 spec.
+
+    Returns:
+        Schema entries by name, in document order.
+    """
+    schemas = model.schemas
+    # Normalized references, and the original ones found in components
+    # that are read from the document.
+    by_pointer = {SCHEMA_REF_PREFIX + escape_pointer(name): name for name in schemas}
+    by_pointer.update(
+        {pointer: name for name, pointer in model.schema_pointers.items()}
+    )
+
+    # Schemas used by other components (parameters, request bodies,
+    # responses) that schemas reference.
+    component_refs: dict[str, set[str]] = {}
+
+    def schema_refs(node: Any) -> set[str]:
+        names: set[str] = set()
+        for ref in _local_refs(node):
+            name = by_pointer.get(ref)
+            if name is not None:
+                names.add(name)
+            elif ref in component_refs:
+                names |= component_refs[ref]
+            else:
+                # Set first, so that cyclic components terminate.
+                component_refs[ref] = set()
+                component_refs[ref] = schema_refs(resolve_pointer(model.spec, ref))
+                names |= component_refs[ref]
+        return names
+
+    references = {name: schema_refs(schema) for name, schema in schemas.items()}
+    referenced_by: dict[str, list[str]] = {name: [] for name in schemas}
+    for name, targets in references.items():
+        for target in targets:
+            referenced_by[target].append(name)
+
+    # Operations have their parameters, request bodies and responses
+    # resolved already.
+    operations: dict[str, list[str]] = {name: [] for name in schemas}
+    for op in model.operations:
+        used = schema_refs(
+            [[p.schema for p in op.parameters], op.request_body, op.responses]
+        )
+        for name in sorted(used):
+            operations[name].append(f"{op.method} {op.path}")
+
+    cyclic = _cyclic(references)
+    return {
+        name: SchemaInfo(
+            name,
+            model.schema_pointers[name],
+            _schema_type(schema),
+            _brief(schema),
+            _property_count(schema),
+            sorted(references[name]),
+            sorted(referenced_by[name]),
+            operations[name],
+            name in cyclic,
+        )
+        for name, schema in schemas.items()
+    }
+
+
+def _build_catalog(path: str) -> dict[str, SchemaInfo]:
+    """Load a spec and build its schema catalog."""
+    return build_schema_catalog(get_openapi_model(path))
+
+
+# Catalogs of recently used specs; with the project index enabled a catalog
+# is only built once across server processes until the spec changes.
+schema_catalog_cache: FileCache[dict[str, SchemaInfo]] = FileCache(
+    "openapi_schemas",
+    maxsize=64,
+    decode=lambda data: {name: SchemaInfo(*entry) for name, entry in data.items()},
+)
+
+
+def get_schema_catalog(
+    path: str, st: os.stat_result | None = None
+) -> dict[str, SchemaInfo]:
+    """Return the schema catalog of a spec file, using the catalog cache.
+
+    Args:
+        path: Path to the spec file.
+        st: Fresh ``stat`` result of the path, if already known.
+
+    Returns:
+        Schema entries by name, in document order.
+
+    Raises:
+        ValueError: if the file cannot be parsed.
+    """
+    return schema_catalog_cache.get_or_compute(path, _build_catalog, st)
+
+
+def _schema_list_lines(schemas: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """Yield the lines of the schema list markdown table."""
+    yield "# OpenAPI Schemas"
+    yield ""
+    yield "| Name | Type | Properties | References | Referenced by | Operations | Cyclic | Description |"
+    yield "|------|------|------------|------------|---------------|------------|--------|-------------|"
+    for s in schemas:
+        # OpenAPI 3.1 type lists are joined with "|", which ends a cell.
+        stype = (s.get("type") or "-").replace("|", "\\|")
+        yield (
+            f"| {s['name']} | {stype} | {s['property_count']} | "
+            f"{s['reference_count']} | {s['referenced_by_count']} | "
+            f"{s['operation_count']} | {'Yes' if s['cyclic'] else 'No'} | "
+            f"{s.get('description') or '-'} |"
+        )
+
+
+def format_schema_list_markdown(schemas: Iterable[Mapping[str, Any]]) -> str:
+    """Format schema summaries as a markdown table."""
+    return join_lines(_schema_list_lines(schemas))
+
+
+def _schema_details_lines(
+    records: Iterable[Mapping[str, Any]], budget: OutputBudget
+) -> Iterator[str]:
+    """Yield the markdown lines of detailed schema records."""
+    yield "# OpenAPI Schema Details"
+    yield ""
+    for r in records:
+        yield f"## {r['name']}"
+        yield ""
+        if r.get("error"):
+            yield f"**Error:** {r['error']}"
+            yield ""
+            continue
+        yield f"**Pointer:** `{r['pointer']}`"
+        yield ""
+        yield f"**Type:** {r.get('type') or '-'}"
+        yield ""
+        if r.get("cyclic"):
+            yield "**Cyclic:** Yes"
+            yield ""
+        for label, key in (
+            ("References", "references"),
+            ("Referenced by", "referenced_by"),
+            ("Used by operations", "operations"),
+        ):
+            items, omitted = budget.take(r.get(key) or [])
+            if items:
+                more = f", ... {omitted} more" if omitted else ""
+                yield f"**{label}:** {', '.join(items)}{more}"
+                yield ""
+        yield "```json"
+        yield from json.dumps(
+            r.get("schema"), indent=2, ensure_ascii=False
+        ).splitlines()
+        yield "```"
+        yield ""
+
+
+def format_schema_details_markdown(
+    records: Iterable[Mapping[str, Any]], budget: OutputBudget | None = None
+) -> str:
+    """Format detailed schema records into markdown.
+
+    Args:
+        records: Schema records, with the schema body under ``schema``.
+        budget: Optional output budget; unlimited by default.
+
+    Returns:
+        Markdown formatted string.
+    """
+    budget = budget or OutputBudget()
+    return budget.render(_schema_details_lines(records, budget))
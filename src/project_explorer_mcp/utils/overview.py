@@ -0,0 +1,166 @@
+"""Project overview utilities for the project explorer MCP server."""
+
+import os
+from collections.abc import Sequence
+from typing import Any
+
+from loguru import logger
+
+from .concurrency import map_ordered
+from .filesystem import iter_files
+from .markdown import get_markdown_headings
+from .openapi import get_openapi_model, looks_like_openapi
+from .progress import Progress
+from .python import PythonClass, PythonFunction, get_python_outline
+
+PYTHON_SUFFIXES = frozenset({".py", ".pyi"})
+MARKDOWN_SUFFIXES = frozenset({".md", ".markdown"})
+SPEC_SUFFIXES = frozenset({".json", ".yaml", ".yml"})
+
+# File stems that usually describe a project or package best.
+_KEY_STEMS = frozenset(
+    {"readme", "index", "__init__", "__main__", "main", "app", "cli", "server"}
+)
+_TEST_DIRS = frozenset({"test", "tests", "testing", "examples", "benchmarks"})
+
+# Maximum number of names listed per file entry.
+MAX_NAMES = 10
+
+
+def _rank(rel: str) -> tuple[int, int, int, str]:
+    """Sort key putting the most informative files first.
+
+    Files outside test/example directories come first, then shallower files,
+    then well-known entry points and READMEs.
+    """
+    parts = rel.split("/")
+    in_tests = any(p.lower() in _TEST_DIRS for p in parts[:-1])
+    stem = parts[-1].rsplit(".", 1)[0].lower()
+    return (in_tests, len(parts), stem not in _KEY_STEMS, rel)
+
+
+def _names(items: Sequence[PythonClass | PythonFunction]) -> list[str]:
+    """List item names, collapsing the tail beyond MAX_NAMES into a count."""
+    names = [i.name for i in items[:MAX_NAMES]]
+    if len(items) > MAX_NAMES:
+        names.append(f"+{len(items) - MAX_NAMES} more")
+    return names
+
+
+def _summarize_python(path: str) -> dict[str, Any]:
+    """Summarize a Python module: first docstring line, classes, functions."""
+    outline = get_python_outline(path)
+    summary: dict[str, Any] = {}
+    if outline.docstring and outline.docstring.strip():
+        summary["docstring"] = outline.docstring.strip().splitlines()[0]
+    if outline.classes:
+        summary["classes"] = _names(outline.classes)
+    if outline.functions:
+        summary["functions"] = _names(outline.functions)
+    return summary
+
+
+def _summarize_markdown(path: str) -> dict[str, Any]:
+    """Summarize a Markdown document by its H1 and H2 headings."""
+    headings = [h.text for h in get_markdown_headings(path) if h.level <= 2]
+    if len(headings) > MAX_NAMES:
+        headings = headings[:MAX_NAMES] + [f"+{len(headings) - MAX_NAMES} more"]
+    return {"headings": headings} if headings else {}
+
+
+def _summarize_openapi(path: str) -> dict[str, Any]:
+    """Summarize an OpenAPI spec: title, version and operation count."""
+    model = get_openapi_model(path)
+    summary: dict[str, Any] = {
+        "title": model.title,
+        "version": model.api_version,
+        "operations": len(model.operations),
+    }
+    return {k: v for k, v in summary.items() if v is not None}
+
+
+_SUMMARIZERS = {
+    "python": _summarize_python,
+    "markdown": _summarize_markdown,
+    "openapi": _summarize_openapi,
+}
+
+
+def build_project_overview(
+    root: str, max_files_per_type: int = 20, progress: Progress | None = None
+) -> dict[str, Any]:
+    """Summarize a project in one directory walk.
+
+    Files are classified by type (Python, Markdown, and JSON/YAML documents
+    sniffed as OpenAPI specs), ranked, and the top ``max_files_per_type`` of
+    each type are outlined in the shared worker pool.
+
+    Args:
+        root: Absolute path of the project root.
+        max_files_per_type: Maximum number of files summarized per type.
+        progress: Progress of the call; each summarized file is one unit and
+            cancellation is also checked during the walk.
+
+    Returns:
+        Overview dict with keys root, files, directories, python, markdown,
+        openapi and, if files were left out, omitted.
+    """
+    groups: dict[str, list[tuple[str, str]]] = {k: [] for k in _SUMMARIZERS}
+    spec_candidates: list[tuple[str, str]] = []
+    directories: dict[str, int] = {}
+    other = 0
+    progress = progress or Progress()
+    for rel, entry in iter_files(root):
+        progress.check()
+        top = rel.split("/", 1)[0] + "/" if "/" in rel else "."
+        directories[top] = directories.get(top, 0) + 1
+        suffix = os.path.splitext(entry.name)[1].lower()
+        if suffix in PYTHON_SUFFIXES:
+            groups["python"].append((rel, entry.path))
+        elif suffix in MARKDOWN_SUFFIXES:
+            groups["markdown"].append((rel, entry.path))
+        elif suffix in SPEC_SUFFIXES:
+            spec_candidates.append((rel, entry.path))
+        else:
+            other += 1
+
+    sniffed = map_ordered(looks_like_openapi, [p for _, p in spec_candidates])
+    for candidate, is_spec in zip(spec_candidates, sniffed):
+        if is_spec:
+            groups["openapi"].append(candidate)
+        else:
+            other += 1
+
+    tasks: list[tuple[str, str, str]] = []
+    omitted: dict[str, int] = {}
+    for kind, files in groups.items():
+        files.sort(key=lambda f: _rank(f[0]))
+        tasks.extend((kind, rel, path) for rel, path in files[:max_files_per_type])
+        if len(files) > max_files_per_type:
+            omitted[kind] = len(files) - max_files_per_type
+
+    def summarize(task: tuple[str, str, str]) -> dict[str, Any]:
+        """Summarize one file, reporting failures in the entry."""
+        kind, rel, path = task
+        progress.check()
+        try:
+            summary = {"path": rel, **_SUMMARIZERS[kind](path)}
+        except Exception as e:
+            logger.debug("Failed to summarize file", path=path, error=str(e))
+            summary = {"path": rel, "error": str(e)}
+        progress.advance()
+        return summary
+
+    overview: dict[str, Any] = {
+        "root": root,
+        "files": {kind: len(files) for kind, files in groups.items()},
+        "directories": dict(sorted(directories.items(), key=lambda d: (-d[1], d[0]))),
+        **{kind: [] for kind in groups},
+    }
+    overview["files"]["other"] = other
+    progress.total = len(tasks)
+    for task, summary in zip(tasks, map_ordered(summarize, tasks)):
+        overview[task[0]].append(summary)
+    if omitted:
+        overview["omitted"] = omitted
+    return overview
@@ -0,0 +1,199 @@
+"""Per-call profiling of tool invocations for the project explorer MCP server.
+
+A call is profiled when profiling is enabled for all calls in the settings,
+or when the client asks for it in the request metadata::
+
+    {"method": "tools/call", "params": {"name": "...", "arguments": {...},
+     "_meta": {"profile": true}}}
+
+cProfile only sees the thread it is enabled in. The event loop thread and the
+worker thread a tool runs its work in (see ``run_with_progress``) are
+profiled and merged into one profile; work done in the shared worker pool
+shows up as time spent waiting for results. tracemalloc covers all threads.
+
+The profilers are only imported once a call is profiled.
+"""
+
+import itertools
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.tools.tool import ToolResult
+from loguru import logger
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+    import tracemalloc
+
+_counter = itertools.count()
+
+# Profilers of the worker threads of the profiled call in this context.
+_worker_profilers: "ContextVar[list[cProfile.Profile] | None]" = ContextVar(
+    "_worker_profilers", default=None
+)
+
+
+@contextmanager
+def profile_worker() -> Iterator[None]:
+    """Profile the current worker thread if its tool call is being profiled.
+
+    The worker must run in a copy of the call's context, as
+    ``anyio.to_thread.run_sync`` does.
+    """
+    profilers = _worker_profilers.get()
+    if profilers is None:
+        yield
+        return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # The thread is already being profiled.
+        yield
+        return
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profilers.append(profiler)
+
+
+def _profile_requested(context: MiddlewareContext) -> bool:
+    """Whether the request metadata asks for profiling."""
+    ctx = context.fastmcp_context
+    request = ctx.request_context if ctx is not None else None
+    meta = request.meta if request is not None else None
+    return bool(getattr(meta, "profile", False))
+
+
+def top_functions(stats: "pstats.Stats", n: int) -> list[str]:
+    """Describe the n functions with the highest cumulative time.
+
+    Args:
+        stats: Profile statistics.
+        n: Number of functions.
+
+    Returns:
+        Lines like ``utils/openapi.py:39(load_openapi_spec) 1.234s cum, 1 calls``.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    ranked = sorted(entries.items(), key=lambda item: item[1][3], reverse=True)
+    lines = []
+    for (filename, line, func), (_, calls, _, cumtime, _) in ranked[:n]:
+        location = f"{filename}:{line}" if line else filename
+        lines.append(f"{location}({func}) {cumtime:.3f}s cum, {calls} calls")
+    return lines
+
+
+def top_allocations(snapshot: "tracemalloc.Snapshot", n: int) -> list[str]:
+    """Describe the n source lines that allocated the most memory.
+
+    Args:
+        snapshot: Memory snapshot.
+        n: Number of lines.
+    """
+    return [str(stat) for stat in snapshot.statistics("lineno")[:n]]
+
+
+class ProfilingMiddleware(Middleware):
+    """Profiles tool calls with cProfile and, optionally, tracemalloc.
+
+    For each profiled call, ``<tool>-<time>-<n>.prof`` (loadable with
+    ``pstats`` or snakeviz) and, with memory profiling,
+    ``<tool>-<time>-<n>.snapshot`` (loadable with
+    ``tracemalloc.Snapshot.load``) are written to the profile directory, and
+    the top hotspots are logged.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        all_calls: bool = False,
+        memory: bool = False,
+        top_n: int = 15,
+    ):
+        """Create the middleware.
+
+        Args:
+            directory: Directory receiving profile files; created on demand.
+            all_calls: Profile every call, not only those requesting it.
+            memory: Also trace memory allocations.
+            top_n: Number of hotspots logged per call.
+        """
+        self.directory = directory
+        self.all_calls = all_calls
+        self.memory = memory
+        self.top_n = top_n
+
+    async def on_call_tool(
+        self, context: MiddlewareContext, call_next: CallNext
+    ) -> ToolResult:
+        """Run a tool call under the profiler when requested."""
+        if not (self.all_calls or _profile_requested(context)):
+            return await call_next(context)
+        import cProfile
+        import pstats
+        import tracemalloc
+
+        tool = context.message.name
+        stem = os.path.join(
+            self.directory,
+            f"{tool}-{time.strftime('%Y%m%d-%H%M%S')}-{next(_counter)}",
+        )
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (e.g. an overlapping profiled call) is active.
+            logger.warning("Profiler busy, running call unprofiled", tool=tool)
+            return await call_next(context)
+        started_tracing = self.memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        workers: list[cProfile.Profile] = []
+        token = _worker_profilers.set(workers)
+        try:
+            return await call_next(context)
+        finally:
+            profiler.disable()
+            _worker_profilers.reset(token)
+            snapshot = None
+            if self.memory and tracemalloc.is_tracing():
+                snapshot = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            stats = pstats.Stats(profiler)
+            for worker in workers:
+                stats.add(worker)
+            self._save(tool, stem, stats, snapshot)
+
+    def _save(
+        self,
+        tool: str,
+        stem: str,
+        stats: "pstats.Stats",
+        snapshot: "tracemalloc.Snapshot | None",
+    ) -> None:
+        """Write the profile files and log the hotspots."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stats.dump_stats(f"{stem}.prof")
+            if snapshot is not None:
+                snapshot.dump(f"{stem}.snapshot")
+        except OSError as e:
+            logger.warning("Failed to write profile", path=stem, error=str(e))
+        logger.info(
+            "Tool call profiled",
+            tool=tool,
+            profile=f"{stem}.prof",
+            hotspots=top_functions(stats, self.top_n),
+            allocations=top_allocations(snapshot, self.top_n) if snapshot else None,
+        )
@@ -0,0 +1,160 @@
+"""Progress reporting and cancellation of tool calls.
+
+Tools run their blocking work in a worker thread through
+``run_with_progress``. The work receives a ``Progress`` object and calls
+``advance`` after each unit (a directory, a file, an operation); meanwhile
+the event loop forwards the counters to the client as MCP progress
+notifications. When the client cancels the request, the tool returns at once
+and the worker stops at its next ``advance`` or ``check``.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import TypeVar
+
+import anyio
+import anyio.to_thread
+from fastmcp import Context
+from loguru import logger
+
+from .limits import call_limiter
+from .profiling import profile_worker
+
+T = TypeVar("T")
+
+# Minimum seconds between two progress notifications of a call.
+REPORT_INTERVAL = 0.2
+
+# Number of tool calls whose work is running, for background jobs that yield
+# to them.
+_active_calls = 0
+_active_lock = threading.Lock()
+
+
+def active_calls() -> int:
+    """Return the number of tool calls currently running their work."""
+    return _active_calls
+
+
+class CallCancelled(BaseException):
+    """Raised in a worker when its tool call has been cancelled.
+
+    Like ``asyncio.CancelledError`` it derives from ``BaseException``, so the
+    per-file error handling of the tools does not turn it into a result.
+    """
+
+
+class Progress:
+    """Progress counters and cancellation flag of one tool call.
+
+    Safe to use from several threads, e.g. from tasks of the shared worker
+    pool.
+    """
+
+    def __init__(self, total: int | None = None):
+        """Create progress with nothing done.
+
+        Args:
+            total: Number of units of work, if known.
+        """
+        self.done = 0
+        self.total = total
+        self.message: str | None = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the call has been cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Ask the workers of the call to stop."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise ``CallCancelled`` if the call has been cancelled."""
+        if self._cancelled.is_set():
+            raise CallCancelled
+
+    def advance(self, units: int = 1, message: str | None = None) -> None:
+        """Record finished work, raising ``CallCancelled`` if cancelled.
+
+        Args:
+            units: Number of units finished.
+            message: Optional description of the current stage.
+        """
+        self.check()
+        with self._lock:
+            self.done += units
+            if message is not None:
+                self.message = message
+
+    def state(self) -> tuple[int, int | None, str | None]:
+        """Return (done, total, message)."""
+        with self._lock:
+            return self.done, self.total, self.message
+
+
+async def run_with_progress(ctx: Context | None, work: Callable[[Progress], T]) -> T:
+    """Run the blocking part of a tool call in a worker thread.
+
+    The worker gets its own thread rather than one of the shared pool, so it
+    can fan out to the pool without waiting on itself; it is profiled along
+    with the call by ``ProfilingMiddleware``. At most ``max_concurrent_calls``
+    such threads run at once, across all clients; later calls wait for one.
+    While it runs, progress is reported through ``ctx`` every
+    ``REPORT_INTERVAL`` seconds and once at the end; FastMCP only sends it
+    when the request carries a progress token.
+
+    Args:
+        ctx: Context of the request, or None when called directly.
+        work: Function doing the work, given the call's ``Progress``.
+
+    Returns:
+        The result of ``work``.
+    """
+    progress = Progress()
+
+    def run_work(progress: Progress) -> T:
+        global _active_calls
+        with _active_lock:
+            _active_calls += 1
+        try:
+            with profile_worker():
+                return work(progress)
+        finally:
+            with _active_lock:
+                _active_calls -= 1
+
+    reported: tuple[int, int | None, str | None] = (0, None, None)
+
+    async def report() -> None:
+        nonlocal reported
+        state = progress.state()
+        if ctx is not None and state != reported:
+            reported = state
+            try:
+                await ctx.report_progress(*state)
+            except Exception as e:
+                logger.debug("Failed to report progress", error=str(e))
+
+    async def report_periodically() -> None:
+        while True:
+            await anyio.sleep(REPORT_INTERVAL)
+            await report()
+
+    try:
+        async with anyio.create_task_group() as tg:
+            if ctx is not None:
+                tg.start_soon(report_periodically)
+            result = await anyio.to_thread.run_sync(
+                run_work, progress, abandon_on_cancel=True, limiter=call_limiter()
+            )
+            tg.cancel_scope.cancel()
+    except BaseException:
+        # Cancelled (or failed): the abandoned worker stops at its next check.
+        progress.cancel()
+        raise
+    await report()
+    return result
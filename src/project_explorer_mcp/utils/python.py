@@ -0,0 +1,263 @@
+"""Python parsing utilities for the project explorer MCP server."""
+
+import ast
+import itertools
+import os
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from .cache import FileCache
+from .reader import (
+    SkippedFile,
+    max_file_bytes,
+    open_buffer,
+    read_limit_variant,
+    truncation_note,
+)
+
+# First bytes of lines that continue a statement rather than start one.
+_NOT_STATEMENT_START = frozenset(
+    [b"", b" ", b"\t", b"\r", b"\n", b"\f", b"#", b")", b"]", b"}"]
+)
+
+# Cut points tried before a truncated file is skipped.
+MAX_CUT_ATTEMPTS = 5
+
+
+class PythonImport(NamedTuple):
+    """An imported name.
+
+    Attributes:
+        name: Dotted name, e.g. ``os.path`` or ``pathlib.Path``.
+        line: Line number of the import statement.
+    """
+
+    name: str
+    line: int
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON shape of the import."""
+        return {"name": self.name, "line": self.line}
+
+
+class PythonFunction(NamedTuple):
+    """A top-level function or a method.
+
+    Attributes:
+        name: Function name.
+        line: Line number of the ``def`` statement.
+        docstring: Docstring, if any.
+    """
+
+    name: str
+    line: int
+    docstring: str | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON shape of the function."""
+        d: dict[str, object] = {"name": self.name, "line": self.line}
+        if self.docstring:
+            d["docstring"] = self.docstring
+        return d
+
+
+class PythonClass(NamedTuple):
+    """A top-level class.
+
+    Attributes:
+        name: Class name.
+        line: Line number of the ``class`` statement.
+        docstring: Docstring, if any.
+        methods: Methods defined in the class body.
+    """
+
+    name: str
+    line: int
+    docstring: str | None = None
+    methods: tuple[PythonFunction, ...] = ()
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON shape of the class."""
+        d: dict[str, object] = {"name": self.name, "line": self.line}
+        if self.docstring:
+            d["docstring"] = self.docstring
+        if self.methods:
+            d["methods"] = [m.to_dict() for m in self.methods]
+        return d
+
+
+class PythonOutline(NamedTuple):
+    """Outline of a Python module.
+
+    Attributes:
+        docstring: Module docstring, if any.
+        imports: Imported names in source order.
+        classes: Top-level classes.
+        functions: Top-level functions.
+        truncated: Note set when only the beginning of the file was outlined.
+    """
+
+    docstring: str | None = None
+    imports: tuple[PythonImport, ...] = ()
+    classes: tuple[PythonClass, ...] = ()
+    functions: tuple[PythonFunction, ...] = ()
+    truncated: str | None = None
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON shape of the outline, leaving out empty fields."""
+        d: dict[str, object] = {}
+        if self.docstring:
+            d["docstring"] = self.docstring
+        if self.imports:
+            d["imports"] = [i.to_dict() for i in self.imports]
+        if self.classes:
+            d["classes"] = [c.to_dict() for c in self.classes]
+        if self.functions:
+            d["functions"] = [f.to_dict() for f in self.functions]
+        if self.truncated:
+            d["truncated"] = self.truncated
+        return d
+
+
+def outline_python_source(source: str) -> PythonOutline:
+    """Build the outline of Python source code.
+
+    Args:
+        source: Python source code.
+
+    Returns:
+        The module outline.
+
+    Raises:
+        SyntaxError: if the source cannot be parsed.
+    """
+    tree = ast.parse(source)
+    imports: list[PythonImport] = []
+    classes: list[PythonClass] = []
+    functions: list[PythonFunction] = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for n in node.names:
+                imports.append(PythonImport(n.name, node.lineno))
+        elif isinstance(node, ast.ImportFrom):
+            mod = node.module or ""
+            for n in node.names:
+                import_name = f"{mod}.{n.name}" if mod else n.name
+                imports.append(PythonImport(import_name, node.lineno))
+        elif isinstance(node, ast.ClassDef):
+            methods = tuple(
+                PythonFunction(item.name, item.lineno, ast.get_docstring(item))
+                for item in node.body
+                if isinstance(item, ast.FunctionDef)
+            )
+            classes.append(
+                PythonClass(node.name, node.lineno, ast.get_docstring(node), methods)
+            )
+        elif isinstance(node, ast.FunctionDef):
+            functions.append(
+                PythonFunction(node.name, node.lineno, ast.get_docstring(node))
+            )
+    return PythonOutline(
+        ast.get_docstring(tree), tuple(imports), tuple(classes), tuple(functions)
+    )
+
+
+def _statement_starts(data: bytes, end: int) -> Iterator[int]:
+    """Yield offsets of lines that may start a top-level statement, backwards.
+
+    Args:
+        data: Python source as bytes.
+        end: Offset to search back from.
+    """
+    while True:
+        end = data.rfind(b"\n", 0, end)
+        if end == -1:
+            return
+        if data[end + 1 : end + 2] not in _NOT_STATEMENT_START:
+            yield end + 1
+
+
+def _outline_prefix(data: bytes, size: int) -> PythonOutline:
+    """Outline the longest parsable prefix of a truncated Python file.
+
+    The data is cut before one of the last top-level statements, so the
+    statement that straddles the limit is dropped.
+
+    Args:
+        data: The first bytes of the file.
+        size: Full size of the file in bytes.
+
+    Returns:
+        Outline with a truncated note.
+
+    Raises:
+        SkippedFile: if no prefix could be parsed.
+    """
+    starts = itertools.islice(_statement_starts(data, len(data)), MAX_CUT_ATTEMPTS)
+    for end in starts:
+        try:
+            outline = outline_python_source(data[:end].decode("utf-8"))
+        except SyntaxError:
+            # The cut fell inside a multi-line string or bracket.
+            continue
+        return outline._replace(truncated=truncation_note(end, size))
+    raise SkippedFile(
+        f"File of {size:,} bytes is over the {len(data):,} byte limit "
+        "and its beginning could not be parsed."
+    )
+
+
+def outline_python_file(path: str) -> PythonOutline:
+    """Read and outline a Python file.
+
+    Files larger than ``max_file_bytes`` are outlined up to the last
+    top-level statement before the limit.
+
+    Args:
+        path: Path to the Python file.
+
+    Returns:
+        The module outline, with a truncated note for partial outlines.
+
+    Raises:
+        SkippedFile: if the file is binary or not UTF-8 text.
+    """
+    with open_buffer(path, max_file_bytes()) as buf:
+        data = buf.data[:]
+        if buf.truncated:
+            return _outline_prefix(data, buf.size)
+    return outline_python_source(data.decode("utf-8"))
+
+
+def _decode_outline(data: list) -> PythonOutline:
+    """Rebuild an outline from its JSON form in the project index."""
+    docstring, imports, classes, functions, truncated = data
+    return PythonOutline(
+        docstring,
+        tuple(PythonImport(*i) for i in imports),
+        tuple(
+            PythonClass(name, line, doc, tuple(PythonFunction(*m) for m in methods))
+            for name, line, doc, methods in classes
+        ),
+        tuple(PythonFunction(*f) for f in functions),
+        truncated,
+    )
+
+
+# Outlines of recently parsed files, which depend on the read limit.
+python_outline_cache: FileCache[PythonOutline] = FileCache(
+    "python_outline", decode=_decode_outline, variant=read_limit_variant
+)
+
+
+def get_python_outline(path: str, st: os.stat_result | None = None) -> PythonOutline:
+    """Return the outline of a Python file, using the outline cache.
+
+    Args:
+        path: Path to the Python file.
+        st: Fresh ``stat`` result of the path, if already known.
+
+    Returns:
+        The module outline.
+    """
+    return python_outline_cache.get_or_compute(path, outline_python_file, st)
@@ -0,0 +1,110 @@
+"""Size-capped reading of text files for the outline tools.
+
+Files are opened as bytes-like buffers: small files are read into memory,
+large ones are memory-mapped, so scanning them does not copy them. At most
+``max_file_bytes`` (a server setting) of a file are exposed; the outline
+tools outline that prefix and mark the result as truncated. The first block
+is checked before anything else, so binary files and files that are not
+UTF-8 text are skipped without being read.
+"""
+
+import codecs
+import mmap
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+from ..config.settings import get_settings
+
+# Files at least this large are scanned through a read-only mmap instead of
+# being copied into memory.
+MMAP_THRESHOLD = 1024 * 1024
+
+# Size of the first block checked for binary or undecodable content.
+SNIFF_BYTES = 8192
+
+
+class SkippedFile(Exception):
+    """Raised when a file is not outlined, e.g. because it is binary."""
+
+
+class FileBuffer(NamedTuple):
+    """The readable part of a file.
+
+    Attributes:
+        data: Contents as ``bytes`` or a read-only ``mmap``, at most the
+            configured number of bytes.
+        size: Full size of the file in bytes.
+    """
+
+    data: bytes | mmap.mmap
+    size: int
+
+    @property
+    def truncated(self) -> bool:
+        """Whether data stops before the end of the file."""
+        return len(self.data) < self.size
+
+
+def max_file_bytes() -> int | None:
+    """Return the number of bytes of a file the outline tools read, if limited."""
+    return get_settings().max_file_bytes or None
+
+
+def read_limit_variant() -> str:
+    """Describe the read limit, as the variant of caches of outlines."""
+    limit = max_file_bytes()
+    return "" if limit is None else f"max_file_bytes={limit}"
+
+
+def truncation_note(outlined: int, size: int) -> str:
+    """Describe a partial outline of a file.
+
+    Args:
+        outlined: Number of bytes outlined.
+        size: Full size of the file in bytes.
+    """
+    return f"Only the first {outlined:,} of {size:,} bytes were outlined."
+
+
+def _sniff(data: bytes | mmap.mmap) -> None:
+    """Raise ``SkippedFile`` if the first block is not UTF-8 text."""
+    block = data[:SNIFF_BYTES]
+    if b"\0" in block:
+        raise SkippedFile("Binary file (contains NUL bytes).")
+    try:
+        # A multi-byte character cut at the end of the block is not an error.
+        codecs.getincrementaldecoder("utf-8")().decode(
+            block, final=len(block) == len(data)
+        )
+    except UnicodeDecodeError as e:
+        raise SkippedFile(f"Not UTF-8 text ({e.reason} at byte {e.start}).") from e
+
+
+@contextmanager
+def open_buffer(path: str | Path, max_bytes: int | None) -> Iterator[FileBuffer]:
+    """Open the first max_bytes of a text file as a bytes-like buffer.
+
+    Args:
+        path: Path to the file.
+        max_bytes: Maximum number of bytes exposed, or None for the whole file.
+
+    Yields:
+        The readable part of the file; ``mmap`` buffers are closed on exit.
+
+    Raises:
+        SkippedFile: if the file looks binary or is not UTF-8 text.
+    """
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        length = size if max_bytes is None else min(size, max(max_bytes, 0))
+        if length < MMAP_THRESHOLD:
+            f.seek(0)
+            data = f.read(length)
+            _sniff(data)
+            yield FileBuffer(data, size)
+            return
+        with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ) as mm:
+            _sniff(mm)
+            yield FileBuffer(mm, size)
@@ -0,0 +1,214 @@
+"""Background warm-up of the caches at server start.
+
+``main.run`` starts a warm-up when the ``warmup_roots`` or ``warmup_specs``
+settings are set. It loads the normalized model, the operation list and the
+schema catalog of the specs, then walks the roots
+(honoring the same ignore rules as the tools) and fills the directory
+listing, Python outline and Markdown heading caches, so the first calls of a
+session are served from memory or from the project index. The work runs in
+its own small pool of low-priority threads and pauses while tool calls are
+running, so it never delays them. Its state is reported by the
+``warmup_status`` tool.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from loguru import logger
+
+from .filesystem import iter_files, list_directory
+from .general import is_valid_path
+from .markdown import get_markdown_headings
+from .openapi import get_openapi_model, get_openapi_operations
+from .openapi_schemas import get_schema_catalog
+from .overview import MARKDOWN_SUFFIXES, PYTHON_SUFFIXES
+from .progress import CallCancelled, Progress, active_calls
+from .python import get_python_outline
+from .reader import SkippedFile
+
+# Niceness added to warm-up threads on Linux, where it applies per thread.
+WARMUP_NICE = 10
+
+# Seconds between checks whether running tool calls have finished.
+IDLE_POLL = 0.05
+
+
+def _lower_priority() -> None:
+    """Lower the scheduling priority of the calling thread, where supported."""
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), WARMUP_NICE)
+    except OSError as e:
+        logger.debug("Cannot lower warm-up thread priority", error=str(e))
+
+
+class Warmup:
+    """Pre-indexing of configured roots and specs in background threads."""
+
+    def __init__(self, roots: list[str], specs: list[str], workers: int = 2):
+        """Create a warm-up; ``start`` runs it.
+
+        Args:
+            roots: Absolute paths of directories to index.
+            specs: Absolute paths of OpenAPI specs to index.
+            workers: Number of threads indexing files.
+        """
+        self.roots = roots
+        self.specs = specs
+        self.workers = max(workers, 1)
+        self.state = "pending"
+        self.errors = 0
+        self.progress = Progress()
+        self._started: float | None = None
+        self._finished: float | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Run the warm-up in a daemon thread."""
+        threading.Thread(
+            target=self._run, name="project-explorer-warmup", daemon=True
+        ).start()
+
+    def cancel(self) -> None:
+        """Stop the warm-up after the files being indexed."""
+        self.progress.cancel()
+
+    def _run(self) -> None:
+        """Discover and index everything, recording the final state."""
+        self._started = time.monotonic()
+        self.state = "running"
+        logger.info("Warm-up started", roots=self.roots, specs=self.specs)
+        try:
+            _lower_priority()
+            tasks = self._discover()
+            self.progress.total = len(tasks)
+            with ThreadPoolExecutor(
+                self.workers,
+                thread_name_prefix="project-explorer-warmup",
+                initializer=_lower_priority,
+            ) as pool:
+                for _ in pool.map(self._warm, tasks):
+                    pass
+            self.state = "ready"
+        except CallCancelled:
+            self.state = "cancelled"
+        except Exception as e:
+            logger.error("Warm-up failed", error=str(e))
+            self.state = "failed"
+        self._finished = time.monotonic()
+        status = self.status()
+        logger.info(
+            "Warm-up finished",
+            state=status["state"],
+            done=status["done"],
+            errors=status["errors"],
+            elapsed_s=status["elapsed_s"],
+        )
+
+    def _discover(self) -> list[tuple[Callable[[str], Any], str]]:
+        """List the (function, path) lookups that fill the caches."""
+        tasks: list[tuple[Callable[[str], Any], str]] = []
+        # Specs first: parsing them is the slowest cold lookup. Large JSON
+        # specs are listed without loading the model, which the detail and
+        # schema tools need, so it is loaded as well; the catalog reuses it.
+        for spec in self.specs:
+            valid, msg = is_valid_path(spec)
+            if valid:
+                tasks.extend(
+                    (fn, spec)
+                    for fn in (
+                        get_openapi_model,
+                        get_openapi_operations,
+                        get_schema_catalog,
+                    )
+                )
+            else:
+                logger.warning("Skipping warm-up spec", path=spec, error=msg)
+        files: list[tuple[Callable[[str], Any], str]] = []
+        for root in self.roots:
+            valid, msg = is_valid_path(root)
+            if not valid:
+                logger.warning("Skipping warm-up root", path=root, error=msg)
+                continue
+            directories = {root}
+            for _, entry in iter_files(root):
+                self.progress.check()
+                directories.add(os.path.dirname(entry.path))
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix in PYTHON_SUFFIXES:
+                    files.append((get_python_outline, entry.path))
+                elif suffix in MARKDOWN_SUFFIXES:
+                    files.append((get_markdown_headings, entry.path))
+            tasks.extend((list_directory, d) for d in sorted(directories))
+        return tasks + files
+
+    def _warm(self, task: tuple[Callable[[str], Any], str]) -> None:
+        """Fill the cache of one lookup once no tool call is running."""
+        fn, path = task
+        while active_calls():
+            self.progress.check()
+            time.sleep(IDLE_POLL)
+        self.progress.check()
+        try:
+            fn(path)
+        except SkippedFile:
+            pass
+        except Exception as e:
+            logger.debug("Warm-up lookup failed", path=path, error=str(e))
+            with self._lock:
+                self.errors += 1
+        self.progress.advance()
+
+    def status(self) -> dict[str, Any]:
+        """Return the state, counters and elapsed time of the warm-up."""
+        done, total, _ = self.progress.state()
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished or time.monotonic()) - self._started
+        return {
+            "state": self.state,
+            "done": done,
+            "total": total,
+            "errors": self.errors,
+            "elapsed_s": round(elapsed, 3),
+            "roots": self.roots,
+            "specs": self.specs,
+        }
+
+
+_warmup: Warmup | None = None
+
+
+def start_warmup(roots: list[str], specs: list[str], workers: int = 2) -> Warmup:
+    """Start warming up the caches in the background.
+
+    A warm-up still running from an earlier call is cancelled.
+
+    Args:
+        roots: Absolute paths of directories to index.
+        specs: Absolute paths of OpenAPI specs to index.
+        workers: Number of threads indexing files.
+
+    Returns:
+        The started warm-up.
+    """
+    global _warmup
+    if _warmup is not None:
+        _warmup.cancel()
+    _warmup = Warmup(roots, specs, workers)
+    _warmup.start()
+    return _warmup
+
+
+def get_warmup_status() -> dict[str, Any]:
+    """Return the status of the current warm-up, or state "disabled"."""
+    if _warmup is None:
+        return {"state": "disabled"}
+    return _warmup.status()
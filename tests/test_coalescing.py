@@ -0,0 +1,89 @@
+"""Tests for coalescing of concurrent identical lookups."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from project_explorer_mcp.utils import SingleFlight
+from project_explorer_mcp.utils.cache import FileCache
+
+
+def test_concurrent_misses_compute_once(tmp_path):
+    """Test that callers missing the same file share one computation."""
+    path = tmp_path / "f.txt"
+    path.write_text("abc")
+    cache: FileCache[int] = FileCache("test_coalesced_cache")
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute(p: str) -> int:
+        calls.append(p)
+        started.set()
+        release.wait(5)
+        return len(p)
+
+    with ThreadPoolExecutor(4) as pool:
+        first = pool.submit(cache.get_or_compute, str(path), compute)
+        started.wait(5)
+        others = [
+            pool.submit(cache.get_or_compute, str(path), compute) for _ in range(3)
+        ]
+        # Let the other callers reach the computation in flight.
+        time.sleep(0.1)
+        release.set()
+        results = [first.result()] + [f.result() for f in others]
+
+    assert calls == [str(path)]
+    assert results == [len(str(path))] * 4
+    assert cache.stats()["shared"] == 3
+    assert cache.stats()["misses"] == 1
+
+
+def test_single_flight_shares_exceptions():
+    """Test that waiting callers get the exception of the computation."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail() -> int:
+        started.set()
+        release.wait(5)
+        raise ValueError("broken")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "k", fail)
+        started.wait(5)
+        follower = pool.submit(flight.do, "k", lambda: 1)
+        time.sleep(0.1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="broken"):
+                future.result()
+    assert flight.do("k", lambda: 1) == (1, False)
+
+
+def test_single_flight_recomputes_after_cancellation():
+    """Test that waiting callers compute again when the first one is cancelled."""
+    from project_explorer_mcp.utils import CallCancelled
+
+    flight: SingleFlight[str, int] = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def cancelled() -> int:
+        started.set()
+        release.wait(5)
+        raise CallCancelled
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "k", cancelled)
+        started.wait(5)
+        follower = pool.submit(flight.do, "k", lambda: 1)
+        time.sleep(0.1)
+        release.set()
+        with pytest.raises(CallCancelled):
+            leader.result()
+        assert follower.result() == (1, False)
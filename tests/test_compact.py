@@ -0,0 +1,112 @@
+"""Tests for the compact output format."""
+
+import asyncio
+import json
+
+from fastmcp import FastMCP
+
+from project_explorer_mcp.tools import (
+    register_dir_tree,
+    register_markdown_outline,
+    register_openapi_list_operations,
+)
+from project_explorer_mcp.utils import compact, to_table
+
+
+def _tool(register, name):
+    mcp = FastMCP("test")
+    register(mcp)
+    fn = asyncio.run(mcp.get_tool(name)).fn
+    return lambda **kwargs: asyncio.run(fn(**kwargs))
+
+
+def test_to_table_unions_columns():
+    """Test that tables keep key order and fill missing cells with None."""
+    table = to_table([{"name": "a", "line": 1}, {"name": "b", "docstring": "B"}])
+    assert table == {
+        "columns": ["name", "line", "docstring"],
+        "rows": [["a", 1, None], ["b", None, "B"]],
+    }
+    assert to_table([], ("level", "text")) == {"columns": ["level", "text"], "rows": []}
+
+
+def test_compact_nested_lists():
+    """Test that nested lists of objects become tables and others keep shape."""
+    data = {
+        "classes": [{"name": "A", "methods": [{"name": "run", "line": 3}]}],
+        "tags": ["x", "y"],
+        "empty": [],
+    }
+    assert compact(data) == {
+        "classes": {
+            "columns": ["name", "methods"],
+            "rows": [["A", {"columns": ["name", "line"], "rows": [["run", 3]]}]],
+        },
+        "tags": ["x", "y"],
+        "empty": [],
+    }
+
+
+def test_dir_tree_compact(tmp_path):
+    """Test that compact trees list each directory's children once."""
+    (tmp_path / "b.txt").touch()
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "mod.py").touch()
+    (tmp_path / "empty").mkdir()
+
+    result = _tool(register_dir_tree, "dir_tree")(
+        root_path=str(tmp_path), max_depth=5, output_format="compact"
+    )
+    assert result == {
+        "root": str(tmp_path),
+        "dirs": {
+            "": ["b.txt", "empty/", "src/"],
+            "src/": ["pkg/"],
+            "src/pkg/": ["mod.py"],
+        },
+    }
+
+
+def test_markdown_outline_compact(tmp_path):
+    """Test heading tables, the omitted count and errors in compact output."""
+    doc = tmp_path / "doc.md"
+    doc.write_text("# A\n\n## B\n\n## C\n")
+    missing = str(tmp_path / "missing.md")
+    tool = _tool(register_markdown_outline, "markdown_outline")
+
+    result = tool(paths=[str(doc)], max_headings_per_file=2, output_format="compact")
+    assert result == {
+        str(doc): {
+            "columns": ["level", "text", "line"],
+            "rows": [[1, "A", 1], [2, "B", 3]],
+            "omitted": 1,
+        }
+    }
+    result = tool(paths=[missing], output_format="compact")
+    assert "error" in result[missing]
+
+
+def test_openapi_list_operations_compact(tmp_path):
+    """Test that compact operation listings are smaller than JSON."""
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "Demo", "version": "1"},
+        "paths": {
+            f"/items/{i}": {
+                "get": {"operationId": f"getItem{i}", "summary": "Get", "tags": ["a"]}
+            }
+            for i in range(20)
+        },
+    }
+    spec_path = tmp_path / "openapi.json"
+    spec_path.write_text(json.dumps(spec))
+    tool = _tool(register_openapi_list_operations, "openapi_list_operations")
+
+    full = tool(spec_path=str(spec_path), output_format="json")
+    small = tool(spec_path=str(spec_path), output_format="compact")
+    table = small["operations"]
+    assert small["count"] == full["count"] == 20
+    assert [dict(zip(table["columns"], row)) for row in table["rows"]] == (
+        full["operations"]
+    )
+    assert len(json.dumps(small)) < len(json.dumps(full)) * 0.7
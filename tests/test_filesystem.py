@@ -0,0 +1,46 @@
+"""Tests for filesystem traversal utilities."""
+
+from project_explorer_mcp.utils import glob_to_regex, walk_files
+
+
+def test_glob_to_regex():
+    """Test glob translation with recursive wildcards."""
+    assert glob_to_regex("*.md").fullmatch("README.md")
+    assert not glob_to_regex("*.md").fullmatch("docs/index.md")
+    assert glob_to_regex("**/*.md").fullmatch("README.md")
+    assert glob_to_regex("**/*.md").fullmatch("docs/api/index.md")
+    assert glob_to_regex("docs/**").fullmatch("docs/api/index.md")
+    assert glob_to_regex("page[0-9].md").fullmatch("page1.md")
+    assert not glob_to_regex("page[!0-9].md").fullmatch("page1.md")
+
+
+def test_walk_files_honors_ignore_rules(tmp_path):
+    """Test that ignored directories and .gitignore patterns are skipped."""
+    for rel in (
+        "README.md",
+        "docs/index.md",
+        "docs/api/ref.md",
+        "docs/build/out.md",
+        "docs/draft.md",
+        "node_modules/pkg/README.md",
+        "site/index.md",
+        "notes.txt",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("# Title\n")
+    (tmp_path / ".gitignore").write_text("/site/\nbuild/\n*.txt\n")
+    (tmp_path / "docs" / ".gitignore").write_text("draft.md\n")
+
+    found = walk_files(str(tmp_path), ["**/*.md", "**/*.txt"])
+    assert [p[len(str(tmp_path)) + 1 :] for p in found] == [
+        "README.md",
+        "docs/api/ref.md",
+        "docs/index.md",
+    ]
+
+    found = walk_files(str(tmp_path), ["docs/*.md"], use_gitignore=False)
+    assert [p[len(str(tmp_path)) + 1 :] for p in found] == [
+        "docs/draft.md",
+        "docs/index.md",
+    ]
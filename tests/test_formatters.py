@@ -0,0 +1,151 @@
+"""Tests for markdown formatters and the output budget."""
+
+import io
+import json
+
+from project_explorer_mcp.utils import (
+    LineWriter,
+    OutputBudget,
+    dumps_json,
+    format_markdown_outline_as_markdown,
+    format_python_outline_as_markdown,
+    join_lines,
+)
+from project_explorer_mcp.utils.openapi import format_openapi_details_markdown
+
+PYTHON_OUTLINE = {
+    "/src/module.py": {
+        "docstring": "Module summary.\n\nLong explanation that is dropped.",
+        "imports": [{"name": f"mod{i}", "line": i} for i in range(1, 31)],
+        "functions": [
+            {"name": "run", "line": 40, "docstring": "Run it.\n\nDetails."},
+        ],
+    }
+}
+
+
+def test_unlimited_budget_keeps_full_output():
+    """Test that formatters render everything without a budget."""
+    text = format_python_outline_as_markdown(PYTHON_OUTLINE)
+    assert "Long explanation that is dropped." in text
+    assert "- `mod30` (line 30)" in text
+    assert text == format_python_outline_as_markdown(PYTHON_OUTLINE, OutputBudget())
+
+
+def test_budget_shortens_texts_and_collapses_lists():
+    """Test docstring shortening and list collapsing under a budget."""
+    budget = OutputBudget(max_chars=10_000, max_items=10)
+    text = format_python_outline_as_markdown(PYTHON_OUTLINE, budget)
+    assert "Module summary." in text
+    assert "Long explanation" not in text
+    assert "- `mod10` (line 10)" in text
+    assert "- `mod11`" not in text
+    assert "- *... 20 more imports*" in text
+    assert "Details." not in text
+    assert not budget.truncated
+
+
+def test_budget_stops_rendering_lazily():
+    """Test that rendering stops at the budget without consuming all lines."""
+    consumed = []
+
+    def lines():
+        for i in range(1000):
+            consumed.append(i)
+            yield f"line {i}"
+
+    budget = OutputBudget(max_chars=200)
+    text = budget.render(lines())
+    assert budget.truncated
+    assert len(text) <= 200
+    assert text.endswith("*[Output truncated at 200 characters]*")
+    assert len(consumed) < 30
+
+
+def test_markdown_outline_budget_counts_capped_headings():
+    """Test that per-file caps and budget collapsing add up."""
+    headings = [{"level": 2, "text": f"H{i}", "line": i} for i in range(5)]
+    data = {"/doc.md": headings + [{"omitted": 7}]}
+    text = format_markdown_outline_as_markdown(
+        data, OutputBudget(max_chars=10_000, max_items=3)
+    )
+    assert "H2 (line 2)" in text
+    assert "H3" not in text
+    assert "- *... 9 more headings*" in text
+
+
+def test_openapi_details_budget():
+    """Test that operation descriptions are shortened under a budget."""
+    records = [
+        {
+            "method": "GET",
+            "path": "/users",
+            "operation_id": "listUsers",
+            "summary": "List users",
+            "description": "First line.\nSecond line.",
+            "parameters": [],
+            "responses": {"200": {"description": "OK", "content": {}}},
+        }
+    ]
+    full = format_openapi_details_markdown(records)
+    assert "Second line." in full
+    short = format_openapi_details_markdown(records, OutputBudget(max_chars=5_000))
+    assert "First line." in short
+    assert "Second line." not in short
+
+
+def test_line_writer_matches_stripped_join():
+    """Test that streamed output equals joining and stripping the lines."""
+    cases = [
+        [],
+        ["", "  "],
+        ["", "  # Title\n", "", "body  ", "", "---\n"],
+        ["a", "", "", "b\n\n", "  "],
+    ]
+    for lines in cases:
+        out = io.StringIO()
+        writer = LineWriter(out)
+        for line in lines:
+            writer.write_line(line)
+        assert out.getvalue() == "\n".join(lines).strip()
+        assert join_lines(iter(lines)) == "\n".join(lines)
+
+
+def test_budget_render_stops_generator():
+    """Test that rendering under a budget stops consuming lines."""
+    consumed = []
+
+    def lines():
+        for i in range(1_000):
+            consumed.append(i)
+            yield f"line {i}"
+
+    budget = OutputBudget(max_chars=200)
+    text = budget.render(lines())
+    assert budget.truncated
+    assert len(text) <= 200
+    assert text.endswith("*[Output truncated at 200 characters]*")
+    assert len(consumed) < 50
+
+
+def test_budget_smaller_than_note():
+    """Test that a tiny budget is not exceeded by the truncation note."""
+    for max_chars in (0, 1, 10, 39, 40):
+        budget = OutputBudget(max_chars=max_chars)
+        text = budget.render(f"line {i}" for i in range(10))
+        assert budget.truncated
+        assert len(text) <= max_chars
+        assert (
+            text.strip()
+            == f"*[Output truncated at {max_chars} characters]*"[:max_chars]
+        )
+
+
+def test_dumps_json_is_compact():
+    """Test that tool results are serialized as compact JSON."""
+    data = {"path": "/a.md", "headings": [{"level": 1, "text": "Ünïcode"}]}
+    text = dumps_json(data)
+    assert json.loads(text) == data
+    assert "\n" not in text
+    # Unsupported values fall back to str(), like FastMCP's own serializer.
+    assert json.loads(dumps_json({"x": object()}))["x"].startswith("<object")
@@ -0,0 +1,69 @@
+"""Tests for the persistent SQLite project index."""
+
+import os
+
+import pytest
+
+from project_explorer_mcp.config import reload_settings
+from project_explorer_mcp.utils import ProjectIndex, get_index, list_directory
+from project_explorer_mcp.utils.filesystem import listing_cache
+from project_explorer_mcp.utils.markdown import get_markdown_headings, headings_cache
+from project_explorer_mcp.utils.openapi import get_openapi_operations, operations_cache
+from project_explorer_mcp.utils.python import get_python_outline, python_outline_cache
+
+CACHES = (python_outline_cache, headings_cache, operations_cache, listing_cache)
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    """Enable the project index in a temporary file, with empty caches."""
+    path = tmp_path / "index" / "project.sqlite"
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__INDEX_PATH", str(path))
+    reload_settings()
+    for cache in CACHES:
+        cache.clear()
+    yield path
+    monkeypatch.undo()
+    reload_settings()
+    for cache in CACHES:
+        cache.clear()
+
+
+def test_index_is_shared_and_keyed_by_signature(tmp_path, index_path):
+    """Test that a second connection reads values until the file changes."""
+    path = tmp_path / "a.py"
+    path.write_text("x = 1\n")
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    get_index().put("kind", str(path), signature, [("a", 1)])
+
+    # Another process opening the same database sees the value.
+    other = ProjectIndex(str(index_path))
+    assert other.get("kind", str(path), signature) == [["a", 1]]
+    assert other.get("kind", str(path), (st.st_mtime_ns, st.st_size + 1)) is None
+    assert other.count() == {"kind": 1}
+    assert other._connect().execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_values_are_read_back_from_the_index(tmp_path, index_path):
+    """Test that every persistent cache rebuilds equal values from the index."""
+    (tmp_path / "m.py").write_text(
+        '"""Doc."""\nimport os\n\n\nclass A:\n    def f(self):\n        pass\n'
+    )
+    (tmp_path / "d.md").write_text("# Title\n\n## Part\n")
+    (tmp_path / "s.json").write_text(
+        '{"openapi": "3.0.0", "paths": {"/a": {"get": {"tags": ["t"]}}}}'
+    )
+    lookups = (
+        (get_python_outline, str(tmp_path / "m.py")),
+        (get_markdown_headings, str(tmp_path / "d.md")),
+        (get_openapi_operations, str(tmp_path / "s.json")),
+        (list_directory, str(tmp_path)),
+    )
+    computed = [lookup(path) for lookup, path in lookups]
+    # A fresh process has empty in-memory caches.
+    for cache in CACHES:
+        cache.clear()
+    assert [lookup(path) for lookup, path in lookups] == computed
+    assert [cache.stats()["index_hits"] for cache in CACHES] == [1, 1, 1, 1]
+    assert [cache.stats()["misses"] for cache in CACHES] == [0, 0, 0, 0]
@@ -4,7 +4,13 @@ import os
 import tempfile
 from pathlib import Path
 
-from project_explorer_mcp.utils import is_valid_path, strip_empty
+from project_explorer_mcp.utils import (
+    is_valid_path,
+    iter_openapi_operations,
+    outline_python_source,
+    strip_empty,
+    validate_paths,
+)
 
 
 def test_is_valid_path():
@@ -30,6 +36,67 @@ def test_is_valid_path():
     assert "URL-encoding" in msg
 
 
+def test_validate_paths_reports_all_invalid(tmp_path):
+    """Test batch validation with stat results and every error."""
+    files = []
+    for i in range(100):
+        path = tmp_path / f"f{i}.py"
+        path.write_text("x" * i)
+        files.append(str(path))
+    missing = str(tmp_path / "missing.py")
+    stats, errors = validate_paths(files + ["relative.py", missing, files[0]])
+    assert list(stats) == files
+    assert stats[files[5]].st_size == 5
+    assert list(errors) == ["relative.py", missing]
+    assert "not absolute" in errors["relative.py"]
+    assert "does not exist" in errors[missing]
+
+
+def test_python_outline_partial_success(tmp_path):
+    """Test that invalid paths get errors without discarding other files."""
+    import asyncio
+
+    from fastmcp import FastMCP
+
+    from project_explorer_mcp.tools.python_outline import register_python_outline
+
+    mcp = FastMCP("test")
+    register_python_outline(mcp)
+    tool = asyncio.run(mcp.get_tool("python_outline"))
+    valid = tmp_path / "a.py"
+    valid.write_text("import os\n")
+    missing = str(tmp_path / "c.py")
+    result = asyncio.run(
+        tool.fn(paths=[str(valid), "b.py", missing], output_format="json")
+    )
+    assert list(result) == [str(valid), "b.py", missing]
+    assert result[str(valid)]["imports"][0]["name"] == "os"
+    assert "not absolute" in result["b.py"]["error"]
+    assert "does not exist" in result[missing]["error"]
+
+
+def test_map_within_marks_unfinished_items_pending():
+    """Test that items not finished by the deadline are reported as pending."""
+    import threading
+
+    from project_explorer_mcp.utils import PENDING, format_python_outline_as_markdown
+    from project_explorer_mcp.utils.concurrency import map_within
+
+    release = threading.Event()
+
+    def work(item: int) -> int:
+        if item == 2:
+            release.wait(5)
+        return item * 10
+
+    try:
+        assert map_within(work, [1, 2, 3], timeout=0.5) == [10, PENDING, 30]
+    finally:
+        release.set()
+    assert map_within(work, [1, 2], timeout=None) == [10, 20]
+    assert "Pending" in format_python_outline_as_markdown({"/a.py": {"pending": True}})
+
+
 def test_strip_empty():
     """Test stripping empty values from dictionaries."""
     # Test dictionary with empty values
@@ -62,6 +129,37 @@ def test_strip_empty():
     assert result == [1, "value"]
 
 
+def test_outline_records_serialize_to_json_shape():
+    """Test that outline and operation records keep the tools' JSON shape."""
+    outline = outline_python_source(
+        '"""Doc."""\nimport os\n\n\nclass A:\n    def f(self):\n'
+        '        """F."""\n\n\ndef g():\n    """"""\n'
+    )
+    assert not hasattr(outline, "__dict__")
+    assert outline.to_dict() == {
+        "docstring": "Doc.",
+        "imports": [{"name": "os", "line": 2}],
+        "classes": [
+            {
+                "name": "A",
+                "line": 5,
+                "methods": [{"name": "f", "line": 6, "docstring": "F."}],
+            }
+        ],
+        "functions": [{"name": "g", "line": 10}],
+    }
+    spec = {"paths": {"/a": {"get": {"description": "Read a.\nMore."}}}}
+    assert [op.to_dict() for op in iter_openapi_operations(spec)] == [
+        {
+            "method": "GET",
+            "path": "/a",
+            "operation_id": None,
+            "summary": "Read a.",
+            "tags": [],
+        }
+    ]
+
+
 def test_dir_tree_integration():
     """Test directory tree tool with temporary directory."""
     from fastmcp import FastMCP
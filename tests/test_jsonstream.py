@@ -0,0 +1,82 @@
+"""Tests for incremental reading of JSON specs."""
+
+import io
+import json
+
+import pytest
+
+from project_explorer_mcp.utils import (
+    JSONStream,
+    get_openapi_operations,
+    iter_openapi_operations,
+    openapi,
+    scan_openapi_operations,
+)
+from project_explorer_mcp.utils.openapi import operations_cache, spec_cache
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Zürich API", "version": "1.0"},
+    "paths": {
+        "/a": {
+            "parameters": [{"name": "id", "in": "path"}],
+            "get": {"operationId": "getA", "summary": "Read ä.", "tags": ["t"]},
+            "post": {"description": "Create a.\nMore.", "responses": {"201": {}}},
+        },
+        "/b.json": {"delete": {"operationId": "deleteB", "x-limit": 123456789}},
+    },
+    "components": {"schemas": {"A": {"type": "object"}}},
+}
+
+
+def test_stream_reads_values_across_window_boundaries():
+    """Test that values split between reads are decoded whole."""
+    data = json.dumps({"n": 1234567, "s": "äöü" * 5, "l": [1.5, None]}).encode()
+    stream = JSONStream(io.BytesIO(data), chunk_bytes=3)
+    assert {key: stream.value() for key in stream.members()} == json.loads(data)
+    assert stream.peek() == ""
+
+    stream = JSONStream(io.BytesIO(b'{"a": 1 "b": 2}'), chunk_bytes=4)
+    with pytest.raises(ValueError, match="Expected ','"):
+        for _ in stream.members():
+            stream.skip()
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_scan_lists_the_same_operations(tmp_path, indent):
+    """Test that scanning a JSON spec matches listing the loaded spec."""
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(SPEC, indent=indent), encoding="utf-8")
+    assert scan_openapi_operations(str(path)) == list(iter_openapi_operations(SPEC))
+
+
+def test_large_specs_are_listed_without_loading(tmp_path, monkeypatch):
+    """Test that listing scans large JSON specs and falls back for YAML."""
+    monkeypatch.setattr(openapi, "SCAN_MIN_BYTES", 0)
+    for cache in (operations_cache, spec_cache):
+        cache.clear()
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps(SPEC), encoding="utf-8")
+    # YAML in flow style also starts with "{".
+    flow = tmp_path / "flow.yaml"
+    flow.write_text("{openapi: 3.0.0, paths: {/a: {get: {operationId: getA}}}}")
+
+    assert len(get_openapi_operations(str(spec))) == 3
+    assert [op.operation_id for op in get_openapi_operations(str(flow))] == ["getA"]
+    # Only the YAML spec had to be loaded.
+    assert spec_cache.stats()["misses"] == 1
+
+
+def test_scan_reports_progress_and_stops_when_cancelled(tmp_path):
+    """Test that scanning advances per path item and honors cancellation."""
+    from project_explorer_mcp.utils import CallCancelled, Progress
+
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(SPEC))
+    progress = Progress()
+    scan_openapi_operations(str(path), progress)
+    assert progress.done == len(SPEC["paths"])
+
+    progress.cancel()
+    with pytest.raises(CallCancelled):
+        scan_openapi_operations(str(path), progress)
@@ -0,0 +1,94 @@
+"""Tests for the concurrency limits of tool calls."""
+
+import asyncio
+
+from fastmcp import Client, Context, FastMCP
+
+from project_explorer_mcp.utils import ConcurrencyLimitMiddleware
+
+
+def test_calls_are_limited_per_client_session():
+    """Test that a busy session waits for itself without blocking others."""
+    middleware = ConcurrencyLimitMiddleware(per_client=1)
+    mcp = FastMCP("test")
+    mcp.add_middleware(middleware)
+    running: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+    overlap = 0
+
+    @mcp.tool()
+    async def slow(ctx: Context) -> str:
+        nonlocal overlap
+        session = ctx.session_id
+        running[session] = running.get(session, 0) + 1
+        peaks[session] = max(peaks.get(session, 0), running[session])
+        overlap = max(overlap, sum(running.values()))
+        await asyncio.sleep(0.05)
+        running[session] -= 1
+        return session
+
+    async def main() -> None:
+        async with Client(mcp) as busy, Client(mcp) as other:
+            results = await asyncio.gather(
+                *(busy.call_tool("slow", {}) for _ in range(3)),
+                other.call_tool("slow", {}),
+            )
+        sessions = [result.data for result in results]
+        assert len(set(sessions[:3])) == 1 and sessions[3] != sessions[0]
+
+    asyncio.run(main())
+    assert set(peaks.values()) == {1}
+    assert overlap == 2
+    assert middleware.sessions() == {}
+
+
+def test_pool_is_shared_fairly_between_calls():
+    """Test that a call over many items does not queue ahead of others."""
+    import threading
+    import time
+
+    from project_explorer_mcp.utils import map_ordered
+
+    finished: dict[str, float] = {}
+
+    def work(item: int) -> int:
+        time.sleep(0.01)
+        return item
+
+    def heavy() -> None:
+        assert list(map_ordered(work, range(200))) == list(range(200))
+        finished["heavy"] = time.monotonic()
+
+    thread = threading.Thread(target=heavy)
+    thread.start()
+    time.sleep(0.02)
+    assert list(map_ordered(work, range(4))) == list(range(4))
+    finished["light"] = time.monotonic()
+    thread.join()
+    assert finished["light"] < finished["heavy"] - 0.05
+
+
+def test_batch_moves_to_resized_pool(monkeypatch):
+    """Test that items submitted after a reload run in the new pool."""
+    import threading
+
+    from project_explorer_mcp.config import get_settings, reload_settings
+    from project_explorer_mcp.utils import map_ordered
+    from project_explorer_mcp.utils.concurrency import get_executor
+
+    workers = get_settings().max_workers + 1
+    threads: dict[int, threading.Thread] = {}
+
+    def work(item: int) -> int:
+        if item == 0:
+            monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_WORKERS", str(workers))
+            reload_settings()
+        threads[item] = threading.current_thread()
+        return item
+
+    try:
+        assert list(map_ordered(work, range(100))) == list(range(100))
+        assert threads[99] in get_executor()._threads
+    finally:
+        monkeypatch.undo()
+        reload_settings()
@@ -0,0 +1,57 @@
+"""Tests for logging modes."""
+
+import sys
+
+import pytest
+from loguru import logger
+
+from project_explorer_mcp.config import logging as logging_config
+from project_explorer_mcp.config import (
+    debug_enabled,
+    reload_settings,
+    setup_logging,
+    summarize,
+)
+
+
+@pytest.fixture
+def configure(monkeypatch):
+    """Configure logging from environment settings, restoring it afterwards."""
+    # monkeypatch restores the module flags set by setup_logging.
+    monkeypatch.setattr(logging_config, "_debug_enabled", True)
+    monkeypatch.setattr(logging_config, "_summarize_args", False)
+
+    def apply(mode: str, level: str) -> None:
+        monkeypatch.setenv("PROJECT_EXPLORER_MCP__LOGGING_MODE", mode)
+        monkeypatch.setenv("PROJECT_EXPLORER_MCP__LOGGING_LEVEL", level)
+        reload_settings()
+        setup_logging()
+
+    yield apply
+    monkeypatch.undo()
+    reload_settings()
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+def test_production_mode_summarizes_arguments(configure):
+    """Test that production mode logs collection sizes and skips debug."""
+    configure("production", "INFO")
+    assert summarize(["/a.py", "/b.py"]) == 2
+    assert summarize("/a.py") == "/a.py"
+    assert not debug_enabled()
+
+
+def test_development_mode_keeps_arguments(configure):
+    """Test that development mode logs arguments in full."""
+    configure("development", "DEBUG")
+    assert summarize(["/a.py", "/b.py"]) == ["/a.py", "/b.py"]
+    assert debug_enabled()
+
+
+def test_numeric_and_lowercase_levels(configure):
+    """Test that levels may be given as severity numbers or in lowercase."""
+    configure("production", "5")
+    assert debug_enabled()
+    configure("production", "warning")
+    assert not debug_enabled()
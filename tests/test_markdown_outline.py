@@ -0,0 +1,190 @@
+"""Tests for the Markdown heading scanner."""
+
+import os
+
+import pytest
+
+from project_explorer_mcp.utils import (
+    get_markdown_headings,
+    outline_markdown_file,
+    read_markdown_section,
+    scan_markdown_headings,
+)
+
+
+def _outline(text: str) -> list[tuple[int, str, int]]:
+    return [(h.level, h.text, h.line) for h in scan_markdown_headings(text.encode())]
+
+
+def test_sample_file_outline():
+    """Test the sample Markdown fixture."""
+    path = os.path.join(os.path.dirname(__file__), "test_sample.md")
+    headings = outline_markdown_file(path)
+    assert [(h.level, h.text, h.line) for h in headings] == [
+        (1, "Heading 1", 1),
+        (2, "Heading 2", 3),
+        (3, "Heading 3", 5),
+        (2, "Second H2", 9),
+    ]
+
+
+def test_fenced_code_is_ignored():
+    """Test that comment lines inside code fences are not headings."""
+    text = (
+        "# Title\n"
+        "```bash\n"
+        "# install the package\n"
+        "pip install foo\n"
+        "```\n"
+        "~~~~\n"
+        "# still code\n"
+        "~~~\n"
+        "# still code after a shorter fence\n"
+        "~~~~~\n"
+        "## After\n"
+    )
+    assert _outline(text) == [(1, "Title", 1), (2, "After", 11)]
+
+
+def test_unclosed_fence_runs_to_end():
+    """Test that an unclosed fence swallows the rest of the document."""
+    assert _outline("# A\n```\n# not a heading\n") == [(1, "A", 1)]
+
+
+def test_setext_headings():
+    """Test setext headings and the lines that must not become one."""
+    text = "Title\n=====\n\nSection\n-------\n\n- list item\n---\n\n---\n"
+    assert _outline(text) == [(1, "Title", 1), (2, "Section", 4)]
+
+
+def test_setext_heading_spanning_lines():
+    """Test that a setext underline takes the whole paragraph above it."""
+    text = "# Top\npara one\n  para two\n---\n\n    code\nnext\n===\n"
+    assert _outline(text) == [
+        (1, "Top", 1),
+        (2, "para one para two", 2),
+        (1, "next", 7),
+    ]
+    headings = scan_markdown_headings(text.encode())
+    assert headings[1].offset == len("# Top\n")
+    assert _outline("- item\nlazy\n---\n") == []
+
+
+def test_atx_edge_cases():
+    """Test ATX closing sequences, missing spaces and level limits."""
+    text = (
+        "# Closed #\n"
+        "#hashtag\n"
+        "####### seven\n"
+        "    # indented code\n"
+        "   ### Indented ###   \n"
+        "## C#\n"
+        "#\n"
+    )
+    assert _outline(text) == [(1, "Closed", 1), (3, "Indented", 5), (2, "C#", 6)]
+
+
+def test_front_matter_and_crlf():
+    """Test that front matter is skipped and CRLF line endings are handled."""
+    text = "---\r\ntitle: Doc\r\n---\r\n# Heading\r\nText\r\n---\r\n"
+    assert _outline(text) == [(1, "Heading", 4), (2, "Text", 5)]
+
+
+def test_heading_offsets():
+    """Test that offsets point at the start of the heading line."""
+    data = b"intro\n\n## Part\nbody\nPart 2\n======\n"
+    for heading in scan_markdown_headings(data):
+        first_line = data[heading.offset :].split(b"\n", 1)[0]
+        assert heading.text.split()[0].encode() in first_line
+
+
+def test_read_markdown_section(tmp_path):
+    """Test reading a section by heading text and by line."""
+    path = tmp_path / "doc.md"
+    path.write_text(
+        "# Guide\n\nIntro.\n\n## Install\n\nRun it.\n\n### Extras\n\nMore.\n\n"
+        "## Usage\n\nUse it.\n\n## Install\n\nAgain.\n"
+    )
+
+    section = read_markdown_section(str(path), heading="install")
+    assert section.heading.line == 5
+    assert section.content == "## Install\n\nRun it.\n\n### Extras\n\nMore.\n\n"
+    assert not section.truncated
+
+    section = read_markdown_section(str(path), line=17)
+    assert section.content == "## Install\n\nAgain.\n"
+
+    section = read_markdown_section(str(path), heading="Usage", max_bytes=8)
+    assert section.content == "## Usage"
+    assert section.truncated
+    assert section.size == len("## Usage\n\nUse it.\n\n")
+
+    with pytest.raises(ValueError):
+        read_markdown_section(str(path), heading="Missing")
+
+
+def test_read_markdown_section_past_outline_limit(tmp_path, monkeypatch):
+    """Test that sections stop at the outlined part of a large file."""
+    from project_explorer_mcp.config import reload_settings
+
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_FILE_BYTES", "1000")
+    reload_settings()
+    try:
+        path = tmp_path / "big.md"
+        path.write_text("# Top\n" + "x" * 5000 + "\n# Later\nbody\n")
+
+        section = read_markdown_section(str(path), heading="Top")
+        assert section.content == "# Top\n" + "x" * 994
+        assert section.size == path.stat().st_size
+        assert section.truncated
+
+        with pytest.raises(ValueError, match="first 1,000 bytes"):
+            read_markdown_section(str(path), heading="Later")
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+
+
+def test_headings_cache_invalidation(tmp_path):
+    """Test that an edited file is rescanned."""
+    path = tmp_path / "doc.md"
+    path.write_text("# One\n")
+    assert [h.text for h in get_markdown_headings(str(path))] == ["One"]
+    path.write_text("# One\n## Two\n")
+    assert [h.text for h in get_markdown_headings(str(path))] == ["One", "Two"]
+
+
+def test_markdown_outline_tool_with_root(tmp_path):
+    """Test outlining a directory with glob patterns and a heading cap."""
+    import asyncio
+
+    from fastmcp import FastMCP
+
+    from project_explorer_mcp.tools.markdown_outline import register_markdown_outline
+
+    (tmp_path / "b.md").write_text("# B\n## B1\n## B2\n")
+    (tmp_path / "a.md").write_text("# A\n")
+    (tmp_path / "notes.txt").write_text("# Not markdown\n")
+
+    mcp = FastMCP("test")
+    register_markdown_outline(mcp)
+    tool = asyncio.run(mcp.get_tool("markdown_outline"))
+
+    result = asyncio.run(
+        tool.fn(root=str(tmp_path), max_headings_per_file=2, output_format="json")
+    )
+    assert list(result) == [str(tmp_path / "a.md"), str(tmp_path / "b.md")]
+    assert result[str(tmp_path / "b.md")] == [
+        {"level": 1, "text": "B", "line": 1},
+        {"level": 2, "text": "B1", "line": 2},
+        {"omitted": 1},
+    ]
+
+    # A file given in paths, here through a symlinked directory, is
+    # outlined once.
+    (tmp_path / "link").symlink_to(tmp_path, target_is_directory=True)
+    given = str(tmp_path / "link" / "a.md")
+    result = asyncio.run(
+        tool.fn(paths=[given], root=str(tmp_path), output_format="json")
+    )
+    assert list(result) == [given, str(tmp_path / "b.md")]
@@ -0,0 +1,65 @@
+"""Tests for tool call metrics and the server_stats tool."""
+
+import asyncio
+import json
+
+from fastmcp import Client, FastMCP
+
+from project_explorer_mcp.tools import register_dir_tree, register_server_stats
+from project_explorer_mcp.utils import MetricsMiddleware, MetricsRegistry, dump_metrics
+from project_explorer_mcp.utils.cache import FileCache
+
+
+def test_registry_percentiles():
+    """Test counters and nearest-rank latency percentiles."""
+    registry = MetricsRegistry()
+    for ms in range(1, 101):
+        registry.record("tool", ms / 1000, output_bytes=10, error=ms % 10 == 0)
+    stats = registry.snapshot()["tools"]["tool"]
+    assert stats["calls"] == 100
+    assert stats["errors"] == 10
+    assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]) == (50, 95, 99)
+    assert stats["output_bytes"] == 1000
+    assert stats["max_output_bytes"] == 10
+
+
+def test_middleware_records_tool_calls(tmp_path):
+    """Test that calls through the server are measured, including errors."""
+    registry = MetricsRegistry()
+    mcp = FastMCP("test")
+    mcp.add_middleware(MetricsMiddleware(registry))
+    register_dir_tree(mcp)
+    (tmp_path / "a.txt").touch()
+
+    async def call():
+        async with Client(mcp) as client:
+            await client.call_tool("dir_tree", {"root_path": str(tmp_path)})
+            await client.call_tool("dir_tree", {"root_path": "relative/path"})
+
+    asyncio.run(call())
+    stats = registry.snapshot()["tools"]["dir_tree"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["max_output_bytes"] > 0
+
+    dump_metrics(str(tmp_path / "metrics.json"), registry)
+    dumped = json.loads((tmp_path / "metrics.json").read_text())
+    assert dumped["tools"]["dir_tree"]["calls"] == 2
+
+
+def test_server_stats_reports_cache_hit_ratio(tmp_path):
+    """Test that server_stats includes file cache statistics."""
+    path = tmp_path / "f.txt"
+    path.write_text("x")
+    cache: FileCache[int] = FileCache("test_stats_cache")
+    for _ in range(4):
+        cache.get_or_compute(str(path), len)
+
+    mcp = FastMCP("test")
+    register_server_stats(mcp)
+    tool = asyncio.run(mcp.get_tool("server_stats"))
+    caches = {c["name"]: c for c in tool.fn(output_format="json")["caches"]}
+    assert caches["test_stats_cache"]["hit_ratio"] == 0.75
+    assert "| test_stats_cache | 1 | 3 | 0 | 0 | 1 | 75.0% |" in tool.fn(
+        output_format="markdown"
+    )
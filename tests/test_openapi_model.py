@@ -0,0 +1,185 @@
+"""Tests for the normalized OpenAPI model."""
+
+from project_explorer_mcp.utils import (
+    get_openapi_operation_details,
+    normalize_openapi,
+)
+from project_explorer_mcp.utils.openapi_model import normalize_schema
+
+SWAGGER = {
+    "swagger": "2.0",
+    "info": {"title": "Pets", "version": 2},
+    "consumes": ["application/json"],
+    "produces": ["application/json", "application/xml"],
+    "parameters": {
+        "Limit": {"name": "limit", "in": "query", "type": "integer", "default": 10}
+    },
+    "paths": {
+        "/pets": {
+            "parameters": [
+                {"$ref": "#/parameters/Limit"},
+                {"name": "trace", "in": "header", "type": "string"},
+            ],
+            "get": {
+                "operationId": "listPets",
+                "parameters": [
+                    {"name": "trace", "in": "header", "type": "boolean"},
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Pets",
+                        "schema": {
+                            "type": "array",
+                            "items": {"$ref": "#/definitions/Pet"},
+                        },
+                    }
+                },
+            },
+            "post": {
+                "parameters": [
+                    {
+                        "name": "pet",
+                        "in": "body",
+                        "required": True,
+                        "schema": {"$ref": "#/definitions/Pet"},
+                    }
+                ],
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+        "/pets/{id}/photo": {
+            "put": {
+                "consumes": ["multipart/form-data"],
+                "parameters": [
+                    {"name": "id", "in": "path", "required": True, "type": "string"},
+                    {
+                        "name": "file",
+                        "in": "formData",
+                        "required": True,
+                        "type": "file",
+                    },
+                ],
+                "responses": {"204": {"description": "Stored"}},
+            }
+        },
+    },
+    "definitions": {
+        "Pet": {
+            "type": "object",
+            "properties": {"name": {"type": "string", "x-nullable": True}},
+        }
+    },
+}
+
+OPENAPI_31 = {
+    "openapi": "3.1.0",
+    "paths": {
+        "/nodes/{id}": {
+            "get": {
+                "summary": "Get a node",
+                "responses": {"200": {"$ref": "#/components/responses/Node"}},
+            }
+        }
+    },
+    "components": {
+        "responses": {
+            "Node": {
+                "description": "A node",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/Node"}
+                    }
+                },
+            }
+        },
+        "schemas": {
+            "Node": {
+                "type": ["object", "null"],
+                "properties": {"id": {"type": "string"}, "label": {}},
+            }
+        },
+    },
+}
+
+
+def test_swagger_is_normalized():
+    """Test Swagger 2.0 bodies, media types, parameters and references."""
+    model = normalize_openapi(SWAGGER)
+    assert (model.version, model.title, model.api_version) == ("2.0", "Pets", "2")
+    listing, create, upload = model.operations
+
+    # Path-level parameters are inherited; the operation overrides "trace".
+    assert [(p.name, p.location, p.schema) for p in listing.parameters] == [
+        ("limit", "query", {"type": "integer", "default": 10}),
+        ("trace", "header", {"type": "boolean"}),
+    ]
+    response = listing.responses["200"]
+    assert list(response["content"]) == ["application/json", "application/xml"]
+    assert response["content"]["application/json"]["items"] == {
+        "$ref": "#/components/schemas/Pet"
+    }
+
+    assert [p.name for p in create.parameters] == ["limit", "trace"]
+    assert create.request_body["content"] == {
+        "application/json": {"$ref": "#/components/schemas/Pet"}
+    }
+    assert create.responses["201"] == {"description": "Created", "content": {}}
+
+    form = upload.request_body["content"]["multipart/form-data"]
+    assert form == {
+        "type": "object",
+        "properties": {"file": {"type": "file"}},
+        "required": ["file"],
+    }
+    assert model.schemas["Pet"]["properties"]["name"] == {
+        "type": "string",
+        "nullable": True,
+    }
+    assert model.schema_pointers["Pet"] == "#/definitions/Pet"
+    assert model.operations_by_id["listPets"] is listing
+
+
+def test_operation_details_use_model():
+    """Test selectors and schema summaries over normalized specs."""
+    model = normalize_openapi(SWAGGER)
+    (record,) = get_openapi_operation_details(model, ["POST /pets"])
+    assert record["operation_id"] is None
+    assert record["requestBody"]["content"]["application/json"] == {
+        "type": "object",
+        "properties": {"name": {"type": "string", "nullable": True}},
+    }
+    records = get_openapi_operation_details(model, ["/pets", "listPets", "GET /x"])
+    assert [(r["method"], r["path"]) for r in records] == [
+        ("GET", "/pets"),
+        ("POST", "/pets"),
+        ("GET", "/pets"),
+    ]
+
+    model = normalize_openapi(OPENAPI_31)
+    (record,) = get_openapi_operation_details(model, ["get /nodes/{id}"])
+    assert record["summary"] == "Get a node"
+    content = record["responses"]["200"]["content"]["application/json"]
+    assert content == {
+        "type": "object",
+        "nullable": True,
+        "properties": {"id": {"type": "string"}, "label": {"type": None}},
+    }
+
+
+def test_schema_values_are_kept():
+    """Test that only subschemas are normalized, not example or enum values."""
+    value = {"type": ["a", "null"], "x-nullable": True, "$ref": "#/definitions/X"}
+    schema = {
+        "type": "object",
+        "example": value,
+        "default": value,
+        "enum": [value],
+        "x-sample": value,
+        "properties": {"default": {"type": ["string", "null"]}},
+        "anyOf": [{"$ref": "#/definitions/X"}],
+    }
+    assert normalize_schema(schema) == {
+        **schema,
+        "properties": {"default": {"type": "string", "nullable": True}},
+        "anyOf": [{"$ref": "#/components/schemas/X"}],
+    }
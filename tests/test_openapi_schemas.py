@@ -0,0 +1,138 @@
+"""Tests for the OpenAPI schema catalog and its tools."""
+
+import asyncio
+import json
+
+from fastmcp import FastMCP
+
+from project_explorer_mcp.tools.openapi_get_schema import register_openapi_get_schema
+from project_explorer_mcp.tools.openapi_list_schemas import (
+    register_openapi_list_schemas,
+)
+from project_explorer_mcp.utils import build_schema_catalog, normalize_openapi
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/users/{id}": {
+            "parameters": [{"$ref": "#/components/parameters/Tenant"}],
+            "get": {"responses": {"200": {"$ref": "#/components/responses/User"}}},
+        },
+        "/nodes": {
+            "post": {
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Node"}
+                        }
+                    }
+                },
+                "responses": {"204": {"description": "Created."}},
+            }
+        },
+    },
+    "components": {
+        "parameters": {
+            "Tenant": {
+                "name": "tenant",
+                "in": "header",
+                "schema": {"$ref": "#/components/schemas/TenantId"},
+            }
+        },
+        "responses": {
+            "User": {
+                "description": "A user.",
+                "content": {
+                    "application/json": {
+                        "schema": {"$ref": "#/components/schemas/User"}
+                    }
+                },
+            }
+        },
+        "schemas": {
+            "TenantId": {"type": "string"},
+            "User": {
+                "description": "A user.\nWith details.",
+                "allOf": [
+                    {"$ref": "#/components/schemas/Base"},
+                    {"properties": {"name": {"type": "string"}}},
+                ],
+            },
+            "Base": {"type": "object", "properties": {"id": {}, "created": {}}},
+            "Node": {
+                "type": ["object", "null"],
+                "properties": {
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Node"},
+                    }
+                },
+            },
+        },
+    },
+}
+
+
+def test_catalog_indexes_references_and_cycles():
+    """Test counts, reverse references, operation usage and cycle flags."""
+    catalog = build_schema_catalog(normalize_openapi(SPEC))
+    assert list(catalog) == ["TenantId", "User", "Base", "Node"]
+    user = catalog["User"]
+    assert (user.type, user.description, user.property_count) == (
+        "allOf",
+        "A user.",
+        1,
+    )
+    assert user.references == ["Base"]
+    assert catalog["Base"].referenced_by == ["User"]
+    # Through the shared response and path-level parameter components.
+    assert user.operations == ["GET /users/{id}"]
+    assert catalog["TenantId"].operations == ["GET /users/{id}"]
+    assert catalog["Node"].operations == ["POST /nodes"]
+    assert catalog["Node"].type == "object | null"
+    assert [name for name, e in catalog.items() if e.cyclic] == ["Node"]
+
+    swagger = {
+        "swagger": "2.0",
+        "definitions": {
+            "A": {"properties": {"b": {"$ref": "#/definitions/B"}}},
+            "B": {"properties": {"a": {"$ref": "#/definitions/A"}}},
+        },
+    }
+    catalog = build_schema_catalog(normalize_openapi(swagger))
+    assert catalog["A"].pointer == "#/definitions/A"
+    assert catalog["A"].cyclic and catalog["B"].cyclic
+
+
+def test_schema_tools(tmp_path):
+    """Test listing and reading schemas through the tools."""
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(SPEC))
+    mcp = FastMCP("test")
+    register_openapi_list_schemas(mcp)
+    register_openapi_get_schema(mcp)
+    list_schemas = asyncio.run(mcp.get_tool("openapi_list_schemas")).fn
+    get_schema = asyncio.run(mcp.get_tool("openapi_get_schema")).fn
+
+    result = asyncio.run(
+        list_schemas(spec_path=str(path), filter_by_name="S", output_format="json")
+    )
+    assert [s["name"] for s in result["schemas"]] == ["User", "Base"]
+    assert result["schemas"][1]["referenced_by_count"] == 1
+    cyclic = asyncio.run(
+        list_schemas(spec_path=str(path), cyclic_only=True, output_format="markdown")
+    )
+    assert "| Node | object \\| null | 1 | 1 | 1 | 1 | Yes | - |" in cyclic
+
+    result = asyncio.run(
+        get_schema(spec_path=str(path), names=["Base", "Nope"], output_format="json")
+    )
+    assert result["count"] == 1
+    base, missing = result["schemas"]
+    assert base["schema"] == SPEC["components"]["schemas"]["Base"]
+    assert base["referenced_by"] == ["User"]
+    assert missing == {"name": "Nope", "error": "Schema not found"}
+    markdown = asyncio.run(
+        get_schema(spec_path=str(path), names=["User"], output_format="markdown")
+    )
+    assert "**Used by operations:** GET /users/{id}" in markdown
@@ -0,0 +1,49 @@
+"""Tests for per-call profiling of tool invocations."""
+
+import asyncio
+import pstats
+import tracemalloc
+
+from fastmcp import Client, FastMCP
+
+from project_explorer_mcp.tools import register_dir_tree
+from project_explorer_mcp.utils import ProfilingMiddleware
+
+
+def _server(tmp_path, **kwargs) -> FastMCP:
+    mcp = FastMCP("test")
+    mcp.add_middleware(ProfilingMiddleware(str(tmp_path / "profiles"), **kwargs))
+    register_dir_tree(mcp)
+    return mcp
+
+
+def test_profile_requested_per_call(tmp_path):
+    """Test that only calls asking for it in _meta are profiled."""
+    mcp = _server(tmp_path)
+
+    async def call():
+        async with Client(mcp) as client:
+            await client.call_tool("dir_tree", {"root_path": str(tmp_path)})
+            assert not (tmp_path / "profiles").exists()
+            await client.call_tool(
+                "dir_tree", {"root_path": str(tmp_path)}, meta={"profile": True}
+            )
+
+    asyncio.run(call())
+    (profile,) = (tmp_path / "profiles").glob("dir_tree-*.prof")
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_profile_all_calls_with_memory(tmp_path):
+    """Test profiling every call with tracemalloc snapshots."""
+    mcp = _server(tmp_path, all_calls=True, memory=True)
+
+    async def call():
+        async with Client(mcp) as client:
+            await client.call_tool("dir_tree", {"root_path": str(tmp_path)})
+
+    asyncio.run(call())
+    assert len(list((tmp_path / "profiles").glob("dir_tree-*.prof"))) == 1
+    (snapshot,) = (tmp_path / "profiles").glob("dir_tree-*.snapshot")
+    assert tracemalloc.Snapshot.load(str(snapshot)).traces is not None
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,90 @@
+"""Tests for progress reporting and cancellation of tool calls."""
+
+import asyncio
+import threading
+import time
+
+from fastmcp import Client, FastMCP
+
+from project_explorer_mcp.tools import register_dir_tree
+from project_explorer_mcp.utils import CallCancelled, Progress, run_with_progress
+
+
+def test_dir_tree_reports_progress(tmp_path):
+    """Test that progress notifications count the listed directories."""
+    for i in range(5):
+        (tmp_path / f"dir{i}" / "sub").mkdir(parents=True)
+    mcp = FastMCP("test")
+    register_dir_tree(mcp)
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append(progress)
+
+    async def call():
+        async with Client(mcp) as client:
+            await client.call_tool(
+                "dir_tree",
+                {"root_path": str(tmp_path), "max_depth": 2},
+                progress_handler=on_progress,
+            )
+
+    asyncio.run(call())
+    # The root, five directories and their subdirectories.
+    assert updates[-1] == 11
+
+
+def test_cancelled_call_stops_worker():
+    """Test that a cancelled call returns at once and its worker stops."""
+    stopped = threading.Event()
+
+    def work(progress: Progress) -> None:
+        try:
+            while True:
+                progress.advance()
+                time.sleep(0.01)
+        except CallCancelled:
+            stopped.set()
+
+    async def call():
+        await asyncio.wait_for(run_with_progress(None, work), timeout=0.1)
+
+    start = time.perf_counter()
+    try:
+        asyncio.run(call())
+    except asyncio.TimeoutError:
+        pass
+    assert time.perf_counter() - start < 1
+    assert stopped.wait(1)
+
+
+def test_operation_details_progress_stays_within_total(tmp_path):
+    """Test that loading a cold spec keeps progress within the total."""
+    import json
+
+    from project_explorer_mcp.tools import register_openapi_get_operation_details
+
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {f"/items/{i}": {"get": {"responses": {}}} for i in range(50)},
+    }
+    path = tmp_path / "spec.json"
+    path.write_text(json.dumps(spec))
+    mcp = FastMCP("test")
+    register_openapi_get_operation_details(mcp)
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append((progress, total))
+
+    async def call():
+        async with Client(mcp) as client:
+            await client.call_tool(
+                "openapi_get_operation_details",
+                {"spec_path": str(path), "selectors": ["GET /items/1"]},
+                progress_handler=on_progress,
+            )
+
+    asyncio.run(call())
+    assert updates[-1] == (51, 51)
+    assert all(total is None or done <= total for done, total in updates)
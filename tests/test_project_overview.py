@@ -0,0 +1,63 @@
+"""Tests for the project overview utilities."""
+
+import json
+
+from project_explorer_mcp.utils import (
+    build_project_overview,
+    format_project_overview_as_markdown,
+)
+
+
+def test_build_project_overview(tmp_path):
+    """Test classification, ranking, sniffing and budgeting in one walk."""
+    files = {
+        "README.md": "# Demo\n\n## Usage\n",
+        "pkg/__init__.py": '"""Demo package."""\n',
+        "pkg/core.py": "class Engine:\n    pass\n\n\ndef run():\n    pass\n",
+        "pkg/sub/deep.py": "def helper():\n    pass\n",
+        "tests/test_core.py": "def test_run():\n    pass\n",
+        "api/openapi.json": json.dumps(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Demo API", "version": "1.0"},
+                "paths": {"/items": {"get": {"summary": "List"}}},
+            }
+        ),
+        "package.json": '{"name": "demo"}',
+        "broken.py": "def (:\n",
+    }
+    for rel, content in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    overview = build_project_overview(str(tmp_path), max_files_per_type=3)
+
+    assert overview["files"] == {"python": 5, "markdown": 1, "openapi": 1, "other": 1}
+    assert [e["path"] for e in overview["python"]] == [
+        "broken.py",
+        "pkg/__init__.py",
+        "pkg/core.py",
+    ]
+    assert "error" in overview["python"][0]
+    assert overview["python"][2] == {
+        "path": "pkg/core.py",
+        "classes": ["Engine"],
+        "functions": ["run"],
+    }
+    assert overview["omitted"] == {"python": 2}
+    assert overview["markdown"] == [
+        {"path": "README.md", "headings": ["Demo", "Usage"]}
+    ]
+    assert overview["openapi"] == [
+        {
+            "path": "api/openapi.json",
+            "title": "Demo API",
+            "version": "1.0",
+            "operations": 1,
+        }
+    ]
+
+    markdown = format_project_overview_as_markdown(overview)
+    assert "- `api/openapi.json` — Demo API v1.0 (1 operations)" in markdown
+    assert "*... 2 more files*" in markdown
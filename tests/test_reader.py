@@ -0,0 +1,86 @@
+"""Tests for size-capped reading of files by the outline tools."""
+
+import asyncio
+
+import pytest
+from fastmcp import FastMCP
+
+from project_explorer_mcp.config import reload_settings
+from project_explorer_mcp.tools import register_markdown_outline
+from project_explorer_mcp.utils import (
+    SkippedFile,
+    open_buffer,
+    outline_markdown_file,
+    outline_python_file,
+)
+from project_explorer_mcp.utils.reader import MMAP_THRESHOLD
+
+
+@pytest.fixture
+def max_file_bytes(monkeypatch):
+    """Set the max_file_bytes setting, restoring it afterwards."""
+
+    def apply(value: int) -> None:
+        monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_FILE_BYTES", str(value))
+        reload_settings()
+
+    yield apply
+    monkeypatch.undo()
+    reload_settings()
+
+
+def test_binary_and_non_utf8_files_are_skipped(tmp_path):
+    """Test that the first block decides whether a file is text."""
+    binary = tmp_path / "data.py"
+    binary.write_bytes(b"import os\n\0\0\0")
+    latin1 = tmp_path / "notes.md"
+    latin1.write_bytes("# Caf\xe9\n".encode("latin-1"))
+    with pytest.raises(SkippedFile, match="Binary"):
+        outline_python_file(str(binary))
+    with pytest.raises(SkippedFile, match="UTF-8"):
+        outline_markdown_file(str(latin1))
+
+
+def test_large_files_are_memory_mapped(tmp_path):
+    """Test that the buffer is capped and large prefixes are mapped."""
+    path = tmp_path / "big.md"
+    path.write_bytes(b"# Title\n" + b"x" * (2 * MMAP_THRESHOLD))
+    with open_buffer(path, MMAP_THRESHOLD + 1) as buf:
+        assert not isinstance(buf.data, bytes)
+        assert len(buf.data) == MMAP_THRESHOLD + 1
+        assert buf.truncated
+    with open_buffer(path, 100) as buf:
+        assert buf.data == b"# Title\n" + b"x" * 92
+
+
+def test_python_outline_of_oversized_file(tmp_path, max_file_bytes):
+    """Test that an oversized module is outlined up to the last statement."""
+    path = tmp_path / "big.py"
+    path.write_text(
+        "import os\n\n\ndef first():\n    return 1\n\n\n"
+        'TEXT = """\ndef fake():\n"""\n\n\ndef second():\n    return 2\n'
+    )
+    # The limit cuts into second(); the cut before "def fake" is skipped
+    # because it falls inside the string.
+    max_file_bytes(path.stat().st_size - 5)
+    outline = outline_python_file(str(path))
+    assert [f.name for f in outline.functions] == ["first"]
+    assert outline.truncated.startswith("Only the first 69 of")
+
+
+def test_markdown_outline_marks_truncated_files(tmp_path, max_file_bytes):
+    """Test that the tool outlines the prefix and adds a truncated note."""
+    path = tmp_path / "big.md"
+    path.write_text("# One\n\ntext\n\n# Two\n\ntext\n")
+    max_file_bytes(10)
+    mcp = FastMCP("test")
+    register_markdown_outline(mcp)
+    tool = asyncio.run(mcp.get_tool("markdown_outline")).fn
+    result = asyncio.run(tool(paths=[str(path)], output_format="json"))
+    assert result[str(path)] == [
+        {"level": 1, "text": "One", "line": 1},
+        {"truncated": "Only the first 10 of 25 bytes were outlined."},
+    ]
+    compact = asyncio.run(tool(paths=[str(path)], output_format="compact"))
+    assert compact[str(path)]["rows"] == [[1, "One", 1]]
+    assert "truncated" in compact[str(path)]
@@ -0,0 +1,126 @@
+"""Tests for settings caching, reload and tool selection."""
+
+from project_explorer_mcp.config import get_settings, reload_settings
+from project_explorer_mcp.config.settings import OutputFormat, Settings
+from project_explorer_mcp.tools import TOOL_MODULES, get_register_function
+
+
+def test_settings_are_cached_until_reload(monkeypatch):
+    """Test that settings are read once and re-read on reload."""
+    settings = get_settings()
+    assert get_settings() is settings
+
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__DEFAULT_OUTPUT_FORMAT", "compact")
+    assert get_settings() is settings
+    try:
+        reloaded = reload_settings()
+        assert reloaded is not settings
+        assert reloaded.default_output_format is OutputFormat.COMPACT
+        assert get_settings() is reloaded
+    finally:
+        monkeypatch.undo()
+        reload_settings()
+
+
+def test_tool_enable_and_disable_lists(monkeypatch):
+    """Test that tool lists are read from comma-separated settings."""
+    monkeypatch.setenv(
+        "PROJECT_EXPLORER_MCP__ENABLED_TOOLS", "dir_tree, python_outline"
+    )
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__DISABLED_TOOLS", "python_outline")
+    settings = Settings()
+    assert settings.enabled_tools == ["dir_tree", "python_outline"]
+    assert settings.is_tool_enabled("dir_tree")
+    assert not settings.is_tool_enabled("python_outline")
+    assert not settings.is_tool_enabled("markdown_outline")
+
+    monkeypatch.delenv("PROJECT_EXPLORER_MCP__ENABLED_TOOLS")
+    assert Settings().is_tool_enabled("markdown_outline")
+
+
+def test_tool_modules_are_imported_on_demand():
+    """Test that every configured tool module provides its register function."""
+    for name in TOOL_MODULES:
+        assert get_register_function(name).__name__ == f"register_{name}"
+
+
+def test_tool_module_loads_only_its_utilities():
+    """Test that one tool module does not import the others' utilities."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, project_explorer_mcp.tools.dir_tree; "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    loaded = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    for module in (
+        "project_explorer_mcp.utils.openapi",
+        "project_explorer_mcp.utils.markdown",
+        "project_explorer_mcp.utils.python",
+        "project_explorer_mcp.utils.warmup",
+        "cProfile",
+        "tracemalloc",
+    ):
+        assert module not in loaded
+    assert "project_explorer_mcp.utils.filesystem" in loaded
+
+
+def test_reload_applies_to_caches_pool_and_limits(tmp_path, monkeypatch):
+    """Test that reloaded settings reach the caches, pool and limiters."""
+    import anyio
+
+    from project_explorer_mcp import main
+    from project_explorer_mcp.utils.concurrency import get_executor
+    from project_explorer_mcp.utils.limits import call_limiter
+    from project_explorer_mcp.utils.markdown import get_markdown_headings
+
+    path = tmp_path / "doc.md"
+    path.write_text("# One\n" + "x" * 100 + "\n# Two\n")
+    assert len(get_markdown_headings(str(path))) == 2
+    executor = get_executor()
+
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_FILE_BYTES", "50")
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_WORKERS", "3")
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_CONCURRENT_CALLS", "2")
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_CALLS_PER_CLIENT", "5")
+    monkeypatch.setenv("PROJECT_EXPLORER_MCP__METRICS_ENABLED", "false")
+    try:
+        main._reload_config()
+        # The cached outline of the whole file is not reused.
+        assert [h.text for h in get_markdown_headings(str(path))] == ["One"]
+        assert get_executor() is not executor
+        assert get_executor()._max_workers == 3
+        assert main._limit_middleware.per_client == 5
+        assert not main._metrics_middleware.enabled
+
+        async def tokens():
+            return call_limiter().total_tokens
+
+        assert anyio.run(tokens) == 2
+    finally:
+        monkeypatch.undo()
+        main._reload_config()
+
+
+def test_reload_during_pool_batch(monkeypatch):
+    """Test that replacing the worker pool does not fail running batches."""
+    from project_explorer_mcp.utils.concurrency import get_executor, map_ordered
+
+    workers = get_settings().max_workers + 1
+
+    def work(item: int) -> int:
+        if item == 5:
+            monkeypatch.setenv("PROJECT_EXPLORER_MCP__MAX_WORKERS", str(workers))
+            reload_settings()
+            get_executor()
+        return item
+
+    try:
+        assert list(map_ordered(work, range(40))) == list(range(40))
+        assert get_executor()._max_workers == workers
+    finally:
+        monkeypatch.undo()
+        reload_settings()
@@ -0,0 +1,48 @@
+"""Tests for the background warm-up."""
+
+import asyncio
+import time
+
+from fastmcp import FastMCP
+
+from project_explorer_mcp.tools import register_warmup_status
+from project_explorer_mcp.utils import start_warmup
+from project_explorer_mcp.utils.markdown import headings_cache
+from project_explorer_mcp.utils.openapi import operations_cache, spec_cache
+from project_explorer_mcp.utils.openapi_schemas import schema_catalog_cache
+from project_explorer_mcp.utils.python import get_python_outline, python_outline_cache
+
+
+def test_warmup_fills_caches(tmp_path):
+    """Test that warm-up indexes roots and specs and reports readiness."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "a.py").write_text("def f():\n    pass\n")
+    (tmp_path / "README.md").write_text("# Title\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "b.py").write_text("x = 1\n")
+    spec = tmp_path / "openapi.json"
+    spec.write_text('{"openapi": "3.0.0", "paths": {"/a": {"get": {}}}}')
+
+    warmup = start_warmup([str(tmp_path)], [str(spec), "relative.json"])
+    deadline = time.monotonic() + 10
+    while warmup.state in ("pending", "running") and time.monotonic() < deadline:
+        time.sleep(0.01)
+    status = warmup.status()
+    # The spec's model, operations and schemas, the root and pkg listings,
+    # a.py and README.md.
+    assert (status["state"], status["done"], status["total"]) == ("ready", 7, 7)
+    assert status["errors"] == 0
+
+    hits = python_outline_cache.hits
+    get_python_outline(str(tmp_path / "pkg" / "a.py"))
+    assert python_outline_cache.hits == hits + 1
+    assert str(tmp_path / "README.md") in headings_cache._entries
+    assert str(spec) in operations_cache._entries
+    assert str(spec) in spec_cache._entries
+    assert str(spec) in schema_catalog_cache._entries
+    assert str(tmp_path / "node_modules" / "b.py") not in python_outline_cache._entries
+
+    mcp = FastMCP("test")
+    register_warmup_status(mcp)
+    tool = asyncio.run(mcp.get_tool("warmup_status"))
+    assert "**State:** ready" in tool.fn(output_format="markdown")